@@ -0,0 +1,118 @@
+"""
+Benchmark per-model cost of building Pet Store request models.
+
+Compares building models field by field with per-field random choices and
+full validation (as hand-written test data does) against the seeded columnar
+PetFactory / UserFactory.
+
+Usage:
+    python -m benchmarks.data_factories --models 10000 --repeat 5
+"""
+
+import argparse
+import json
+import random
+import time
+from collections.abc import Callable
+from core.factories import (
+    CATEGORIES,
+    FIRST_NAMES,
+    LAST_NAMES,
+    PET_NAMES,
+    PET_STATUSES,
+    TAG_NAMES,
+    PetFactory,
+    UserFactory,
+)
+from core.metrics import summarize
+from core.schemas.pet_store_pet import Category, PetStoreAddPetRequest, Tag
+from core.schemas.pet_store_user_creation import PetStoreUserCreateRequest
+
+
+def _random_pets(count: int, seed: int) -> list[PetStoreAddPetRequest]:
+    rng = random.Random(seed)
+    return [
+        PetStoreAddPetRequest(
+            name=f"{rng.choice(PET_NAMES)} {rng.randrange(1000)}",
+            category=Category(id=rng.randint(1, 6), name=rng.choice(CATEGORIES)),
+            photoUrls=[f"https://example.com/photos/{rng.getrandbits(32):08x}.jpg"],
+            tags=[
+                Tag(id=n, name=name)
+                for n, name in enumerate(rng.sample(TAG_NAMES, rng.randint(0, 3)))
+            ],
+            status=rng.choice(PET_STATUSES),
+        )
+        for _ in range(count)
+    ]
+
+
+def _random_users(count: int, seed: int) -> list[PetStoreUserCreateRequest]:
+    rng = random.Random(seed)
+    users = []
+    for _ in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        users.append(
+            PetStoreUserCreateRequest(
+                firstName=first,
+                lastName=last,
+                email=f"{first.lower()}.{last.lower()}@example.com",
+                password=f"pw-{rng.getrandbits(48):012x}",
+                phone=f"555-{rng.randrange(10**7):07d}",
+                userStatus=1,
+            )
+        )
+    return users
+
+
+def _per_model_us(build: Callable[[], list], count: int, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build()
+        samples.append((time.perf_counter() - started) / count * 1e6)
+    return summarize(samples, percentiles=(50,))
+
+
+def run(models: int, repeat: int, seed: int = 42) -> dict:
+    """
+    Run the benchmark
+
+    Args:
+        models: Models built per run
+        repeat: Runs per approach
+        seed: Data seed
+
+    Returns:
+        Per-model build time summaries in microseconds
+    """
+    return {
+        "models": models,
+        "pets": {
+            "random_validated": _per_model_us(
+                lambda: _random_pets(models, seed), models, repeat
+            ),
+            "factory": _per_model_us(
+                lambda: PetFactory(seed).build_batch(models), models, repeat
+            ),
+        },
+        "users": {
+            "random_validated": _per_model_us(
+                lambda: _random_users(models, seed), models, repeat
+            ),
+            "factory": _per_model_us(
+                lambda: UserFactory(seed).build_batch(models), models, repeat
+            ),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--models", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(run(args.models, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark the effect of GET hedging on tail latency.
+
+Runs the same sequence of get_pet_by_id calls against the local Pet Store stub
+with and without a HedgePolicy. The stub draws lognormal latencies and stalls
+a small share of requests, like the public Pet Store's heavy tail.
+
+Usage:
+    python -m benchmarks.hedging --requests 500 --hang-rate 0.03
+"""
+
+import argparse
+import json
+import time
+from core.controllers.pet_store_controller import PetStoreController
+from core.controllers.resilience import HedgePolicy
+from core.metrics import summarize
+from core.schemas.pet_store_pet import PetStoreAddPetRequest
+from core.stubs.pet_store_stub_server import Latency, PetStoreStubServer, StubConfig
+
+
+def _measure(controller: PetStoreController, pet_id: int, requests: int) -> dict:
+    samples = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        controller.get_pet_by_id(pet_id)
+        samples.append(time.perf_counter() - started)
+    return summarize(samples, percentiles=(50, 95, 99))
+
+
+def run(requests: int, median_ms: float, hang_rate: float, hang_seconds: float) -> dict:
+    """
+    Run the benchmark
+
+    Args:
+        requests: Sequential GETs per mode
+        median_ms: Median stub latency
+        hang_rate: Share of requests the stub stalls
+        hang_seconds: How long a stalled request takes
+
+    Returns:
+        Latency summaries (seconds) without and with hedging, plus hedge stats
+    """
+    config = StubConfig(
+        latency=Latency.lognormal(median_ms, 0.5),
+        hang_rate=hang_rate,
+        hang_seconds=hang_seconds,
+        seed=7,
+    )
+    with PetStoreStubServer(config) as stub:
+        plain = PetStoreController(base_url=stub.base_url)
+        pet = plain.add_pet(PetStoreAddPetRequest(name="bench", photoUrls=[]))
+        assert pet.id is not None
+
+        hedge = HedgePolicy()
+        hedged = PetStoreController(base_url=stub.base_url, hedge=hedge)
+        try:
+            return {
+                "without_hedging": _measure(plain, pet.id, requests),
+                "with_hedging": _measure(hedged, pet.id, requests),
+                "hedge_stats": hedge.stats.to_dict(),
+            }
+        finally:
+            hedge.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--median-ms", type=float, default=20)
+    parser.add_argument("--hang-rate", type=float, default=0.03)
+    parser.add_argument("--hang-seconds", type=float, default=1.0)
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            run(args.requests, args.median_ms, args.hang_rate, args.hang_seconds),
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
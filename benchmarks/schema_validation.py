@@ -0,0 +1,114 @@
+"""
+Benchmark per-response validation cost of the Pet Store response schemas.
+
+Compares the previous decode-then-validate path (response.text /
+response.json()) with BaseResponseModel validating straight from the body
+bytes, on a large single pet and on a large findByStatus array. The array
+case also times an unvalidated model_construct() pass that still builds the
+nested Category and Tag models; it is slower than validating, so skipping
+validation buys nothing once the result has the right types.
+
+Usage:
+    python -m benchmarks.schema_validation --pets 5000 --repeat 50
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from requests import Response
+from core.metrics import summarize
+from core.schemas.pet_store_pet import Category, PetStoreGetPetResponse, Tag
+
+
+def _pet(pet_id: int, tags: int) -> dict:
+    return {
+        "id": pet_id,
+        "category": {"id": 1, "name": "dogs"},
+        "name": f"pet-{pet_id}",
+        "photoUrls": [f"https://example.com/photos/{pet_id}/{i}.png" for i in range(5)],
+        "tags": [{"id": i, "name": f"tag-{i}"} for i in range(tags)],
+        "status": "available",
+    }
+
+
+def _construct(pet: dict) -> PetStoreGetPetResponse:
+    """Build a pet, with its nested models, without validating it."""
+    if pet.get("category") is not None:
+        pet["category"] = Category.model_construct(**pet["category"])
+    pet["tags"] = [Tag.model_construct(**tag) for tag in pet.get("tags") or []]
+    return PetStoreGetPetResponse.model_construct(**pet)
+
+
+def _response(payload: object) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response.encoding = "utf-8"
+    response._content = json.dumps(payload).encode()
+    return response
+
+
+def _time(func: Callable[[], object], repeat: int) -> dict[str, float]:
+    """Run func repeat times and summarize the per-call time in milliseconds."""
+    func()  # warm-up, builds lazily cached validators
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return summarize(samples, percentiles=(50, 95))
+
+
+def run(pets: int, repeat: int) -> dict:
+    """
+    Run the benchmark
+
+    Args:
+        pets: Number of pets in the array payload (the single pet gets as many tags)
+        repeat: Timed iterations per case
+
+    Returns:
+        Per-case timing summaries in milliseconds
+    """
+    single = _response(_pet(1, tags=pets))
+    array = _response([_pet(i, tags=3) for i in range(pets)])
+
+    return {
+        "payload_bytes": {"single": len(single.content), "array": len(array.content)},
+        "single_pet": {
+            "before": _time(
+                lambda: PetStoreGetPetResponse.model_validate_json(single.text), repeat
+            ),
+            "after": _time(
+                lambda: PetStoreGetPetResponse.from_response(single), repeat
+            ),
+        },
+        "pet_array": {
+            "before": _time(
+                lambda: [
+                    PetStoreGetPetResponse.model_validate(pet) for pet in array.json()
+                ],
+                repeat,
+            ),
+            "after": _time(
+                lambda: PetStoreGetPetResponse.list_from_response(array), repeat
+            ),
+            "unvalidated": _time(
+                lambda: [_construct(pet) for pet in json.loads(array.content)],
+                repeat,
+            ),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pets", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    print(json.dumps(run(args.pets, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+import asyncio
+import os
+import httpx
+from collections.abc import Iterable
+from dotenv import load_dotenv
+from pydantic import TypeAdapter
+from core.controllers.bulk import chunked
+from core.controllers.connection_pool import DEFAULT_POOL_SIZE
+from core.controllers.pet_store_controller import (
+    DEFAULT_BASE_URL,
+    DEFAULT_USER_CHUNK_SIZE,
+)
+from core.schemas.pet_store_login import PetStoreLoginRequest, PetStoreLoginResponse
+from core.schemas.pet_store_user_creation import (
+    PetStoreBatchUserCreateResponse,
+    PetStoreUserCreateRequest,
+    PetStoreUserCreateResponse,
+)
+from core.schemas.pet_store_pet import (
+    PetStoreAddPetRequest,
+    PetStoreAddPetResponse,
+    PetStoreGetPetResponse,
+    PetStoreDeletePetResponse,
+)
+
+load_dotenv()
+
+DEFAULT_MAX_CONCURRENCY = 20
+
+_USER_LIST_ADAPTER: TypeAdapter[list[PetStoreUserCreateRequest]] = TypeAdapter(
+    list[PetStoreUserCreateRequest]
+)
+
+
+class AsyncPetStoreController:
+    """
+    asyncio counterpart of PetStoreController.
+
+    Requests go through one pooled httpx.AsyncClient (HTTP/2 when the server
+    supports it) and are bounded by a semaphore, so many calls can be issued
+    concurrently from a single worker:
+
+        async with AsyncPetStoreController(max_concurrency=50) as controller:
+            pets = await asyncio.gather(
+                *(controller.get_pet_by_id(pet_id) for pet_id in pet_ids)
+            )
+    """
+
+    BASE_URL = os.getenv("PET_STORE_BASE_URL", DEFAULT_BASE_URL)
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        http2: bool = True,
+        semaphore: asyncio.Semaphore | None = None,
+        base_url: str | None = None,
+    ):
+        """
+        Initialize the async Pet Store API client
+
+        Args:
+            api_key: API key for authorization (defaults to PET_STORE_API_KEY env variable)
+            max_concurrency: Max requests in flight at once
+            pool_size: Max open connections kept in the client pool
+            http2: Negotiate HTTP/2 with the server
+            semaphore: Semaphore shared with other controllers (overrides max_concurrency)
+            base_url: API root, e.g. a local stub server (defaults to
+                PET_STORE_BASE_URL env variable or the public Pet Store)
+        """
+        self.api_key = api_key or os.environ.get("PET_STORE_API_KEY", "special-key")
+        if base_url:
+            self.BASE_URL = base_url.rstrip("/")
+        self.semaphore = semaphore or asyncio.Semaphore(max_concurrency)
+        self.client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=pool_size
+            ),
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+        )
+
+    async def __aenter__(self) -> "AsyncPetStoreController":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying connection pool."""
+        await self.client.aclose()
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request once a concurrency slot is free
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            **kwargs: Extra arguments passed to httpx.AsyncClient.request
+
+        Returns:
+            The successful httpx.Response
+        """
+        async with self.semaphore:
+            response = await self.client.request(method, url, **kwargs)
+        response.raise_for_status()
+        return response
+
+    async def login(self, login_data: PetStoreLoginRequest) -> PetStoreLoginResponse:
+        """
+        Log in to the Pet Store API
+
+        Args:
+            login_data: PetStoreLogin object containing username and password
+
+        Returns:
+            PetStoreLoginResponse containing the login session message
+        """
+        response = await self._request(
+            "GET",
+            f"{self.BASE_URL}/user/login",
+            params={"username": login_data.username, "password": login_data.password},
+        )
+        return PetStoreLoginResponse.from_response(response)
+
+    async def create_user_with_list(
+        self, user_data: PetStoreUserCreateRequest
+    ) -> PetStoreUserCreateResponse:
+        """
+        Create a new user in the Pet Store API
+
+        Args:
+            user_data: PetStoreUserCreateRequest object containing user details
+
+        Returns:
+            PetStoreUserCreateResponse with the creation result
+        """
+        response = await self._request(
+            "POST",
+            f"{self.BASE_URL}/user/createWithList",
+            content=_USER_LIST_ADAPTER.dump_json([user_data]),
+        )
+        return PetStoreUserCreateResponse.from_response(response)
+
+    async def create_users_with_list(
+        self,
+        users: Iterable[PetStoreUserCreateRequest],
+        chunk_size: int = DEFAULT_USER_CHUNK_SIZE,
+    ) -> PetStoreBatchUserCreateResponse:
+        """
+        Create many users through /user/createWithList, one request per chunk
+
+        Args:
+            users: PetStoreUserCreateRequest objects to create
+            chunk_size: Max users per request
+
+        Returns:
+            PetStoreBatchUserCreateResponse aggregated over all chunks
+        """
+        return await self._create_users_in_chunks(
+            "/user/createWithList", users, chunk_size
+        )
+
+    async def create_users_with_array(
+        self,
+        users: Iterable[PetStoreUserCreateRequest],
+        chunk_size: int = DEFAULT_USER_CHUNK_SIZE,
+    ) -> PetStoreBatchUserCreateResponse:
+        """
+        Create many users through /user/createWithArray, one request per chunk
+
+        Args:
+            users: PetStoreUserCreateRequest objects to create
+            chunk_size: Max users per request
+
+        Returns:
+            PetStoreBatchUserCreateResponse aggregated over all chunks
+        """
+        return await self._create_users_in_chunks(
+            "/user/createWithArray", users, chunk_size
+        )
+
+    async def _create_users_in_chunks(
+        self,
+        path: str,
+        users: Iterable[PetStoreUserCreateRequest],
+        chunk_size: int,
+    ) -> PetStoreBatchUserCreateResponse:
+        """
+        Send size-bounded chunks of users to a batch endpoint concurrently
+
+        Chunk requests share the controller's concurrency limit.
+
+        Args:
+            path: Batch endpoint path
+            users: Users to create
+            chunk_size: Max users per request
+
+        Returns:
+            PetStoreBatchUserCreateResponse aggregated over all chunks
+        """
+        url = f"{self.BASE_URL}{path}"
+
+        async def send_chunk(
+            chunk: list[PetStoreUserCreateRequest],
+        ) -> PetStoreUserCreateResponse:
+            response = await self._request(
+                "POST", url, content=_USER_LIST_ADAPTER.dump_json(chunk)
+            )
+            return PetStoreUserCreateResponse.from_response(response)
+
+        chunks = list(chunked(users, chunk_size))
+        results = await asyncio.gather(
+            *(send_chunk(chunk) for chunk in chunks), return_exceptions=True
+        )
+
+        created_users = 0
+        errors: list[str] = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException):
+                errors.append(str(result))
+            else:
+                created_users += len(chunk)
+
+        return PetStoreBatchUserCreateResponse(
+            total_users=sum(len(chunk) for chunk in chunks),
+            created_users=created_users,
+            chunks=len(chunks),
+            failed_chunks=len(errors),
+            errors=errors,
+        )
+
+    async def create_user(
+        self, user_data: PetStoreUserCreateRequest
+    ) -> PetStoreUserCreateResponse:
+        """
+        Create a new user in the Pet Store API
+
+        Args:
+            user_data: PetStoreUserCreateRequest object containing user details
+
+        Returns:
+            PetStoreUserCreateResponse with the creation result
+        """
+        response = await self._request(
+            "POST", f"{self.BASE_URL}/user", content=user_data.model_dump_json()
+        )
+        return PetStoreUserCreateResponse.from_response(response)
+
+    async def add_pet(self, pet_data: PetStoreAddPetRequest) -> PetStoreAddPetResponse:
+        """
+        Add a new pet to the store
+
+        Args:
+            pet_data: PetStoreAddPetRequest object containing pet details
+
+        Returns:
+            PetStoreAddPetResponse containing the created pet with ID
+        """
+        response = await self._request(
+            "POST",
+            f"{self.BASE_URL}/pet",
+            content=pet_data.model_dump_json(),
+            headers={"api_key": self.api_key},
+        )
+        return PetStoreAddPetResponse.from_response(response)
+
+    async def get_pet_by_id(self, pet_id: int) -> PetStoreGetPetResponse:
+        """
+        Find pet by ID
+
+        Args:
+            pet_id: ID of pet to return
+
+        Returns:
+            PetStoreGetPetResponse containing the pet details
+        """
+        response = await self._request(
+            "GET", f"{self.BASE_URL}/pet/{pet_id}", headers={"api_key": self.api_key}
+        )
+        return PetStoreGetPetResponse.from_response(response)
+
+    async def delete_pet(self, pet_id: int) -> PetStoreDeletePetResponse:
+        """
+        Delete a pet from the store
+
+        Args:
+            pet_id: ID of pet to delete
+
+        Returns:
+            PetStoreDeletePetResponse with deletion response
+        """
+        response = await self._request(
+            "DELETE", f"{self.BASE_URL}/pet/{pet_id}", headers={"api_key": self.api_key}
+        )
+        return PetStoreDeletePetResponse.from_response(response)
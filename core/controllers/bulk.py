@@ -0,0 +1,101 @@
+"""
+Bounded-concurrency bulk execution for API controllers.
+
+run_bulk() pipelines calls over a thread pool, keeps at most a fixed number of
+them in flight and yields a BulkResult for each item as soon as it completes.
+Failures are captured per item instead of aborting the batch. Calls run in a
+copy of the caller's context, so context variables such as the running test
+of the HTTP metrics carry over to the worker threads.
+"""
+
+import contextvars
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_BULK_WORKERS = 10
+
+
+@dataclass
+class BulkResult(Generic[T, R]):
+    """Outcome of one item of a bulk operation."""
+
+    item: T
+    response: R | None = None
+    error: Exception | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True if the call for this item succeeded."""
+        return self.error is None
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """
+    Split an iterable into lists of at most size items.
+
+    Args:
+        items: Items to split (consumed lazily)
+        size: Max items per chunk
+
+    Yields:
+        Consecutive chunks of items
+    """
+    if size < 1:
+        raise ValueError(f"Chunk size must be positive, got {size}")
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _timed_call(func: Callable[[T], R], item: T) -> BulkResult[T, R]:
+    started = time.perf_counter()
+    try:
+        response = func(item)
+    except Exception as e:
+        return BulkResult(item=item, error=e, elapsed=time.perf_counter() - started)
+    return BulkResult(
+        item=item, response=response, elapsed=time.perf_counter() - started
+    )
+
+
+def run_bulk(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = DEFAULT_BULK_WORKERS,
+) -> Iterator[BulkResult[T, R]]:
+    """
+    Call func for every item with bounded concurrency.
+
+    Items are consumed lazily, so arbitrarily large iterables never have more
+    than max_workers calls in flight or queued.
+
+    Args:
+        func: Function to call for each item
+        items: Items to process
+        max_workers: Max concurrent calls
+
+    Yields:
+        BulkResult for each item, in completion order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: set[Future[BulkResult[T, R]]] = set()
+        for item in items:
+            if len(pending) >= max_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            context = contextvars.copy_context()
+            pending.add(executor.submit(context.run, _timed_call, func, item))
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
@@ -0,0 +1,149 @@
+"""
+Deferred, concurrent deletion of API test data.
+
+Tests register the resources they create (pets, users, orders, ...) together
+with a callable that deletes them. flush() hands the pending deletions to a
+background thread pool, so test teardown no longer waits on them, and drain()
+waits for everything at session end and reports resources that could not be
+deleted.
+"""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+import requests
+from core.controllers.bulk import DEFAULT_BULK_WORKERS
+
+
+@dataclass
+class LeakedResource:
+    """A resource whose deletion failed."""
+
+    kind: str
+    resource_id: Any
+    error: str
+
+    def to_dict(self) -> dict:
+        return {"kind": self.kind, "id": self.resource_id, "error": self.error}
+
+
+@dataclass
+class CleanupReport:
+    """Outcome of all deletions run by a CleanupQueue."""
+
+    registered: int = 0
+    deleted: int = 0
+    already_gone: int = 0
+    leaked: list[LeakedResource] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "registered": self.registered,
+            "deleted": self.deleted,
+            "already_gone": self.already_gone,
+            "leaked": [resource.to_dict() for resource in self.leaked],
+        }
+
+
+@dataclass
+class _PendingDeletion:
+    kind: str
+    resource_id: Any
+    delete: Callable[[], object]
+
+
+class CleanupQueue:
+    """Worker-wide queue of test resources deleted in the background."""
+
+    def __init__(self, max_workers: int = DEFAULT_BULK_WORKERS):
+        """
+        Initialize the cleanup queue
+
+        Args:
+            max_workers: Max deletions in flight (keep at or below the pool size)
+        """
+        self.report = CleanupReport()
+        self._pending: list[_PendingDeletion] = []
+        self._in_flight: dict[Future, _PendingDeletion] = {}
+        # Re-entrant: a future that is already done runs _done() inside flush()
+        self._lock = threading.RLock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="cleanup"
+        )
+
+    def register(
+        self, kind: str, resource_id: Any, delete: Callable[[], object]
+    ) -> None:
+        """
+        Register a resource to delete on the next flush()
+
+        Args:
+            kind: Resource type used in the report, e.g. "pet"
+            resource_id: ID or name of the resource
+            delete: Callable that deletes the resource; a 404 HTTPError counts
+                as already deleted
+        """
+        with self._lock:
+            self._pending.append(_PendingDeletion(kind, resource_id, delete))
+            self.report.registered += 1
+
+    def flush(self) -> None:
+        """Start deleting all pending resources in the background."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            for deletion in pending:
+                future = self._executor.submit(self._run, deletion)
+                self._in_flight[future] = deletion
+                future.add_done_callback(self._done)
+
+    def _done(self, future: Future) -> None:
+        with self._lock:
+            self._in_flight.pop(future, None)
+
+    def drain(self, timeout: float | None = None) -> CleanupReport:
+        """
+        Delete everything still pending and wait for all deletions
+
+        Args:
+            timeout: Max seconds to wait; unfinished deletions are reported as leaked
+
+        Returns:
+            CleanupReport of the whole session
+        """
+        self.flush()
+        with self._lock:
+            in_flight = dict(self._in_flight)
+        _, not_done = wait(in_flight, timeout=timeout)
+        self._executor.shutdown(wait=not not_done, cancel_futures=True)
+        for future in not_done:
+            deletion = in_flight[future]
+            self._leak(deletion, TimeoutError("cleanup timed out"))
+        return self.report
+
+    def _run(self, deletion: _PendingDeletion) -> None:
+        try:
+            deletion.delete()
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                self._record(already_gone=True)
+            else:
+                self._leak(deletion, e)
+        except Exception as e:
+            self._leak(deletion, e)
+        else:
+            self._record(already_gone=False)
+
+    def _record(self, already_gone: bool) -> None:
+        with self._lock:
+            if already_gone:
+                self.report.already_gone += 1
+            else:
+                self.report.deleted += 1
+
+    def _leak(self, deletion: _PendingDeletion, error: Exception) -> None:
+        with self._lock:
+            self.report.leaked.append(
+                LeakedResource(deletion.kind, deletion.resource_id, str(error))
+            )
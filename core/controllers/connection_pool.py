@@ -0,0 +1,121 @@
+"""
+Pooled HTTP adapter shared by API controllers.
+
+A single PooledHTTPAdapter can be mounted on many requests.Session objects, so
+per-test controllers keep their own headers while reusing the same keep-alive
+TCP/TLS connections. The adapter also reports how often connections were reused.
+"""
+
+import socket
+import threading
+from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+DEFAULT_POOL_SIZE = 10
+
+
+@dataclass
+class ConnectionStats:
+    """Connection reuse statistics of a pooled adapter."""
+
+    requests: int
+    connections: int
+
+    @property
+    def reused(self) -> int:
+        """Number of requests served over an already open connection."""
+        return max(self.requests - self.connections, 0)
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Share of requests that reused a connection (0.0 - 1.0)."""
+        return self.reused / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "connections": self.connections,
+            "reused": self.reused,
+            "reuse_ratio": round(self.reuse_ratio, 4),
+        }
+
+
+class _Counter:
+    """Thread-safe counter."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def increment(self) -> None:
+        with self._lock:
+            self.value += 1
+
+
+def _counting_pool_class(pool_cls: type, counter: _Counter) -> type:
+    """Subclass a urllib3 pool so every new socket connection is counted."""
+
+    class CountingConnection(pool_cls.ConnectionCls):  # type: ignore[name-defined]
+        def connect(self) -> None:
+            counter.increment()
+            super().connect()
+
+    return type(pool_cls.__name__, (pool_cls,), {"ConnectionCls": CountingConnection})
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with a configurable connection pool and keep-alive."""
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        keep_alive: bool = True,
+        timeout: float | tuple[float, float] | None = None,
+        **kwargs,
+    ):
+        """
+        Initialize the pooled adapter
+
+        Args:
+            pool_size: Max connections kept open per host (and number of hosts cached)
+            keep_alive: Keep connections open between requests (enables TCP
+                keep-alive probes); when False every request closes its connection
+            timeout: Default (connect, read) timeout of requests that set none
+            **kwargs: Extra HTTPAdapter arguments, e.g. max_retries
+        """
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self._requests = _Counter()
+        self._connections = _Counter()
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size, **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.keep_alive:
+            pool_kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            ]
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: _counting_pool_class(pool_cls, self._connections)
+            for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+    def send(self, request, *args, **kwargs):
+        if not self.keep_alive:
+            request.headers["Connection"] = "close"
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        self._requests.increment()
+        return super().send(request, *args, **kwargs)
+
+    def stats(self) -> ConnectionStats:
+        """
+        Report how many requests were sent and how many connections were opened.
+
+        Returns:
+            ConnectionStats: Totals since the adapter was created
+        """
+        return ConnectionStats(
+            requests=self._requests.value, connections=self._connections.value
+        )
@@ -0,0 +1,253 @@
+"""
+HTTP-level instrumentation for API controllers.
+
+A controller installs http_metrics.response_hook() on its requests.Session.
+Every response is then recorded as an HttpCall with its method, endpoint
+template (e.g. /pet/{petId}), status, latency, bytes sent/received and the
+number of retries urllib3 made. Calls are aggregated per endpoint into
+fixed-size latency histograms, so memory does not grow with the run length.
+Calls made in the context of a running test (see start_test()) are also
+aggregated into that test's own buffer; calls from background threads that do
+not carry the test's context, such as deferred cleanup, count only towards the
+session.
+"""
+
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+import requests
+from core.metrics import LatencyHistogram
+
+LATENCY_PERCENTILES = (50, 95, 99)
+
+
+@dataclass
+class HttpCall:
+    """A single recorded HTTP request/response."""
+
+    method: str
+    endpoint: str
+    status: int
+    latency: float
+    bytes_out: int
+    bytes_in: int | None
+    retries: int
+
+
+@dataclass
+class EndpointStats:
+    """Aggregated calls of one "METHOD endpoint"."""
+
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    errors: int = 0
+    retries: int = 0
+    bytes_out: int = 0
+    bytes_in: int = 0
+
+    def add(self, call: HttpCall) -> None:
+        """Aggregate one call."""
+        self.latency.record(call.latency)
+        if call.status >= 400:
+            self.errors += 1
+        self.retries += call.retries
+        self.bytes_out += call.bytes_out
+        self.bytes_in += call.bytes_in or 0
+
+    def to_dict(self) -> dict:
+        """Latency percentiles (seconds), bytes, errors and retries."""
+        stats: dict[str, Any] = self.latency.summary(LATENCY_PERCENTILES)
+        stats["errors"] = self.errors
+        stats["retries"] = self.retries
+        stats["bytes_out"] = self.bytes_out
+        stats["bytes_in"] = self.bytes_in
+        return stats
+
+
+EndpointTable = dict[str, EndpointStats]
+
+
+def _add(table: EndpointTable, call: HttpCall) -> None:
+    key = f"{call.method} {call.endpoint}"
+    stats = table.get(key)
+    if stats is None:
+        stats = table[key] = EndpointStats()
+    stats.add(call)
+
+
+def _summarize(table: EndpointTable) -> dict[str, dict]:
+    return {key: stats.to_dict() for key, stats in sorted(table.items())}
+
+
+class EndpointMatcher:
+    """Maps request URLs to endpoint templates such as /pet/{petId}."""
+
+    def __init__(self, base_url: str, templates: Iterable[str]):
+        """
+        Initialize the matcher
+
+        Args:
+            base_url: API root the templates are relative to
+            templates: Endpoint templates; literal paths win over parameterized ones
+        """
+        self.base_path = urlsplit(base_url).path.rstrip("/")
+        self._literals = {t for t in templates if "{" not in t}
+        self._patterns = [
+            (re.compile(re.sub(r"\{[^/]+?\}", "[^/]+", t)), t)
+            for t in templates
+            if "{" in t
+        ]
+
+    def match(self, url: str) -> str:
+        """
+        Resolve the endpoint template of a URL
+
+        Args:
+            url: Absolute request URL
+
+        Returns:
+            The matching template, or the raw path if none matches
+        """
+        path = urlsplit(url).path
+        if path.startswith(self.base_path):
+            path = path[len(self.base_path) :] or "/"
+        if path in self._literals:
+            return path
+        for pattern, template in self._patterns:
+            if pattern.fullmatch(path):
+                return template
+        return path
+
+
+def _request_size(request: requests.PreparedRequest) -> int:
+    """Body size of a prepared request (streamed bodies report their length)."""
+    body = request.body
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, str)):
+        return len(body)
+    length = getattr(body, "len", None) or request.headers.get("Content-Length")
+    return int(length or 0)
+
+
+def _retry_count(response: requests.Response) -> int:
+    """Number of retries urllib3 made before this response."""
+    retries = getattr(response.raw, "retries", None)
+    return len(retries.history) if retries is not None else 0
+
+
+class HttpMetricsRecorder:
+    """Thread-safe per-endpoint and per-test aggregates of HttpCall records."""
+
+    def __init__(self) -> None:
+        self.enabled: bool = True
+        self.count = 0
+        self._endpoints: EndpointTable = {}
+        self._tests: dict[str, EndpointTable] = {}
+        self._current_test: ContextVar[str | None] = ContextVar(
+            "http_metrics_test", default=None
+        )
+        self._lock = threading.Lock()
+
+    def record(self, call: HttpCall) -> None:
+        """Aggregate one call into the session and the current test, if any."""
+        test = self._current_test.get()
+        with self._lock:
+            self.count += 1
+            _add(self._endpoints, call)
+            if test is not None and test in self._tests:
+                _add(self._tests[test], call)
+
+    def start_test(self, test: str) -> Token:
+        """
+        Attribute calls made in the current context to a test
+
+        Threads see the test only if their work is run in a copy of this
+        context (contextvars.copy_context()), as bulk and hedged calls are.
+
+        Args:
+            test: Test node ID
+
+        Returns:
+            Token to pass to finish_test()
+        """
+        with self._lock:
+            self._tests[test] = {}
+        return self._current_test.set(test)
+
+    def finish_test(self, test: str, token: Token) -> dict[str, dict]:
+        """
+        Stop attributing calls to a test and drop its buffer
+
+        Calls of the test that complete later still count towards the session.
+
+        Args:
+            test: Test node ID passed to start_test()
+            token: Token returned by start_test()
+
+        Returns:
+            Per-endpoint summary of the test's calls (empty if it made none)
+        """
+        self._current_test.reset(token)
+        with self._lock:
+            table = self._tests.pop(test, {})
+            return _summarize(table)
+
+    def test_count(self, test: str) -> int:
+        """Calls recorded so far for a running test."""
+        with self._lock:
+            table = self._tests.get(test, {})
+            return sum(stats.latency.count for stats in table.values())
+
+    def response_hook(self, matcher: EndpointMatcher) -> Callable[..., Any]:
+        """
+        Build a requests response hook that records calls
+
+        Args:
+            matcher: Endpoint matcher of the controller's API
+
+        Returns:
+            Hook for session.hooks["response"]
+        """
+
+        def hook(response: requests.Response, *args, **kwargs) -> requests.Response:
+            if not self.enabled:
+                return response
+            latency = response.elapsed.total_seconds()
+            bytes_in: int | None
+            if kwargs.get("stream"):
+                length = response.headers.get("Content-Length")
+                bytes_in = int(length) if length else None
+            else:
+                # Read the body here so the download is part of the latency
+                started = time.perf_counter()
+                bytes_in = len(response.content)
+                latency += time.perf_counter() - started
+
+            request = response.request
+            self.record(
+                HttpCall(
+                    method=request.method or "",
+                    endpoint=matcher.match(request.url or ""),
+                    status=response.status_code,
+                    latency=latency,
+                    bytes_out=_request_size(request),
+                    bytes_in=bytes_in,
+                    retries=_retry_count(response),
+                )
+            )
+            return response
+
+        return hook
+
+    def to_dict(self) -> dict:
+        """Per-endpoint summary of every call recorded this session."""
+        with self._lock:
+            return {"endpoints": _summarize(self._endpoints)}
+
+
+http_metrics = HttpMetricsRecorder()
@@ -0,0 +1,148 @@
+"""
+Incremental parsing of large JSON array responses.
+
+iter_json_array() splits a streamed JSON array into the raw bytes of its
+top-level elements without ever holding more than one element (plus the
+current network chunk) in memory. ModelStream validates each element into a
+Pydantic model as it arrives and can skip and count malformed records.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from typing import Generic, TypeVar
+from pydantic import BaseModel, ValidationError
+from requests import Response
+
+M = TypeVar("M", bound=BaseModel)
+
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Bytes that can change the array/object/string structure
+_STRUCTURAL = re.compile(rb'[\[\]{}",\\]')
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Yield the raw bytes of each top-level element of a streamed JSON array.
+
+    Args:
+        chunks: Consecutive pieces of the JSON document
+
+    Yields:
+        Bytes of each array element, stripped of surrounding whitespace.
+        An empty element (e.g. "[1,,2]") is yielded as b"".
+
+    Raises:
+        ValueError: If the document is not an array or ends before the array closes
+    """
+    buffer = bytearray()
+    depth = 0
+    in_string = False
+    pos = 0
+    element_start = 0
+
+    for chunk in chunks:
+        buffer += chunk
+        while True:
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                # pos may point past the buffer after an escape split across chunks
+                pos = max(pos, len(buffer))
+                break
+
+            char = match.group()
+            pos = match.end()
+
+            if in_string:
+                if char == b"\\":
+                    pos += 1
+                elif char == b'"':
+                    in_string = False
+                continue
+
+            if char == b'"':
+                in_string = True
+            elif char in (b"[", b"{"):
+                if depth == 0:
+                    if char != b"[":
+                        raise ValueError("Expected a JSON array response")
+                    element_start = pos
+                depth += 1
+            elif char in (b"]", b"}"):
+                depth -= 1
+                if depth == 0:
+                    element = bytes(buffer[element_start : match.start()]).strip()
+                    if element:
+                        yield element
+                    return
+            elif char == b"," and depth == 1:
+                yield bytes(buffer[element_start : match.start()]).strip()
+                # Drop the consumed element so memory stays flat
+                del buffer[:pos]
+                pos = 0
+                element_start = 0
+
+    raise ValueError("JSON array ended before it was closed")
+
+
+class ModelStream(Generic[M]):
+    """
+    Iterator of Pydantic models parsed incrementally from a streamed response.
+
+    Usage:
+        with controller.iter_pets_by_status("available", skip_malformed=True) as pets:
+            for pet in pets:
+                ...
+        print(pets.parsed, pets.skipped)
+    """
+
+    def __init__(
+        self,
+        response: Response,
+        model: type[M],
+        skip_malformed: bool = False,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ):
+        """
+        Initialize the model stream
+
+        Args:
+            response: Streamed (stream=True) requests.Response with a JSON array body
+            model: Pydantic model to validate each element into
+            skip_malformed: Skip and count elements that fail validation
+                instead of raising
+            chunk_size: Bytes read from the socket per chunk
+        """
+        self.response = response
+        self.model = model
+        self.skip_malformed = skip_malformed
+        self.chunk_size = chunk_size
+        self.parsed = 0
+        self.skipped = 0
+
+    def __iter__(self) -> Iterator[M]:
+        try:
+            for element in iter_json_array(
+                self.response.iter_content(chunk_size=self.chunk_size)
+            ):
+                try:
+                    item = self.model.model_validate_json(element)
+                except ValidationError:
+                    if not self.skip_malformed:
+                        raise
+                    self.skipped += 1
+                    continue
+                self.parsed += 1
+                yield item
+        finally:
+            self.close()
+
+    def __enter__(self) -> "ModelStream[M]":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the connection back to the pool."""
+        self.response.close()
@@ -0,0 +1,189 @@
+"""
+Streaming multipart/form-data bodies for file uploads.
+
+MultipartFileStream is a file-like request body: requests reads it in small
+blocks and sends it with an exact Content-Length, so the uploaded file is read
+from disk chunk by chunk and never loaded into memory as a whole.
+"""
+
+import mimetypes
+import os
+import threading
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO
+
+
+def _quote(value: str) -> str:
+    """Escape a Content-Disposition parameter value for a quoted-string."""
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+class MultipartFileStream:
+    """File-like multipart/form-data body with one file part and optional text fields."""
+
+    def __init__(
+        self,
+        file: str | Path | BinaryIO,
+        field_name: str = "file",
+        filename: str | None = None,
+        content_type: str | None = None,
+        fields: dict[str, str] | None = None,
+    ):
+        """
+        Initialize the multipart stream
+
+        Args:
+            file: Path of the file to upload, or a binary file-like object
+                that supports seek/tell
+            field_name: Form field name of the file part
+            filename: File name sent to the server (defaults to the file's name)
+            content_type: MIME type of the file part (guessed from the name)
+            fields: Extra text form fields sent before the file part
+        """
+        self._owns_file = isinstance(file, (str, Path))
+        self._file: BinaryIO = (
+            open(file, "rb") if isinstance(file, (str, Path)) else file
+        )
+        filename = filename or Path(getattr(self._file, "name", "upload")).name
+        content_type = (
+            content_type
+            or mimetypes.guess_type(filename)[0]
+            or "application/octet-stream"
+        )
+        self.boundary = uuid.uuid4().hex
+
+        preamble = b"".join(
+            self._text_part(name, value) for name, value in (fields or {}).items()
+        )
+        preamble += (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(field_name)}"; '
+            f'filename="{_quote(filename)}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        self._preamble = preamble
+        self._epilogue = f"\r\n--{self.boundary}--\r\n".encode()
+
+        start = self._file.tell()
+        self._file_size = self._file.seek(0, os.SEEK_END) - start
+        self._file.seek(start)
+
+        self.len = len(self._preamble) + self._file_size + len(self._epilogue)
+        self._position = 0
+
+    def _text_part(self, name: str, value: str) -> bytes:
+        return (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'
+            f"{value}\r\n"
+        ).encode()
+
+    @property
+    def content_type(self) -> str:
+        """Value of the Content-Type request header."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def bytes_sent(self) -> int:
+        """Number of body bytes read by the HTTP client so far."""
+        return self._position
+
+    def __len__(self) -> int:
+        return self.len
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read the next block of the multipart body
+
+        Args:
+            size: Max bytes to return (-1 reads everything that is left)
+
+        Returns:
+            The next bytes of the body, b"" once exhausted
+        """
+        if size is None or size < 0:
+            size = self.len - self._position
+
+        parts: list[bytes] = []
+        while size > 0 and self._position < self.len:
+            block = self._read_block(size)
+            if not block:
+                break
+            parts.append(block)
+            self._position += len(block)
+            size -= len(block)
+
+        data = b"".join(parts)
+        if self._position >= self.len:
+            self.close()
+        return data
+
+    def _read_block(self, size: int) -> bytes:
+        """Read up to size bytes from whichever section the position is in."""
+        preamble_end = len(self._preamble)
+        file_end = preamble_end + self._file_size
+
+        if self._position < preamble_end:
+            return self._preamble[self._position : self._position + size]
+        if self._position < file_end:
+            return self._file.read(min(size, file_end - self._position))
+        offset = self._position - file_end
+        return self._epilogue[offset : offset + size]
+
+    def close(self) -> None:
+        """Close the underlying file if this stream opened it."""
+        if self._owns_file and not self._file.closed:
+            self._file.close()
+
+
+@dataclass
+class UploadStats:
+    """Thread-safe upload counters used to report throughput."""
+
+    uploads: int = 0
+    bytes_sent: int = 0
+    busy_seconds: float = 0.0
+    first_started: float | None = None
+    last_finished: float | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, bytes_sent: int, started: float, finished: float) -> None:
+        """
+        Record one completed upload
+
+        Args:
+            bytes_sent: Body bytes sent
+            started: time.perf_counter() when the upload started
+            finished: time.perf_counter() when the response arrived
+        """
+        with self._lock:
+            self.uploads += 1
+            self.bytes_sent += bytes_sent
+            self.busy_seconds += finished - started
+            if self.first_started is None or started < self.first_started:
+                self.first_started = started
+            if self.last_finished is None or finished > self.last_finished:
+                self.last_finished = finished
+
+    @property
+    def wall_seconds(self) -> float:
+        """Time from the first upload start to the last upload end."""
+        if self.first_started is None or self.last_finished is None:
+            return 0.0
+        return self.last_finished - self.first_started
+
+    @property
+    def throughput(self) -> float:
+        """Aggregate upload throughput in bytes per second across concurrent uploads."""
+        return self.bytes_sent / self.wall_seconds if self.wall_seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "uploads": self.uploads,
+            "bytes_sent": self.bytes_sent,
+            "wall_seconds": round(self.wall_seconds, 4),
+            "busy_seconds": round(self.busy_seconds, 4),
+            "throughput_bytes_per_sec": round(self.throughput, 1),
+        }
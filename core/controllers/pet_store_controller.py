@@ -1,8 +1,29 @@
 import requests
 import os
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
 from dotenv import load_dotenv
+from pydantic import TypeAdapter
+from core.controllers.bulk import DEFAULT_BULK_WORKERS, BulkResult, chunked, run_bulk
+from core.controllers.json_stream import DEFAULT_STREAM_CHUNK_SIZE, ModelStream
+from core.controllers.multipart import MultipartFileStream, UploadStats
+from core.controllers.connection_pool import PooledHTTPAdapter
+from core.controllers.http_metrics import EndpointMatcher, http_metrics
+from core.controllers.resilience import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    HedgePolicy,
+    build_retry,
+)
+from core.controllers.response_cache import ResponseCache
+from core.controllers.session_cache import LoginSession, SessionCache
 from core.schemas.pet_store_login import PetStoreLoginRequest, PetStoreLoginResponse
 from core.schemas.pet_store_user_creation import (
+    PetStoreBatchUserCreateResponse,
+    PetStoreDeleteUserResponse,
     PetStoreUserCreateRequest,
     PetStoreUserCreateResponse,
 )
@@ -11,26 +32,126 @@ from core.schemas.pet_store_pet import (
     PetStoreAddPetResponse,
     PetStoreGetPetResponse,
     PetStoreDeletePetResponse,
+    PetStoreUploadImageResponse,
 )
 
 load_dotenv()
 
+DEFAULT_BASE_URL = "https://petstore.swagger.io/v2"
+DEFAULT_USER_CHUNK_SIZE = 100
+
+_USER_LIST_ADAPTER: TypeAdapter[list[PetStoreUserCreateRequest]] = TypeAdapter(
+    list[PetStoreUserCreateRequest]
+)
+
+
+@dataclass
+class PetImageUpload:
+    """One image to upload for a pet"""
+
+    pet_id: int
+    file: str | Path | BinaryIO
+    additional_metadata: str | None = None
+
 
 class PetStoreController:
-    BASE_URL = "https://petstore.swagger.io/v2"
+    BASE_URL = os.getenv("PET_STORE_BASE_URL", DEFAULT_BASE_URL)
+
+    # Endpoint templates used to group HTTP metrics
+    ENDPOINTS = [
+        "/pet",
+        "/pet/findByStatus",
+        "/pet/findByTags",
+        "/pet/{petId}",
+        "/pet/{petId}/uploadImage",
+        "/store/inventory",
+        "/store/order",
+        "/store/order/{orderId}",
+        "/user",
+        "/user/createWithArray",
+        "/user/createWithList",
+        "/user/login",
+        "/user/logout",
+        "/user/{username}",
+    ]
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        adapter: PooledHTTPAdapter | None = None,
+        base_url: str | None = None,
+        cache: ResponseCache | None = None,
+        hedge: HedgePolicy | None = None,
+        session_cache: SessionCache | None = None,
+        record_metrics: bool = True,
+    ):
         """
         Initialize the Pet Store API client
 
         Args:
             api_key: API key for authorization (defaults to PET_STORE_API_KEY env variable)
+            adapter: Shared pooled adapter to send requests through (defaults to
+                a private connection pool with default timeouts and retries of
+                idempotent requests)
+            base_url: API root, e.g. a local stub server (defaults to
+                PET_STORE_BASE_URL env variable or the public Pet Store)
+            cache: Cache for idempotent GETs, shared with other controllers
+                (disabled by default)
+            hedge: Hedging policy for GETs, shared with other controllers
+                (disabled by default)
+            session_cache: Login sessions shared with other controllers
+                (disabled by default)
+            record_metrics: Record calls in the HTTP metrics (turn off where
+                the caller measures latency itself, e.g. load generation)
         """
-        self.api_key = api_key or os.getenv("PET_STORE_API_KEY", "special-key")
+        self.api_key = api_key or os.environ.get("PET_STORE_API_KEY", "special-key")
+        if base_url:
+            self.BASE_URL = base_url.rstrip("/")
+        self.adapter = adapter or PooledHTTPAdapter(
+            timeout=(DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT),
+            max_retries=build_retry(),
+        )
         self.session = requests.Session()
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
         self.session.headers.update(
             {"Content-Type": "application/json", "Accept": "application/json"}
         )
+        self.endpoints = EndpointMatcher(self.BASE_URL, self.ENDPOINTS)
+        self.record_metrics = record_metrics
+        if record_metrics:
+            self.session.hooks["response"].append(
+                http_metrics.response_hook(self.endpoints)
+            )
+        self.upload_stats = UploadStats()
+        self.cache = cache
+        self.hedge = hedge
+        self.session_cache = session_cache
+
+    def view(self, api_key: str | None = None) -> "PetStoreController":
+        """
+        Create a controller that shares this controller's connection pool
+
+        The view has its own session headers and api_key, so per-test changes
+        never leak into other tests, while TCP/TLS connections are reused.
+        The GET cache, hedging, login sessions and the HTTP metrics setting are
+        shared as well.
+
+        Args:
+            api_key: API key for the view (defaults to this controller's api_key)
+
+        Returns:
+            PetStoreController bound to the same pooled adapter
+        """
+        return PetStoreController(
+            api_key=api_key or self.api_key,
+            adapter=self.adapter,
+            base_url=self.BASE_URL,
+            cache=self.cache,
+            hedge=self.hedge,
+            session_cache=self.session_cache,
+            record_metrics=self.record_metrics,
+        )
 
     def login(self, login_data: PetStoreLoginRequest) -> PetStoreLoginResponse:
         """
@@ -42,13 +163,54 @@ class PetStoreController:
         Returns:
             A dictionary containing the login response
         """
+        response = self._login(login_data)
+        return PetStoreLoginResponse.from_response(response)
+
+    def login_session(self, login_data: PetStoreLoginRequest) -> LoginSession:
+        """
+        Get a session for the user, reusing the cached one while it is valid
+
+        Without a session_cache every call logs in.
+
+        Args:
+            login_data: PetStoreLogin object containing username and password
+
+        Returns:
+            LoginSession with the session token and its expiry
+        """
+
+        def login() -> LoginSession:
+            response = self._login(login_data)
+            PetStoreLoginResponse.from_response(response)
+            return LoginSession.from_response(login_data.username, response)
+
+        if self.session_cache is None:
+            return login()
+        return self.session_cache.get_or_login(login_data.username, login)
+
+    def refresh_login_session(self, login_data: PetStoreLoginRequest) -> LoginSession:
+        """
+        Log in again after the API rejected the user's session token
+
+        Args:
+            login_data: PetStoreLogin object containing username and password
+
+        Returns:
+            The new LoginSession
+        """
+        if self.session_cache is not None:
+            self.session_cache.reject(login_data.username)
+        return self.login_session(login_data)
+
+    def _login(self, login_data: PetStoreLoginRequest) -> requests.Response:
+        """Send /user/login and return the successful response."""
         url = f"{self.BASE_URL}/user/login"
         response = self.session.get(
             url,
             params={"username": login_data.username, "password": login_data.password},
         )
         response.raise_for_status()
-        return PetStoreLoginResponse.from_response(response)
+        return response
 
     def create_user_with_list(
         self, user_data: PetStoreUserCreateRequest
@@ -63,10 +225,100 @@ class PetStoreController:
             A dictionary containing the user creation response
         """
         url = f"{self.BASE_URL}/user/createWithList"
-        response = self.session.post(url, data=user_data.model_dump_json())
+        response = self.session.post(
+            url, data=_USER_LIST_ADAPTER.dump_json([user_data])
+        )
         response.raise_for_status()
         return PetStoreUserCreateResponse.from_response(response)
 
+    def create_users_with_list(
+        self,
+        users: Iterable[PetStoreUserCreateRequest],
+        chunk_size: int = DEFAULT_USER_CHUNK_SIZE,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> PetStoreBatchUserCreateResponse:
+        """
+        Create many users through /user/createWithList, one request per chunk
+
+        Args:
+            users: PetStoreUserCreateRequest objects to create
+            chunk_size: Max users per request
+            max_workers: Max chunk requests in flight
+
+        Returns:
+            PetStoreBatchUserCreateResponse aggregated over all chunks
+        """
+        return self._create_users_in_chunks(
+            "/user/createWithList", users, chunk_size, max_workers
+        )
+
+    def create_users_with_array(
+        self,
+        users: Iterable[PetStoreUserCreateRequest],
+        chunk_size: int = DEFAULT_USER_CHUNK_SIZE,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> PetStoreBatchUserCreateResponse:
+        """
+        Create many users through /user/createWithArray, one request per chunk
+
+        Args:
+            users: PetStoreUserCreateRequest objects to create
+            chunk_size: Max users per request
+            max_workers: Max chunk requests in flight
+
+        Returns:
+            PetStoreBatchUserCreateResponse aggregated over all chunks
+        """
+        return self._create_users_in_chunks(
+            "/user/createWithArray", users, chunk_size, max_workers
+        )
+
+    def _create_users_in_chunks(
+        self,
+        path: str,
+        users: Iterable[PetStoreUserCreateRequest],
+        chunk_size: int,
+        max_workers: int,
+    ) -> PetStoreBatchUserCreateResponse:
+        """
+        Send size-bounded chunks of users to a batch endpoint concurrently
+
+        Args:
+            path: Batch endpoint path
+            users: Users to create
+            chunk_size: Max users per request
+            max_workers: Max chunk requests in flight
+
+        Returns:
+            PetStoreBatchUserCreateResponse aggregated over all chunks
+        """
+        url = f"{self.BASE_URL}{path}"
+
+        def send_chunk(
+            chunk: list[PetStoreUserCreateRequest],
+        ) -> PetStoreUserCreateResponse:
+            response = self.session.post(url, data=_USER_LIST_ADAPTER.dump_json(chunk))
+            response.raise_for_status()
+            return PetStoreUserCreateResponse.from_response(response)
+
+        total_users = created_users = chunks = 0
+        errors: list[str] = []
+        for result in run_bulk(send_chunk, chunked(users, chunk_size), max_workers):
+            chunks += 1
+            total_users += len(result.item)
+            if result.ok:
+                created_users += len(result.item)
+            else:
+                errors.append(str(result.error))
+
+        return PetStoreBatchUserCreateResponse(
+            total_users=total_users,
+            created_users=created_users,
+            chunks=chunks,
+            failed_chunks=len(errors),
+            errors=errors,
+        )
+
     def create_user(
         self, user_data: PetStoreUserCreateRequest
     ) -> PetStoreUserCreateResponse:
@@ -84,6 +336,22 @@ class PetStoreController:
         response.raise_for_status()
         return PetStoreUserCreateResponse.from_response(response)
 
+    def delete_user(self, username: str) -> PetStoreDeleteUserResponse:
+        """
+        Delete a user
+
+        Args:
+            username: Name of the user to delete
+
+        Returns:
+            PetStoreDeleteUserResponse with deletion response
+        """
+        url = f"{self.BASE_URL}/user/{username}"
+        headers = {"api_key": self.api_key}
+        response = self.session.delete(url, headers=headers)
+        response.raise_for_status()
+        return PetStoreDeleteUserResponse.from_response(response)
+
     def add_pet(self, pet_data: PetStoreAddPetRequest) -> PetStoreAddPetResponse:
         """
         Add a new pet to the store
@@ -100,7 +368,29 @@ class PetStoreController:
             url, data=pet_data.model_dump_json(), headers=headers
         )
         response.raise_for_status()
-        return PetStoreAddPetResponse.from_response(response)
+        pet = PetStoreAddPetResponse.from_response(response)
+        self._invalidate_pet(pet.id)
+        return pet
+
+    def update_pet(self, pet_data: PetStoreAddPetRequest) -> PetStoreAddPetResponse:
+        """
+        Update an existing pet
+
+        Args:
+            pet_data: PetStoreAddPetRequest object with the pet ID and new details
+
+        Returns:
+            PetStoreAddPetResponse containing the updated pet
+        """
+        url = f"{self.BASE_URL}/pet"
+        headers = {"api_key": self.api_key}
+        response = self.session.put(
+            url, data=pet_data.model_dump_json(), headers=headers
+        )
+        response.raise_for_status()
+        pet = PetStoreAddPetResponse.from_response(response)
+        self._invalidate_pet(pet.id)
+        return pet
 
     def get_pet_by_id(self, pet_id: int) -> PetStoreGetPetResponse:
         """
@@ -113,9 +403,7 @@ class PetStoreController:
             PetStoreGetPetResponse containing the pet details
         """
         url = f"{self.BASE_URL}/pet/{pet_id}"
-        headers = {"api_key": self.api_key}
-        response = self.session.get(url, headers=headers)
-        response.raise_for_status()
+        response = self._get(url)
         return PetStoreGetPetResponse.from_response(response)
 
     def delete_pet(self, pet_id: int) -> PetStoreDeletePetResponse:
@@ -131,5 +419,266 @@ class PetStoreController:
         url = f"{self.BASE_URL}/pet/{pet_id}"
         headers = {"api_key": self.api_key}
         response = self.session.delete(url, headers=headers)
+        self._invalidate_pet(pet_id)
         response.raise_for_status()
         return PetStoreDeletePetResponse.from_response(response)
+
+    def upload_pet_image(
+        self,
+        pet_id: int,
+        file: str | Path | BinaryIO,
+        additional_metadata: str | None = None,
+    ) -> PetStoreUploadImageResponse:
+        """
+        Upload an image for a pet as a streamed multipart body
+
+        The file is read from disk in small blocks while it is sent, so large
+        images are never held in memory. Sent bytes and timings are added to
+        upload_stats.
+
+        Args:
+            pet_id: ID of pet to update
+            file: Path of the image, or a binary file-like object
+            additional_metadata: Additional data to pass to the server
+
+        Returns:
+            PetStoreUploadImageResponse with the upload details
+        """
+        url = f"{self.BASE_URL}/pet/{pet_id}/uploadImage"
+        fields = (
+            {"additionalMetadata": additional_metadata}
+            if additional_metadata is not None
+            else None
+        )
+        body = MultipartFileStream(file, fields=fields)
+        headers = {"api_key": self.api_key, "Content-Type": body.content_type}
+        started = time.perf_counter()
+        try:
+            response = self.session.post(url, data=body, headers=headers)
+        finally:
+            body.close()
+        self._invalidate_pet(pet_id)
+        response.raise_for_status()
+        self.upload_stats.record(body.bytes_sent, started, time.perf_counter())
+        return PetStoreUploadImageResponse.from_response(response)
+
+    def iter_pets_by_status(
+        self,
+        status: str | Iterable[str],
+        skip_malformed: bool = False,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> ModelStream[PetStoreGetPetResponse]:
+        """
+        Stream pets by status, parsing them one at a time
+
+        Memory stays flat regardless of how many pets the endpoint returns.
+
+        Args:
+            status: Status value(s): available, pending, sold
+            skip_malformed: Skip and count pets that fail validation instead of raising
+            chunk_size: Bytes read from the socket per chunk
+
+        Returns:
+            ModelStream of PetStoreGetPetResponse; its parsed/skipped counters
+            are final once iteration ends
+        """
+        statuses = [status] if isinstance(status, str) else list(status)
+        return self._stream_pets(
+            "/pet/findByStatus", {"status": statuses}, skip_malformed, chunk_size
+        )
+
+    def iter_pets_by_tags(
+        self,
+        tags: str | Iterable[str],
+        skip_malformed: bool = False,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> ModelStream[PetStoreGetPetResponse]:
+        """
+        Stream pets by tags, parsing them one at a time
+
+        Args:
+            tags: Tag name(s) to filter by
+            skip_malformed: Skip and count pets that fail validation instead of raising
+            chunk_size: Bytes read from the socket per chunk
+
+        Returns:
+            ModelStream of PetStoreGetPetResponse
+        """
+        tag_names = [tags] if isinstance(tags, str) else list(tags)
+        return self._stream_pets(
+            "/pet/findByTags", {"tags": tag_names}, skip_malformed, chunk_size
+        )
+
+    def find_pets_by_status(
+        self, status: str | Iterable[str]
+    ) -> list[PetStoreGetPetResponse]:
+        """
+        Find pets by status, validating the whole array in one pass
+
+        Prefer iter_pets_by_status() when the result can be large.
+
+        Args:
+            status: Status value(s): available, pending, sold
+
+        Returns:
+            List of PetStoreGetPetResponse
+        """
+        statuses = [status] if isinstance(status, str) else list(status)
+        url = f"{self.BASE_URL}/pet/findByStatus"
+        response = self._get(url, params={"status": statuses})
+        return PetStoreGetPetResponse.list_from_response(response)
+
+    def find_pets_by_tags(
+        self, tags: str | Iterable[str]
+    ) -> list[PetStoreGetPetResponse]:
+        """
+        Find pets by tags, validating the whole array in one pass
+
+        Args:
+            tags: Tag name(s) to filter by
+
+        Returns:
+            List of PetStoreGetPetResponse
+        """
+        tag_names = [tags] if isinstance(tags, str) else list(tags)
+        url = f"{self.BASE_URL}/pet/findByTags"
+        response = self._get(url, params={"tags": tag_names})
+        return PetStoreGetPetResponse.list_from_response(response)
+
+    def _get(self, url: str, params: dict | None = None) -> requests.Response:
+        """
+        Send an idempotent GET, served from the cache and hedged when configured
+
+        Args:
+            url: Absolute request URL
+            params: Query parameters
+
+        Returns:
+            The successful requests.Response
+        """
+        headers = {"api_key": self.api_key}
+        key = ResponseCache.key(url, params, {**self.session.headers, **headers})
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        def send() -> requests.Response:
+            return self.session.get(url, params=params, headers=headers)
+
+        if self.hedge is not None:
+            response = self.hedge.call(send, f"GET {self.endpoints.match(url)}")
+        else:
+            response = send()
+        response.raise_for_status()
+        if self.cache is not None:
+            self.cache.put(key, response)
+        return response
+
+    def _invalidate_pet(self, pet_id: int) -> None:
+        """Drop cached reads of a pet and of the pet searches it may appear in."""
+        if self.cache is None:
+            return
+        self.cache.invalidate(f"{self.BASE_URL}/pet/{pet_id}")
+        self.cache.invalidate_prefix(f"{self.BASE_URL}/pet/findBy")
+
+    def _stream_pets(
+        self, path: str, params: dict, skip_malformed: bool, chunk_size: int
+    ) -> ModelStream[PetStoreGetPetResponse]:
+        """
+        Open a streamed GET to a pet search endpoint
+
+        Args:
+            path: Endpoint path
+            params: Query parameters
+            skip_malformed: Skip and count pets that fail validation
+            chunk_size: Bytes read from the socket per chunk
+
+        Returns:
+            ModelStream over the response body
+        """
+        url = f"{self.BASE_URL}{path}"
+        headers = {"api_key": self.api_key}
+        response = self.session.get(url, params=params, headers=headers, stream=True)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+        return ModelStream(response, PetStoreGetPetResponse, skip_malformed, chunk_size)
+
+    # Bulk Operations
+
+    def add_pets(
+        self,
+        pets: Iterable[PetStoreAddPetRequest],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> Iterator[BulkResult[PetStoreAddPetRequest, PetStoreAddPetResponse]]:
+        """
+        Add many pets concurrently
+
+        Args:
+            pets: PetStoreAddPetRequest objects to add
+            max_workers: Max requests in flight (keep at or below the pool size)
+
+        Yields:
+            BulkResult per pet as each request completes; failed pets carry
+            the exception in BulkResult.error instead of failing the batch
+        """
+        return run_bulk(self.add_pet, pets, max_workers)
+
+    def get_pets(
+        self, pet_ids: Iterable[int], max_workers: int = DEFAULT_BULK_WORKERS
+    ) -> Iterator[BulkResult[int, PetStoreGetPetResponse]]:
+        """
+        Find many pets by ID concurrently
+
+        Args:
+            pet_ids: IDs of pets to return
+            max_workers: Max requests in flight (keep at or below the pool size)
+
+        Yields:
+            BulkResult per pet ID as each request completes
+        """
+        return run_bulk(self.get_pet_by_id, pet_ids, max_workers)
+
+    def upload_pet_images(
+        self,
+        uploads: Iterable[PetImageUpload],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> Iterator[BulkResult[PetImageUpload, PetStoreUploadImageResponse]]:
+        """
+        Upload images for many pets concurrently
+
+        Aggregate throughput is available from upload_stats once the
+        iterator is exhausted.
+
+        Args:
+            uploads: PetImageUpload objects describing each image
+            max_workers: Max uploads in flight (keep at or below the pool size)
+
+        Yields:
+            BulkResult per upload as each request completes
+        """
+        return run_bulk(
+            lambda upload: self.upload_pet_image(
+                upload.pet_id, upload.file, upload.additional_metadata
+            ),
+            uploads,
+            max_workers,
+        )
+
+    def delete_pets(
+        self, pet_ids: Iterable[int], max_workers: int = DEFAULT_BULK_WORKERS
+    ) -> Iterator[BulkResult[int, PetStoreDeletePetResponse]]:
+        """
+        Delete many pets concurrently
+
+        Args:
+            pet_ids: IDs of pets to delete
+            max_workers: Max requests in flight (keep at or below the pool size)
+
+        Yields:
+            BulkResult per pet ID as each request completes
+        """
+        return run_bulk(self.delete_pet, pet_ids, max_workers)
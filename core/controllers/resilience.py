@@ -0,0 +1,204 @@
+"""
+Timeouts, retries and request hedging for API controllers.
+
+build_retry() configures urllib3 to retry idempotent requests on connection
+errors, read timeouts and transient statuses with jittered exponential backoff.
+HedgePolicy cuts tail latency of GETs: when the first attempt has not answered
+after the endpoint's recent p95 latency, a duplicate request is fired and
+whichever response arrives first is used.
+"""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+import requests
+from urllib3.util.retry import Retry
+from core.controllers.bulk import DEFAULT_BULK_WORKERS
+from core.metrics import percentile as latency_percentile
+
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 30.0
+DEFAULT_RETRIES = 3
+DEFAULT_RETRY_BACKOFF = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def build_retry(
+    retries: int = DEFAULT_RETRIES, backoff: float = DEFAULT_RETRY_BACKOFF
+) -> Retry:
+    """
+    Build the urllib3 retry policy for idempotent requests
+
+    Args:
+        retries: Max retries per request (0 disables retrying)
+        backoff: Backoff factor; waits backoff * 2**(n-1) seconds plus up to
+            the same amount of random jitter before retry n
+
+    Returns:
+        Retry to pass as max_retries to an HTTPAdapter
+    """
+    return Retry(
+        total=retries,
+        backoff_factor=backoff,
+        backoff_jitter=backoff,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=IDEMPOTENT_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+@dataclass
+class HedgeStats:
+    """Thread-safe hedging counters."""
+
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+        }
+
+
+class HedgePolicy:
+    """Fires a duplicate GET once the first attempt is slower than the recent p95."""
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        default_delay: float = 1.0,
+        min_delay: float = 0.05,
+        min_samples: int = 20,
+        window: int = 200,
+        max_workers: int = 2 * DEFAULT_BULK_WORKERS,
+    ):
+        """
+        Initialize the hedging policy
+
+        Args:
+            percentile: Latency percentile of the endpoint after which to hedge
+            default_delay: Hedge delay in seconds until min_samples latencies are known
+            min_delay: Lower bound of the hedge delay in seconds
+            min_samples: Latencies needed before the percentile is trusted
+            window: Recent latencies kept per endpoint
+            max_workers: Max attempts in flight across all hedged requests
+        """
+        self.percentile = percentile
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.stats = HedgeStats()
+        self._latencies: dict[str, deque[float]] = {}
+        self._window = window
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hedge"
+        )
+
+    def delay_for(self, endpoint: str) -> float:
+        """
+        Seconds to wait for the first attempt before hedging
+
+        Args:
+            endpoint: Endpoint key, e.g. "GET /pet/{petId}"
+
+        Returns:
+            The endpoint's recent latency percentile, or default_delay
+        """
+        with self._lock:
+            samples = list(self._latencies.get(endpoint, ()))
+        if len(samples) < self.min_samples:
+            return self.default_delay
+        return max(latency_percentile(samples, self.percentile), self.min_delay)
+
+    def observe(self, endpoint: str, latency: float) -> None:
+        """Add a latency sample of an endpoint."""
+        with self._lock:
+            self._latencies.setdefault(endpoint, deque(maxlen=self._window)).append(
+                latency
+            )
+
+    def call(
+        self, send: Callable[[], requests.Response], endpoint: str
+    ) -> requests.Response:
+        """
+        Send a request, hedging it if the first attempt is slow
+
+        Args:
+            send: Sends the request and returns the response
+            endpoint: Endpoint key used for the latency percentile
+
+        Returns:
+            The first response that arrived without raising
+        """
+        self.stats.increment("requests")
+        started = time.perf_counter()
+        primary = self._submit(send)
+        # Only the primary is sampled, and whether or not it wins the race:
+        # sampling winners alone would pull the percentile, and so the hedge
+        # delay, down to the hedges' latency.
+        primary.add_done_callback(
+            lambda future: self._observe_attempt(future, endpoint, started)
+        )
+        done, _ = wait([primary], timeout=self.delay_for(endpoint))
+        if done:
+            return primary.result()
+
+        self.stats.increment("hedged")
+        hedge = self._submit(send)
+        pending = {primary, hedge}
+        error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = error or future.exception()
+                    continue
+                for loser in pending:
+                    loser.add_done_callback(_close_response)
+                if future is hedge:
+                    self.stats.increment("hedge_wins")
+                return future.result()
+        assert error is not None
+        raise error
+
+    def _submit(
+        self, send: Callable[[], requests.Response]
+    ) -> Future[requests.Response]:
+        """Run an attempt in a copy of the caller's context (e.g. its test)."""
+        return self._executor.submit(contextvars.copy_context().run, send)
+
+    def _observe_attempt(
+        self, future: Future[requests.Response], endpoint: str, started: float
+    ) -> None:
+        """Sample the latency of a finished attempt; a failure is a lower bound."""
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            self.observe(endpoint, time.perf_counter() - started)
+        else:
+            self.observe(endpoint, future.result().elapsed.total_seconds())
+
+    def close(self) -> None:
+        """Stop the hedging thread pool."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _close_response(future: Future) -> None:
+    """Release the connection of a hedged attempt that lost the race."""
+    if future.exception() is None:
+        future.result().close()
@@ -0,0 +1,175 @@
+"""
+In-memory cache for idempotent GET responses.
+
+ResponseCache keeps successful GET responses keyed by URL, query params and
+the auth-relevant request headers for a fixed TTL, evicting the least recently used entry once max_entries is
+reached. Controllers invalidate entries themselves when they modify the
+resource, so a cached read never outlives a write made through the controller.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from requests import Response
+
+DEFAULT_CACHE_TTL = 30.0
+DEFAULT_CACHE_SIZE = 256
+
+# Headers that identify the caller; requests differing in them never share entries
+AUTH_HEADERS = frozenset({"api_key", "authorization", "cookie"})
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...], tuple[tuple[str, str], ...]]
+
+
+@dataclass
+class CacheStats:
+    """Thread-safe response cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache (0.0 - 1.0)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class ResponseCache:
+    """Thread-safe TTL + LRU cache of GET responses."""
+
+    def __init__(
+        self, ttl: float = DEFAULT_CACHE_TTL, max_entries: int = DEFAULT_CACHE_SIZE
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            ttl: Seconds a response stays fresh
+            max_entries: Max cached responses before LRU eviction
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: OrderedDict[CacheKey, tuple[float, Response]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(
+        url: str, params: Mapping | None = None, headers: Mapping | None = None
+    ) -> CacheKey:
+        """
+        Build the cache key of a request
+
+        Args:
+            url: Absolute request URL
+            params: Query params; list values are expanded like requests does
+            headers: Request headers; the AUTH_HEADERS among them are part of
+                the key, so controllers sharing the cache with different
+                credentials never read each other's responses
+
+        Returns:
+            Hashable key independent of param and header order
+        """
+        items: list[tuple[str, str]] = []
+        for name, value in (params or {}).items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            items.extend((str(name), str(v)) for v in values)
+        auth = [
+            (name.lower(), str(value))
+            for name, value in (headers or {}).items()
+            if name.lower() in AUTH_HEADERS
+        ]
+        return url, tuple(sorted(items)), tuple(sorted(auth))
+
+    def get(self, key: CacheKey) -> Response | None:
+        """
+        Return a fresh cached response and mark it recently used
+
+        Args:
+            key: Key from ResponseCache.key()
+
+        Returns:
+            The cached response, or None on a miss or expired entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                self.stats.increment("expired")
+                entry = None
+            if entry is None:
+                self.stats.increment("misses")
+                return None
+            self._entries.move_to_end(key)
+        self.stats.increment("hits")
+        return entry[1]
+
+    def put(self, key: CacheKey, response: Response) -> None:
+        """
+        Cache a response, evicting the least recently used entries if full
+
+        Args:
+            key: Key from ResponseCache.key()
+            response: Response whose body has been read
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.increment("evictions")
+
+    def invalidate(self, url: str) -> None:
+        """
+        Drop every cached response of a URL, whatever its params
+
+        Args:
+            url: Absolute request URL
+        """
+        self._drop(lambda cached_url: cached_url == url)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """
+        Drop every cached response whose URL starts with prefix
+
+        Args:
+            prefix: URL prefix, e.g. the findByStatus endpoint
+        """
+        self._drop(lambda cached_url: cached_url.startswith(prefix))
+
+    def _drop(self, matches: Callable[[str], bool]) -> None:
+        with self._lock:
+            stale = [key for key in self._entries if matches(key[0])]
+            for key in stale:
+                del self._entries[key]
+        if stale:
+            self.stats.increment("invalidations", len(stale))
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,167 @@
+"""
+Worker-wide cache of Pet Store login sessions.
+
+A /user/login returns a session token in its message ("logged in user
+session:1234567890") and the token's expiry in the X-Expires-After header.
+SessionCache keeps one LoginSession per username, so tests that need an
+authenticated user reuse it instead of logging in again. A session is
+refreshed when it is within refresh_margin seconds of expiring, or when the
+caller reports that the API rejected it.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from requests import Response
+
+DEFAULT_SESSION_TTL = 3600.0
+DEFAULT_REFRESH_MARGIN = 60.0
+
+SESSION_TOKEN_PREFIX = "logged in user session:"
+EXPIRES_AFTER_FORMAT = "%a %b %d %H:%M:%S UTC %Y"
+
+
+@dataclass
+class LoginSession:
+    """A logged-in user's session token and when it expires."""
+
+    username: str
+    token: str
+    expires_at: float
+    rate_limit: int | None = None
+
+    def expires_in(self) -> float:
+        """Seconds until the session expires (negative once expired)."""
+        return self.expires_at - time.time()
+
+    @classmethod
+    def from_response(cls, username: str, response: Response) -> "LoginSession":
+        """
+        Build the session from a /user/login response
+
+        Args:
+            username: User that logged in
+            response: Successful login response
+
+        Returns:
+            LoginSession; the expiry defaults to DEFAULT_SESSION_TTL from now
+            when X-Expires-After is missing or unreadable
+        """
+        message = response.json().get("message", "")
+        token = message.split(SESSION_TOKEN_PREFIX, 1)[-1].strip()
+
+        expires_at = time.time() + DEFAULT_SESSION_TTL
+        expires_after = response.headers.get("X-Expires-After")
+        if expires_after:
+            try:
+                expires_at = (
+                    datetime.strptime(expires_after, EXPIRES_AFTER_FORMAT)
+                    .replace(tzinfo=timezone.utc)
+                    .timestamp()
+                )
+            except ValueError:
+                pass
+
+        rate_limit = response.headers.get("X-Rate-Limit")
+        return cls(
+            username=username,
+            token=token,
+            expires_at=expires_at,
+            rate_limit=int(rate_limit) if rate_limit else None,
+        )
+
+
+@dataclass
+class SessionCacheStats:
+    """Thread-safe login session cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    rejected: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of session lookups served from the cache (0.0 - 1.0)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "rejected": self.rejected,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class SessionCache:
+    """Thread-safe login sessions keyed by username."""
+
+    def __init__(self, refresh_margin: float = DEFAULT_REFRESH_MARGIN):
+        """
+        Initialize the cache
+
+        Args:
+            refresh_margin: Refresh sessions expiring within this many seconds
+        """
+        self.refresh_margin = refresh_margin
+        self.stats = SessionCacheStats()
+        self._sessions: dict[str, LoginSession] = {}
+        self._user_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get_or_login(
+        self, username: str, login: Callable[[], LoginSession]
+    ) -> LoginSession:
+        """
+        Return the user's cached session, logging in when there is none or it
+        is about to expire
+
+        Concurrent callers for the same user wait for a single login.
+
+        Args:
+            username: User to get a session for
+            login: Performs the login and returns the new session
+
+        Returns:
+            A session valid for at least refresh_margin seconds
+        """
+        with self._lock:
+            user_lock = self._user_locks.setdefault(username, threading.Lock())
+
+        with user_lock:
+            session = self._sessions.get(username)
+            if session is not None and session.expires_in() > self.refresh_margin:
+                self.stats.increment("hits")
+                return session
+
+            self.stats.increment("misses")
+            if session is not None:
+                self.stats.increment("refreshes")
+            session = login()
+            self._sessions[username] = session
+            return session
+
+    def reject(self, username: str) -> None:
+        """Drop a session the API rejected, so the next lookup logs in again."""
+        self.stats.increment("rejected")
+        self.invalidate(username)
+
+    def invalidate(self, username: str) -> None:
+        """Drop the user's session."""
+        with self._lock:
+            self._sessions.pop(username, None)
+
+    def clear(self) -> None:
+        """Drop every session."""
+        with self._lock:
+            self._sessions.clear()
@@ -0,0 +1,139 @@
+import requests
+from collections.abc import Iterable, Iterator
+from pydantic import TypeAdapter
+from core.controllers.bulk import DEFAULT_BULK_WORKERS, BulkResult, run_bulk
+from core.controllers.pet_store_controller import PetStoreController
+from core.schemas.pet_store_store import (
+    PetStoreDeleteOrderResponse,
+    PetStoreInventory,
+    PetStoreOrderRequest,
+    PetStoreOrderResponse,
+)
+
+_INVENTORY_ADAPTER: TypeAdapter[dict[str, int]] = TypeAdapter(dict[str, int])
+
+
+class StoreController:
+    """Controller for the Pet Store /store endpoints (orders and inventory)"""
+
+    def __init__(self, pet_store: PetStoreController):
+        """
+        Initialize the store client
+
+        Requests go through the given controller's session, so the store
+        client shares its connection pool, api_key and HTTP metrics.
+
+        Args:
+            pet_store: Controller to send requests through
+        """
+        self.pet_store = pet_store
+
+    @property
+    def base_url(self) -> str:
+        return self.pet_store.BASE_URL
+
+    @property
+    def session(self) -> requests.Session:
+        return self.pet_store.session
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"api_key": self.pet_store.api_key}
+
+    def place_order(self, order: PetStoreOrderRequest) -> PetStoreOrderResponse:
+        """
+        Place an order for a pet
+
+        Args:
+            order: PetStoreOrderRequest object containing order details
+
+        Returns:
+            PetStoreOrderResponse containing the placed order
+        """
+        url = f"{self.base_url}/store/order"
+        response = self.session.post(
+            url, data=order.model_dump_json(exclude_none=True), headers=self.headers
+        )
+        response.raise_for_status()
+        return PetStoreOrderResponse.from_response(response)
+
+    def get_order_by_id(self, order_id: int) -> PetStoreOrderResponse:
+        """
+        Find purchase order by ID
+
+        Args:
+            order_id: ID of the order to return
+
+        Returns:
+            PetStoreOrderResponse containing the order details
+        """
+        url = f"{self.base_url}/store/order/{order_id}"
+        response = self.session.get(url, headers=self.headers)
+        response.raise_for_status()
+        return PetStoreOrderResponse.from_response(response)
+
+    def delete_order(self, order_id: int) -> PetStoreDeleteOrderResponse:
+        """
+        Delete purchase order by ID
+
+        Args:
+            order_id: ID of the order to delete
+
+        Returns:
+            PetStoreDeleteOrderResponse with deletion response
+        """
+        url = f"{self.base_url}/store/order/{order_id}"
+        response = self.session.delete(url, headers=self.headers)
+        response.raise_for_status()
+        return PetStoreDeleteOrderResponse.from_response(response)
+
+    def get_inventory(self) -> PetStoreInventory:
+        """
+        Take a snapshot of pet inventories by status
+
+        The inventory is never served from the GET cache, so consecutive
+        snapshots can be compared with PetStoreInventory.delta().
+
+        Returns:
+            PetStoreInventory with the count of pets per status
+        """
+        url = f"{self.base_url}/store/inventory"
+        response = self.session.get(url, headers=self.headers)
+        response.raise_for_status()
+        counts = _INVENTORY_ADAPTER.validate_json(response.content)
+        return PetStoreInventory.model_construct(counts=counts)
+
+    # Bulk Operations
+
+    def place_orders(
+        self,
+        orders: Iterable[PetStoreOrderRequest],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> Iterator[BulkResult[PetStoreOrderRequest, PetStoreOrderResponse]]:
+        """
+        Place many orders concurrently
+
+        Args:
+            orders: PetStoreOrderRequest objects to place
+            max_workers: Max requests in flight (keep at or below the pool size)
+
+        Yields:
+            BulkResult per order as each request completes; failed orders carry
+            the exception in BulkResult.error instead of failing the batch
+        """
+        return run_bulk(self.place_order, orders, max_workers)
+
+    def delete_orders(
+        self, order_ids: Iterable[int], max_workers: int = DEFAULT_BULK_WORKERS
+    ) -> Iterator[BulkResult[int, PetStoreDeleteOrderResponse]]:
+        """
+        Delete many orders concurrently
+
+        Args:
+            order_ids: IDs of the orders to delete
+            max_workers: Max requests in flight
+
+        Yields:
+            BulkResult per order as each request completes
+        """
+        return run_bulk(self.delete_order, order_ids, max_workers)
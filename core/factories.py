@@ -0,0 +1,246 @@
+"""
+Seeded factories for Pet Store request models.
+
+The random work is done once: a DataPools instance pre-generates columns of
+names, emails, phones, categories, tag lists and statuses from its seed. A
+factory then reads a batch of rows from every column (column c advances by its
+own stride, so consecutive models get different combinations) and zips them
+into models, drawing no random numbers per field. IDs for the batch are
+reserved with one id_allocator call. Nested categories and tags are built once
+per pool and shared, so pydantic's compiled validation of each model stays
+cheap; for these small models it is faster than model_construct().
+
+The same seed always yields the same content. IDs and usernames still come
+from the global id_allocator, so they never collide between tests or workers:
+
+    pets = PetFactory(seed=42).build_batch(10_000, status="pending")
+    user = UserFactory(seed=42).build(firstName="Ada")
+"""
+
+import random
+from typing import TypeVar
+from core.id_allocator import id_allocator
+from core.schemas.pet_store_pet import Category, PetStoreAddPetRequest, Tag
+from core.schemas.pet_store_user_creation import PetStoreUserCreateRequest
+
+DEFAULT_POOL_SIZE = 1021  # prime, so every stride below visits each value
+
+FIRST_NAMES = [
+    "Ada", "Alan", "Anita", "Barbara", "Brian", "Carla", "Dennis", "Edsger",
+    "Frances", "Grace", "Guido", "Hedy", "Ivan", "Joan", "Ken", "Linus",
+    "Margaret", "Niklaus", "Radia", "Tim",
+]  # fmt: skip
+LAST_NAMES = [
+    "Allen", "Backus", "Cerf", "Dijkstra", "Hamilton", "Hopper", "Kay",
+    "Knuth", "Lamarr", "Liskov", "Lovelace", "McCarthy", "Perlman", "Ritchie",
+    "Rossum", "Stroustrup", "Thompson", "Torvalds", "Turing", "Wirth",
+]  # fmt: skip
+PET_NAMES = [
+    "Bella", "Buddy", "Charlie", "Coco", "Daisy", "Felix", "Luna", "Max",
+    "Milo", "Nala", "Oliver", "Oscar", "Pepper", "Rex", "Rocky", "Simba",
+    "Sophie", "Toby", "Whiskers", "Ziggy",
+]  # fmt: skip
+CATEGORIES = ["Dogs", "Cats", "Birds", "Fish", "Reptiles", "Rabbits"]
+TAG_NAMES = ["friendly", "playful", "calm", "trained", "young", "senior", "vaccinated"]
+PET_STATUSES = ["available", "pending", "sold"]
+EMAIL_DOMAINS = ["example.com", "example.org", "example.net"]
+
+T = TypeVar("T")
+
+# Column strides, all coprime with DEFAULT_POOL_SIZE
+_STRIDES = (1, 3, 7, 11, 13, 17, 19)
+
+
+class DataPools:
+    """Columns of pre-generated field values drawn from one seed."""
+
+    def __init__(self, seed: int, size: int = DEFAULT_POOL_SIZE):
+        """
+        Generate the columns
+
+        Args:
+            seed: Seed of every column; equal seeds give equal columns
+            size: Values per column
+        """
+        rng = random.Random(seed)
+        self.seed = seed
+        self.size = size
+
+        first_names = rng.choices(FIRST_NAMES, k=size)
+        last_names = rng.choices(LAST_NAMES, k=size)
+        self.first_names = first_names
+        self.last_names = last_names
+        self.emails = [
+            f"{first.lower()}.{last.lower()}{n}@{rng.choice(EMAIL_DOMAINS)}"
+            for n, (first, last) in enumerate(zip(first_names, last_names))
+        ]
+        self.phones = [f"555-{rng.randrange(10**7):07d}" for _ in range(size)]
+        self.passwords = [f"pw-{rng.getrandbits(48):012x}" for _ in range(size)]
+        self.pet_names = [
+            f"{name} {rng.randrange(1000)}" for name in rng.choices(PET_NAMES, k=size)
+        ]
+        categories = [
+            Category.model_construct(id=n, name=name)
+            for n, name in enumerate(CATEGORIES, start=1)
+        ]
+        self.categories = rng.choices(categories, k=size)
+        tags = [
+            Tag.model_construct(id=n, name=name)
+            for n, name in enumerate(TAG_NAMES, start=1)
+        ]
+        self.tag_lists = [
+            tuple(rng.sample(tags, rng.randint(0, 3))) for _ in range(size)
+        ]
+        self.photo_urls = [
+            f"https://example.com/photos/{rng.getrandbits(32):08x}.jpg"
+            for _ in range(size)
+        ]
+        self.pet_statuses = rng.choices(PET_STATUSES, k=size)
+
+    def take(self, values: list[T], column: int, first_row: int, count: int) -> list[T]:
+        """
+        Read count rows of a column; columns advance with different strides
+
+        Args:
+            values: One of the pre-generated columns
+            column: Column number, selects the stride and offset
+            first_row: Row to start at
+            count: Rows to read
+
+        Returns:
+            The column's values for rows first_row .. first_row + count - 1
+        """
+        stride = _STRIDES[column % len(_STRIDES)]
+        size = self.size
+        return [
+            values[(row * stride + column) % size]
+            for row in range(first_row, first_row + count)
+        ]
+
+
+class PetFactory:
+    """Builds PetStoreAddPetRequest models from seeded columns."""
+
+    def __init__(self, seed: int = 0, pools: DataPools | None = None):
+        """
+        Initialize the factory
+
+        Args:
+            seed: Seed of the generated content
+            pools: Pre-generated columns to share (defaults to new pools for seed)
+        """
+        self.pools = pools or DataPools(seed)
+        self._row = 0
+
+    def build(self, **overrides) -> PetStoreAddPetRequest:
+        """
+        Build the next pet
+
+        Args:
+            **overrides: Field values to use instead of generated ones
+
+        Returns:
+            PetStoreAddPetRequest with a unique id
+        """
+        return self.build_batch(1, **overrides)[0]
+
+    def build_batch(self, count: int, **overrides) -> list[PetStoreAddPetRequest]:
+        """
+        Build many pets
+
+        Args:
+            count: Number of pets
+            **overrides: Field values shared by every pet
+
+        Returns:
+            List of PetStoreAddPetRequest with unique ids
+        """
+        pools, row = self.pools, self._row
+        self._row += count
+        columns = zip(
+            id_allocator.next_ids(count),
+            pools.take(pools.pet_names, 0, row, count),
+            pools.take(pools.categories, 1, row, count),
+            pools.take(pools.photo_urls, 2, row, count),
+            pools.take(pools.tag_lists, 3, row, count),
+            pools.take(pools.pet_statuses, 4, row, count),
+        )
+        return [
+            PetStoreAddPetRequest(
+                **{
+                    "id": pet_id,
+                    "name": name,
+                    "category": category,
+                    "photoUrls": [photo_url],
+                    "tags": list(tags),
+                    "status": status,
+                    **overrides,
+                }
+            )
+            for pet_id, name, category, photo_url, tags, status in columns
+        ]
+
+
+class UserFactory:
+    """Builds PetStoreUserCreateRequest models from seeded columns."""
+
+    def __init__(self, seed: int = 0, pools: DataPools | None = None):
+        """
+        Initialize the factory
+
+        Args:
+            seed: Seed of the generated content
+            pools: Pre-generated columns to share (defaults to new pools for seed)
+        """
+        self.pools = pools or DataPools(seed)
+        self._row = 0
+
+    def build(self, **overrides) -> PetStoreUserCreateRequest:
+        """
+        Build the next user
+
+        Args:
+            **overrides: Field values to use instead of generated ones
+
+        Returns:
+            PetStoreUserCreateRequest with a unique id and username
+        """
+        return self.build_batch(1, **overrides)[0]
+
+    def build_batch(self, count: int, **overrides) -> list[PetStoreUserCreateRequest]:
+        """
+        Build many users
+
+        Args:
+            count: Number of users
+            **overrides: Field values shared by every user
+
+        Returns:
+            List of PetStoreUserCreateRequest with unique ids and usernames
+        """
+        pools, row = self.pools, self._row
+        self._row += count
+        columns = zip(
+            id_allocator.next_ids(count),
+            pools.take(pools.first_names, 0, row, count),
+            pools.take(pools.last_names, 0, row, count),
+            pools.take(pools.emails, 0, row, count),
+            pools.take(pools.passwords, 1, row, count),
+            pools.take(pools.phones, 2, row, count),
+        )
+        return [
+            PetStoreUserCreateRequest(
+                **{
+                    "id": user_id,
+                    "username": id_allocator.username_for(user_id),
+                    "firstName": first_name,
+                    "lastName": last_name,
+                    "email": email,
+                    "password": password,
+                    "phone": phone,
+                    "userStatus": 1,
+                    **overrides,
+                }
+            )
+            for user_id, first_name, last_name, email, password, phone in columns
+        ]
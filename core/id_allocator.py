@@ -0,0 +1,127 @@
+"""
+Collision-free IDs and usernames for API test data.
+
+Every ID is composed of three bit fields, so no two allocators ever hand out
+the same value and no coordination with other workers or builds is needed:
+
+    | run (22 bits) | worker (10 bits) | sequence (30 bits) |
+
+The run field comes from TEST_RUN_ID (e.g. the CI build number) or, when it is
+not set, from the xdist test run UID shared by all workers of a run, or a
+random value. The worker field is the xdist worker index (gw3 -> 3) and the
+sequence counts allocations within the worker, so every test gets fresh values.
+
+The request schemas use the global id_allocator as their default factory:
+
+    pet = PetStoreAddPetRequest(name="Buddy", photoUrls=[])  # pet.id allocated
+"""
+
+import hashlib
+import os
+import re
+import threading
+import uuid
+
+RUN_BITS = 22
+WORKER_BITS = 10
+SEQUENCE_BITS = 30
+
+
+class IdAllocator:
+    """Thread-safe allocator of IDs from this run's and worker's partition."""
+
+    def __init__(self, run_id: int | None = None, worker_index: int | None = None):
+        """
+        Initialize the allocator
+
+        Args:
+            run_id: Run partition (defaults to the TEST_RUN_ID / xdist run UID /
+                random value, resolved on first use)
+            worker_index: Worker partition (defaults to the xdist worker index,
+                resolved on first use)
+        """
+        self._run_id = run_id
+        self._worker_index = worker_index
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    @property
+    def run_id(self) -> int:
+        """Run partition of the IDs handed out."""
+        if self._run_id is None:
+            raw = os.getenv("TEST_RUN_ID") or os.getenv("PYTEST_XDIST_TESTRUNUID")
+            seed = hashlib.sha1(raw.encode()).digest() if raw else uuid.uuid4().bytes
+            self._run_id = int.from_bytes(seed[:8], "big") % (1 << RUN_BITS)
+        return self._run_id
+
+    @property
+    def worker_index(self) -> int:
+        """Worker partition of the IDs handed out."""
+        if self._worker_index is None:
+            match = re.search(r"\d+", os.getenv("PYTEST_XDIST_WORKER", ""))
+            self._worker_index = int(match.group()) if match else 0
+            if self._worker_index >= 1 << WORKER_BITS:
+                raise ValueError(
+                    f"Worker index {self._worker_index} exceeds the "
+                    f"{1 << WORKER_BITS} worker partitions"
+                )
+        return self._worker_index
+
+    def next_id(self) -> int:
+        """
+        Allocate the next unique ID
+
+        Returns:
+            Positive integer that fits in a signed 64-bit field
+        """
+        return self.next_ids(1)[0]
+
+    def next_ids(self, count: int) -> range:
+        """
+        Allocate a block of consecutive unique IDs under a single lock
+
+        Args:
+            count: Number of IDs
+
+        Returns:
+            Range of the allocated IDs
+        """
+        with self._lock:
+            first = self._sequence + 1
+            self._sequence += count
+            last = self._sequence
+        if last >= 1 << SEQUENCE_BITS:
+            raise OverflowError("ID sequence of this worker is exhausted")
+        prefix = (self.run_id << (WORKER_BITS + SEQUENCE_BITS)) | (
+            self.worker_index << SEQUENCE_BITS
+        )
+        return range(prefix | first, (prefix | last) + 1)
+
+    def username(self, prefix: str = "user") -> str:
+        """
+        Allocate a unique username
+
+        Args:
+            prefix: Readable prefix of the name
+
+        Returns:
+            Name such as "user_2f1a9c_gw3_17"
+        """
+        return self.username_for(self.next_id(), prefix)
+
+    def username_for(self, allocated: int, prefix: str = "user") -> str:
+        """
+        Format the unique username of an ID allocated by this allocator
+
+        Args:
+            allocated: ID from next_id() or next_ids()
+            prefix: Readable prefix of the name
+
+        Returns:
+            Name such as "user_2f1a9c_gw3_17"
+        """
+        sequence = allocated & ((1 << SEQUENCE_BITS) - 1)
+        return f"{prefix}_{self.run_id:x}_gw{self.worker_index}_{sequence}"
+
+
+id_allocator = IdAllocator()
@@ -0,0 +1,394 @@
+"""
+Load generation on top of the Pet Store controllers and the request schemas.
+
+LoadRunner executes weighted scenarios (login, add/get/delete pet, place
+order, ...) for a fixed duration, either as an open model at a target arrival
+rate (requests are started on schedule whether or not earlier ones finished,
+and latency is measured from the scheduled start so queueing is not hidden) or
+as a closed model with a fixed number of concurrent virtual users. The LoadReport holds
+latency percentiles, throughput and an error breakdown per scenario.
+
+CLI:
+    python -m core.load_runner --scenario login=1 --scenario add_get_delete_pet=3 \\
+        --rps 20 --duration 60 --output load_report.json
+
+Pytest:
+    @pytest.mark.load(scenarios={"login": 1, "add_get_delete_pet": 3}, rps=20, duration=30)
+    def test_pet_store_under_load(load_report): ...
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+import requests
+from core.controllers.connection_pool import PooledHTTPAdapter
+from core.controllers.pet_store_controller import PetStoreController
+from core.controllers.store_controller import StoreController
+from core.controllers.resilience import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    build_retry,
+)
+from core.id_allocator import id_allocator
+from core.metrics import LatencyHistogram
+from core.schemas.pet_store_login import PetStoreLoginRequest
+from core.schemas.pet_store_pet import PetStoreAddPetRequest
+from core.schemas.pet_store_store import PetStoreOrderRequest
+from core.schemas.pet_store_user_creation import PetStoreUserCreateRequest
+
+LOAD_PERCENTILES = (50, 90, 95, 99)
+DEFAULT_MAX_IN_FLIGHT = 50
+
+ScenarioFunc = Callable[[PetStoreController], None]
+
+
+def login(controller: PetStoreController) -> None:
+    controller.login(
+        PetStoreLoginRequest(username=id_allocator.username(), password="load-test")
+    )
+
+
+def add_get_delete_pet(controller: PetStoreController) -> None:
+    pet = controller.add_pet(
+        PetStoreAddPetRequest(name="load-test", photoUrls=[], status="available")
+    )
+    assert pet.id is not None
+    controller.get_pet_by_id(pet.id)
+    controller.delete_pet(pet.id)
+
+
+def find_pets_by_status(controller: PetStoreController) -> None:
+    controller.find_pets_by_status("sold")
+
+
+def place_order(controller: PetStoreController) -> None:
+    store = StoreController(controller)
+    order = store.place_order(PetStoreOrderRequest(petId=id_allocator.next_id()))
+    store.delete_order(order.id)
+
+
+def create_and_delete_user(controller: PetStoreController) -> None:
+    user = PetStoreUserCreateRequest(
+        firstName="Load",
+        lastName="Test",
+        email="load@example.com",
+        password="load-test",
+        phone="000",
+        userStatus=1,
+    )
+    controller.create_user(user)
+    controller.delete_user(user.username)
+
+
+SCENARIOS: dict[str, ScenarioFunc] = {
+    "login": login,
+    "add_get_delete_pet": add_get_delete_pet,
+    "find_pets_by_status": find_pets_by_status,
+    "place_order": place_order,
+    "create_and_delete_user": create_and_delete_user,
+}
+
+
+@dataclass
+class LoadProfile:
+    """How much load to generate and for how long."""
+
+    duration: float
+    rps: float | None = None
+    concurrency: int | None = None
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    poisson: bool = True
+
+    def __post_init__(self) -> None:
+        if (self.rps is None) == (self.concurrency is None):
+            raise ValueError("Set exactly one of rps (open model) or concurrency")
+
+
+def _error_kind(error: BaseException) -> str:
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return f"HTTP {error.response.status_code}"
+    return type(error).__name__
+
+
+@dataclass
+class LoadReport:
+    """
+    Thread-safe results of a load run.
+
+    Latencies and service times are kept per scenario in fixed-size
+    LatencyHistograms, so memory does not grow with rate or duration;
+    percentiles are accurate to one bucket width.
+    """
+
+    profile: LoadProfile
+    latencies: dict[str, LatencyHistogram] = field(default_factory=dict)
+    service_times: dict[str, LatencyHistogram] = field(default_factory=dict)
+    errors: Counter = field(default_factory=Counter)
+    dropped: int = 0
+    elapsed: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(
+        self,
+        scenario: str,
+        latency: float,
+        service_time: float,
+        error: BaseException | None,
+    ) -> None:
+        with self._lock:
+            if scenario not in self.latencies:
+                self.latencies[scenario] = LatencyHistogram()
+                self.service_times[scenario] = LatencyHistogram()
+            self.latencies[scenario].record(latency)
+            self.service_times[scenario].record(service_time)
+            if error is not None:
+                self.errors[f"{scenario}: {_error_kind(error)}"] += 1
+
+    def record_dropped(self) -> None:
+        with self._lock:
+            self.dropped += 1
+
+    @property
+    def completed(self) -> int:
+        return sum(histogram.count for histogram in self.latencies.values())
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    @property
+    def error_rate(self) -> float:
+        return self.error_count / self.completed if self.completed else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Completed scenarios per second."""
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> dict:
+        all_latencies = LatencyHistogram()
+        for histogram in self.latencies.values():
+            all_latencies.merge(histogram)
+        return {
+            "profile": {
+                "duration": self.profile.duration,
+                "rps": self.profile.rps,
+                "concurrency": self.profile.concurrency,
+                "max_in_flight": self.profile.max_in_flight,
+            },
+            "elapsed": round(self.elapsed, 3),
+            "completed": self.completed,
+            "dropped": self.dropped,
+            "throughput": round(self.throughput, 2),
+            "error_rate": round(self.error_rate, 4),
+            "latency": all_latencies.summary(LOAD_PERCENTILES),
+            "scenarios": {
+                name: {
+                    "latency": histogram.summary(LOAD_PERCENTILES),
+                    "service_time": self.service_times[name].summary(LOAD_PERCENTILES),
+                }
+                for name, histogram in sorted(self.latencies.items())
+            },
+            "errors": dict(self.errors.most_common()),
+        }
+
+
+class LoadRunner:
+    """Runs weighted scenarios against a Pet Store controller."""
+
+    def __init__(
+        self,
+        controller: PetStoreController,
+        scenarios: Mapping[str, float],
+        profile: LoadProfile,
+        seed: int | None = None,
+    ):
+        """
+        Initialize the load runner
+
+        Args:
+            controller: Controller to send requests through; its pool should
+                allow at least max_in_flight (or concurrency) connections
+            scenarios: Scenario name (see SCENARIOS) to relative weight
+            profile: Load shape and duration
+            seed: Seed of scenario selection and arrival times
+        """
+        unknown = [name for name in scenarios if name not in SCENARIOS]
+        if unknown:
+            raise ValueError(
+                f"Unknown scenarios: {', '.join(unknown)}. "
+                f"Expected any of: {', '.join(SCENARIOS)}"
+            )
+        self.controller = controller
+        self.names = list(scenarios)
+        self.weights = [scenarios[name] for name in self.names]
+        self.profile = profile
+        self._rng = random.Random(seed)
+
+    def run(self) -> LoadReport:
+        """
+        Generate load for the profile's duration
+
+        Returns:
+            LoadReport of the run
+        """
+        report = LoadReport(self.profile)
+        started = time.perf_counter()
+        if self.profile.rps is not None:
+            self._run_open(report, started)
+        else:
+            self._run_closed(report, started)
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def _pick(self) -> str:
+        return self._rng.choices(self.names, self.weights)[0]
+
+    def _execute(self, name: str, scheduled: float, report: LoadReport) -> None:
+        started = time.perf_counter()
+        error: BaseException | None = None
+        try:
+            SCENARIOS[name](self.controller)
+        except Exception as e:
+            error = e
+        finished = time.perf_counter()
+        report.record(name, finished - scheduled, finished - started, error)
+
+    def _run_open(self, report: LoadReport, started: float) -> None:
+        """Start scenarios on an arrival schedule, independent of completions."""
+        assert self.profile.rps is not None
+        rps = self.profile.rps
+        end = started + self.profile.duration
+        slots = threading.BoundedSemaphore(self.profile.max_in_flight)
+
+        def execute(name: str, scheduled: float) -> None:
+            try:
+                self._execute(name, scheduled, report)
+            finally:
+                slots.release()
+
+        with ThreadPoolExecutor(
+            max_workers=self.profile.max_in_flight, thread_name_prefix="load"
+        ) as executor:
+            scheduled = started
+            while scheduled < end:
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                if slots.acquire(blocking=False):
+                    executor.submit(execute, self._pick(), scheduled)
+                else:
+                    report.record_dropped()
+                scheduled += (
+                    self._rng.expovariate(rps) if self.profile.poisson else 1 / rps
+                )
+
+    def _run_closed(self, report: LoadReport, started: float) -> None:
+        """Run a fixed number of virtual users back to back."""
+        assert self.profile.concurrency is not None
+        end = started + self.profile.duration
+        pick_lock = threading.Lock()
+
+        def virtual_user() -> None:
+            while time.perf_counter() < end:
+                with pick_lock:
+                    name = self._pick()
+                self._execute(name, time.perf_counter(), report)
+
+        with ThreadPoolExecutor(
+            max_workers=self.profile.concurrency, thread_name_prefix="load"
+        ) as executor:
+            for _ in range(self.profile.concurrency):
+                executor.submit(virtual_user)
+
+
+def build_load_controller(
+    base_url: str | None = None, pool_size: int = DEFAULT_MAX_IN_FLIGHT
+) -> PetStoreController:
+    """
+    Build a controller sized for load generation
+
+    Calls are not recorded in the HTTP metrics: LoadReport measures latency
+    itself, and per-call recording would only add overhead to every request.
+
+    Args:
+        base_url: API root (defaults to PET_STORE_BASE_URL or the public Pet Store)
+        pool_size: Connections kept open
+
+    Returns:
+        PetStoreController
+    """
+    adapter = PooledHTTPAdapter(
+        pool_size=pool_size,
+        timeout=(DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT),
+        max_retries=build_retry(retries=0),
+    )
+    return PetStoreController(adapter=adapter, base_url=base_url, record_metrics=False)
+
+
+def _parse_scenarios(values: list[str]) -> dict[str, float]:
+    scenarios = {}
+    for value in values:
+        name, _, weight = value.partition("=")
+        scenarios[name] = float(weight or 1)
+    return scenarios
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate load on the Pet Store API")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        default=[],
+        help=f"name[=weight], repeatable; one of: {', '.join(SCENARIOS)}",
+    )
+    model = parser.add_mutually_exclusive_group(required=True)
+    model.add_argument("--rps", type=float, help="Open model arrival rate")
+    model.add_argument("--concurrency", type=int, help="Closed model virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds")
+    parser.add_argument("--max-in-flight", type=int, default=DEFAULT_MAX_IN_FLIGHT)
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--offline", action="store_true", help="Target a local stub")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", type=Path, default=None, help="JSON report path")
+    args = parser.parse_args()
+
+    profile = LoadProfile(
+        duration=args.duration,
+        rps=args.rps,
+        concurrency=args.concurrency,
+        max_in_flight=args.max_in_flight,
+    )
+    scenarios = _parse_scenarios(args.scenario) or {name: 1 for name in SCENARIOS}
+    pool_size = max(args.max_in_flight, args.concurrency or 0)
+
+    stub = None
+    base_url = args.base_url
+    if args.offline:
+        from core.stubs.pet_store_stub_server import PetStoreStubServer, StubConfig
+
+        stub = PetStoreStubServer(StubConfig.from_env()).start()
+        base_url = stub.base_url
+
+    try:
+        controller = build_load_controller(base_url, pool_size)
+        report = LoadRunner(controller, scenarios, profile, args.seed).run().to_dict()
+    finally:
+        if stub is not None:
+            stub.stop()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
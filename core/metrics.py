@@ -0,0 +1,138 @@
+"""
+Small statistics helpers shared by the framework's timing and HTTP metrics.
+"""
+
+import math
+from collections.abc import Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Compute a percentile using the nearest-rank method.
+
+    Args:
+        values: Sample values (need not be sorted)
+        pct: Percentile to compute, between 0 and 100
+
+    Returns:
+        The percentile value, or 0.0 for an empty sample
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(
+    values: Sequence[float], percentiles: Sequence[int] = (50, 95)
+) -> dict[str, float]:
+    """
+    Summarize a sample as count, requested percentiles and max.
+
+    Args:
+        values: Sample values
+        percentiles: Percentiles to include, e.g. (50, 95, 99)
+
+    Returns:
+        Dictionary such as {"count": 3, "p50": ..., "p95": ..., "max": ...}
+    """
+    summary: dict[str, float] = {"count": len(values)}
+    for pct in percentiles:
+        summary[f"p{pct}"] = round(percentile(values, pct), 6)
+    summary["max"] = round(max(values), 6) if values else 0.0
+    return summary
+
+
+class LatencyHistogram:
+    """
+    Fixed-size histogram of latencies in log-spaced buckets.
+
+    Memory does not grow with the number of samples. Percentiles are read from
+    the bucket boundaries, so they are accurate to one bucket width (about 12%
+    with the default 20 buckets per decade); count and max are exact. Not
+    thread-safe: the owner serializes record() and merge().
+    """
+
+    def __init__(
+        self,
+        min_value: float = 1e-4,
+        max_value: float = 600.0,
+        buckets_per_decade: int = 20,
+    ):
+        """
+        Initialize an empty histogram
+
+        Args:
+            min_value: Upper bound of the first bucket (seconds)
+            max_value: Values above this share the last bucket (seconds)
+            buckets_per_decade: Resolution; more buckets give tighter percentiles
+        """
+        self.min_value = min_value
+        self.buckets_per_decade = buckets_per_decade
+        decades = math.log10(max_value / min_value)
+        self.buckets = [0] * (math.ceil(decades * buckets_per_decade) + 2)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def _index(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        index = math.ceil(math.log10(value / self.min_value) * self.buckets_per_decade)
+        return min(index, len(self.buckets) - 1)
+
+    def _upper_bound(self, index: int) -> float:
+        return self.min_value * 10 ** (index / self.buckets_per_decade)
+
+    def record(self, value: float) -> None:
+        """Add a sample."""
+        self.buckets[self._index(value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram with the same bucket layout to this one."""
+        for index, count in enumerate(other.buckets):
+            self.buckets[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, pct: float) -> float:
+        """
+        Estimate a percentile (nearest rank)
+
+        Args:
+            pct: Percentile to compute, between 0 and 100
+
+        Returns:
+            Upper bound of the bucket holding the percentile, capped at the
+            largest sample, or 0.0 for an empty histogram
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100 * self.count))
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+    def summary(self, percentiles: Sequence[int] = (50, 95)) -> dict[str, float]:
+        """
+        Summarize like summarize(): count, requested percentiles and max
+
+        Args:
+            percentiles: Percentiles to include, e.g. (50, 95, 99)
+
+        Returns:
+            Dictionary such as {"count": 3, "p50": ..., "p95": ..., "max": ...}
+        """
+        summary: dict[str, float] = {"count": self.count}
+        for pct in percentiles:
+            summary[f"p{pct}"] = round(self.percentile(pct), 6)
+        summary["max"] = round(self.max, 6)
+        return summary
@@ -0,0 +1,57 @@
+"""
+Shared base for API response schemas.
+
+Responses are validated straight from the raw body bytes (pydantic-core parses
+JSON bytes natively), skipping the bytes -> str decode that response.text
+costs on every call. Validators are built once per class: the model's own
+core validator by pydantic, and the list[Model] TypeAdapter for array
+endpoints lazily on first use.
+"""
+
+from typing import Protocol, Self
+from pydantic import BaseModel, TypeAdapter
+
+_LIST_ADAPTERS: dict[type[BaseModel], TypeAdapter] = {}
+
+
+class RawResponse(Protocol):
+    """Any HTTP response exposing its undecoded body (requests or httpx)."""
+
+    @property
+    def content(self) -> bytes: ...
+
+
+class BaseResponseModel(BaseModel):
+    """Base class for models parsed from HTTP response bodies"""
+
+    @classmethod
+    def from_response(cls, response: RawResponse) -> Self:
+        """Create the model from an HTTP response
+
+        Args:
+            response: requests.Response or httpx.Response with a JSON object body
+
+        Returns:
+            Validated model instance
+        """
+        return cls.model_validate_json(response.content)
+
+    @classmethod
+    def list_adapter(cls) -> TypeAdapter[list[Self]]:
+        """Cached TypeAdapter validating a JSON array of this model"""
+        adapter = _LIST_ADAPTERS.get(cls)
+        if adapter is None:
+            adapter = _LIST_ADAPTERS[cls] = TypeAdapter(list[cls])  # type: ignore[valid-type]
+        return adapter
+
+    @classmethod
+    def list_from_response(cls, response: RawResponse) -> list[Self]:
+        """Create a list of models from an HTTP response with a JSON array body
+
+        Args:
+            response: requests.Response or httpx.Response
+
+        Returns:
+            Validated model instances
+        """
+        return cls.list_adapter().validate_json(response.content)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from requests import Response
+from core.schemas.base_response import BaseResponseModel
 
 
 class PetStoreLoginRequest(BaseModel):
@@ -7,19 +7,7 @@ class PetStoreLoginRequest(BaseModel):
     password: str = Field(..., description="The password for login")
 
 
-class PetStoreLoginResponse(BaseModel):
+class PetStoreLoginResponse(BaseResponseModel):
     code: int = Field(..., description="Response code")
     type: str = Field(..., description="Response type")
     message: str = Field(..., description="Response message")
-
-    @classmethod
-    def from_response(cls, response: Response) -> "PetStoreLoginResponse":
-        """Create a PetStoreLoginResponse from a requests.Response object
-
-        Args:
-            response: The requests.Response object
-
-        Returns:
-            PetStoreLoginResponse instance
-        """
-        return cls.model_validate_json(response.text)
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
-from requests import Response
+from core.id_allocator import id_allocator
+from core.schemas.base_response import BaseResponseModel
 from typing import Optional
 
 
@@ -21,7 +22,8 @@ class PetStoreAddPetRequest(BaseModel):
     """Request model for adding a new pet to the store"""
 
     id: Optional[int] = Field(
-        None, description="Pet ID (auto-generated if not provided)"
+        default_factory=id_allocator.next_id,
+        description="Pet ID (allocated from the test run's ID partition if not provided)",
     )
     category: Optional[Category] = Field(None, description="Pet category")
     name: str = Field(..., description="Pet name")
@@ -32,7 +34,7 @@ class PetStoreAddPetRequest(BaseModel):
     )
 
 
-class PetStoreAddPetResponse(BaseModel):
+class PetStoreAddPetResponse(BaseResponseModel):
     """Response model for adding a new pet"""
 
     id: int = Field(..., description="Pet ID")
@@ -42,13 +44,8 @@ class PetStoreAddPetResponse(BaseModel):
     tags: Optional[list[Tag]] = Field(None, description="Array of tags")
     status: str = Field(..., description="Pet status")
 
-    @classmethod
-    def from_response(cls, response: Response) -> "PetStoreAddPetResponse":
-        """Create response model from requests.Response object"""
-        return cls.model_validate_json(response.text)
 
-
-class PetStoreGetPetResponse(BaseModel):
+class PetStoreGetPetResponse(BaseResponseModel):
     """Response model for getting a pet by ID"""
 
     id: int = Field(..., description="Pet ID")
@@ -58,20 +55,20 @@ class PetStoreGetPetResponse(BaseModel):
     tags: Optional[list[Tag]] = Field(None, description="Array of tags")
     status: str = Field(..., description="Pet status")
 
-    @classmethod
-    def from_response(cls, response: Response) -> "PetStoreGetPetResponse":
-        """Create response model from requests.Response object"""
-        return cls.model_validate_json(response.text)
-
 
-class PetStoreDeletePetResponse(BaseModel):
+class PetStoreDeletePetResponse(BaseResponseModel):
     """Response model for deleting a pet"""
 
     code: int = Field(..., description="Response code")
     type: str = Field(..., description="Response type")
     message: str = Field(..., description="Response message")
 
-    @classmethod
-    def from_response(cls, response: Response) -> "PetStoreDeletePetResponse":
-        """Create response model from requests.Response object"""
-        return cls.model_validate_json(response.text)
+
+class PetStoreUploadImageResponse(BaseResponseModel):
+    """Response model for uploading a pet image"""
+
+    code: int = Field(..., description="Response code")
+    type: str = Field(..., description="Response type")
+    message: str = Field(
+        ..., description="Upload details, including the stored file size"
+    )
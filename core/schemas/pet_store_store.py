@@ -0,0 +1,63 @@
+from datetime import datetime
+from pydantic import BaseModel, Field
+from core.id_allocator import id_allocator
+from core.schemas.base_response import BaseResponseModel
+from typing import Optional
+
+
+class PetStoreOrderRequest(BaseModel):
+    """Request model for placing an order for a pet"""
+
+    id: int = Field(
+        default_factory=id_allocator.next_id,
+        description="Order ID (allocated from the test run's ID partition if not provided)",
+    )
+    petId: int = Field(..., description="ID of the pet being ordered")
+    quantity: int = Field(1, description="Number of pets in the order")
+    shipDate: Optional[datetime] = Field(None, description="Estimated ship date")
+    status: str = Field(
+        "placed", description="Order status: placed, approved, or delivered"
+    )
+    complete: bool = Field(False, description="Whether the order is complete")
+
+
+class PetStoreOrderResponse(BaseResponseModel):
+    """Response model for a placed or fetched order"""
+
+    id: int = Field(..., description="Order ID")
+    petId: int = Field(..., description="ID of the pet being ordered")
+    quantity: int = Field(..., description="Number of pets in the order")
+    shipDate: Optional[datetime] = Field(None, description="Estimated ship date")
+    status: Optional[str] = Field(None, description="Order status")
+    complete: bool = Field(..., description="Whether the order is complete")
+
+
+class PetStoreDeleteOrderResponse(BaseResponseModel):
+    """Response model for deleting an order"""
+
+    code: int = Field(..., description="Response code")
+    type: str = Field(..., description="Response type")
+    message: str = Field(..., description="Deleted order ID")
+
+
+class PetStoreInventory(BaseModel):
+    """Pet counts per status, as returned by /store/inventory at one point in time"""
+
+    counts: dict[str, int] = Field(..., description="Number of pets per status")
+
+    def delta(self, before: "PetStoreInventory") -> dict[str, int]:
+        """Change per status since an earlier snapshot, in one pass over both
+
+        Args:
+            before: Earlier inventory snapshot
+
+        Returns:
+            Status to count difference; statuses whose count did not change
+            are left out
+        """
+        deltas = {}
+        for status in self.counts.keys() | before.counts.keys():
+            change = self.counts.get(status, 0) - before.counts.get(status, 0)
+            if change:
+                deltas[status] = change
+        return deltas
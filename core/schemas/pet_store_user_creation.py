@@ -1,10 +1,17 @@
 from pydantic import BaseModel, Field
-from requests import Response
+from core.id_allocator import id_allocator
+from core.schemas.base_response import BaseResponseModel
 
 
 class PetStoreUserCreateRequest(BaseModel):
-    id: int = Field(..., description="Unique identifier for the user")
-    username: str = Field(..., description="The username for the user")
+    id: int = Field(
+        default_factory=id_allocator.next_id,
+        description="Unique identifier for the user",
+    )
+    username: str = Field(
+        default_factory=id_allocator.username,
+        description="The username for the user",
+    )
     firstName: str = Field(..., description="The first name of the user")
     lastName: str = Field(..., description="The last name of the user")
     email: str = Field(..., description="The email address of the user")
@@ -13,19 +20,27 @@ class PetStoreUserCreateRequest(BaseModel):
     userStatus: int = Field(..., description="The status of the user")
 
 
-class PetStoreUserCreateResponse(BaseModel):
+class PetStoreUserCreateResponse(BaseResponseModel):
     code: int = Field(..., description="Response code")
     type: str = Field(..., description="Response type")
     message: str = Field(..., description="Response message")
 
-    @classmethod
-    def from_response(cls, response: Response) -> "PetStoreUserCreateResponse":
-        """Create a PetStoreUserCreateResponse from a requests.Response object
 
-        Args:
-            response: The requests.Response object
+class PetStoreDeleteUserResponse(BaseResponseModel):
+    """Response model for deleting a user"""
 
-        Returns:
-            PetStoreUserCreateResponse instance
-        """
-        return cls.model_validate_json(response.text)
+    code: int = Field(..., description="Response code")
+    type: str = Field(..., description="Response type")
+    message: str = Field(..., description="Deleted username")
+
+
+class PetStoreBatchUserCreateResponse(BaseModel):
+    """Client-side aggregate of a chunked createWithList/createWithArray batch"""
+
+    total_users: int = Field(..., description="Number of users submitted")
+    created_users: int = Field(..., description="Users in chunks the API accepted")
+    chunks: int = Field(..., description="Number of chunk requests sent")
+    failed_chunks: int = Field(..., description="Chunk requests that failed")
+    errors: list[str] = Field(
+        default_factory=list, description="Error message of each failed chunk"
+    )
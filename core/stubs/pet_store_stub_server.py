@@ -0,0 +1,532 @@
+"""
+In-process stand-in for the public Swagger Pet Store API.
+
+PetStoreStubServer implements the pet, store and user endpoints documented in
+contexts/product_context_docs/pet_store*.md on a local threaded HTTP server
+with in-memory state, so the API suite can run hermetically. Latency can be
+drawn from a configurable distribution and a share of requests can fail or
+hang, which makes the stub usable for timeout and retry benchmarks as well.
+
+Usage:
+    with PetStoreStubServer(StubConfig(latency=Latency.parse("lognormal:40,0.5"))) as stub:
+        controller = PetStoreController(base_url=stub.base_url)
+
+Standalone:
+    python -m core.stubs.pet_store_stub_server --port 8080 --error-rate 0.05
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from email.message import Message
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlsplit
+
+API_PREFIX = "/v2"
+
+
+@dataclass(frozen=True)
+class Latency:
+    """Response latency distribution (milliseconds)."""
+
+    kind: str = "fixed"
+    params: tuple[float, ...] = (0.0,)
+
+    @classmethod
+    def fixed(cls, ms: float) -> "Latency":
+        return cls("fixed", (ms,))
+
+    @classmethod
+    def uniform(cls, low_ms: float, high_ms: float) -> "Latency":
+        return cls("uniform", (low_ms, high_ms))
+
+    @classmethod
+    def lognormal(cls, median_ms: float, sigma: float) -> "Latency":
+        """Heavy-tailed latency with the given median and log-space sigma."""
+        return cls("lognormal", (median_ms, sigma))
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        """
+        Parse a latency spec such as "fixed:50", "uniform:10,200" or "lognormal:80,0.6".
+
+        Args:
+            spec: "<kind>:<comma separated params>"
+
+        Returns:
+            Latency distribution
+        """
+        kind, _, raw_params = spec.partition(":")
+        params = tuple(float(p) for p in raw_params.split(",") if p)
+        factories: dict[str, Callable[..., Latency]] = {
+            "fixed": cls.fixed,
+            "uniform": cls.uniform,
+            "lognormal": cls.lognormal,
+        }
+        if kind not in factories:
+            raise ValueError(f"Unknown latency distribution: {kind}")
+        return factories[kind](*params)
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds."""
+        if self.kind == "uniform":
+            ms = rng.uniform(*self.params)
+        elif self.kind == "lognormal":
+            median, sigma = self.params
+            ms = rng.lognormvariate(math.log(median), sigma) if median > 0 else 0.0
+        else:
+            ms = self.params[0]
+        return max(ms, 0.0) / 1000
+
+
+@dataclass
+class StubConfig:
+    """Latency and fault injection settings of the stub server."""
+
+    latency: Latency = field(default_factory=Latency)
+    error_rate: float = 0.0
+    error_status: int = 500
+    hang_rate: float = 0.0
+    hang_seconds: float = 30.0
+    seed: int | None = None
+
+    @classmethod
+    def from_env(cls) -> "StubConfig":
+        """Build the config from PET_STORE_STUB_* environment variables."""
+        seed = os.getenv("PET_STORE_STUB_SEED")
+        return cls(
+            latency=Latency.parse(os.getenv("PET_STORE_STUB_LATENCY", "fixed:0")),
+            error_rate=float(os.getenv("PET_STORE_STUB_ERROR_RATE", 0)),
+            hang_rate=float(os.getenv("PET_STORE_STUB_HANG_RATE", 0)),
+            seed=int(seed) if seed else None,
+        )
+
+
+class PetStoreState:
+    """Thread-safe in-memory pets, orders and users."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.pets: dict[int, dict] = {}
+        self.orders: dict[int, dict] = {}
+        self.users: dict[str, dict] = {}
+        self._next_id = 1_000_000
+
+    def next_id(self) -> int:
+        with self.lock:
+            self._next_id += 1
+            return self._next_id
+
+
+def _message(code: int, message: str, type_: str = "unknown") -> dict:
+    return {"code": code, "type": type_, "message": message}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Routes Pet Store requests to the stub server's handlers."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+    server: "_StubHTTPServer"
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PUT(self) -> None:
+        self._dispatch("PUT")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep test output quiet."""
+
+    def _dispatch(self, method: str) -> None:
+        stub = self.server.stub
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        stub.apply_faults_delay()
+        fault = stub.draw_fault()
+        if fault is not None:
+            self._send(fault, _message(fault, "something bad happened"))
+            return
+
+        path = url.path[len(API_PREFIX) :] if url.path.startswith(API_PREFIX) else ""
+        query = parse_qs(url.query)
+        for route_method, pattern, handler in stub.routes:
+            match = pattern.fullmatch(path)
+            if route_method == method and match:
+                try:
+                    status, payload, headers = handler(
+                        body=body,
+                        query=query,
+                        content_type=self.headers.get("Content-Type", ""),
+                        **match.groupdict(),
+                    )
+                except (ValueError, KeyError, TypeError):
+                    status, payload, headers = (
+                        400,
+                        _message(400, "bad input", "error"),
+                        {},
+                    )
+                self._send(status, payload, headers)
+                return
+
+        self._send(404, _message(404, f"{method} {url.path} not found", "error"))
+
+    def _send(self, status: int, payload: Any, headers: dict | None = None) -> None:
+        data = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if self.close_connection:
+            # Announce the close so clients drop the connection instead of pooling it
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "PetStoreStubServer"
+
+
+Handler = Callable[..., tuple[int, Any, dict]]
+
+
+class PetStoreStubServer:
+    """Local Pet Store API stand-in with latency and fault injection."""
+
+    def __init__(
+        self, config: StubConfig | None = None, host: str = "127.0.0.1", port: int = 0
+    ):
+        """
+        Initialize the stub server (call start() or use it as a context manager)
+
+        Args:
+            config: Latency and fault injection settings
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.config = config or StubConfig()
+        self.state = PetStoreState()
+        self._rng = random.Random(self.config.seed)
+        self._rng_lock = threading.Lock()
+        self._httpd = _StubHTTPServer((host, port), _StubHandler)
+        self._httpd.stub = self
+        self._thread: threading.Thread | None = None
+        self.routes: list[tuple[str, re.Pattern, Handler]] = [
+            ("POST", re.compile(r"/pet"), self._add_pet),
+            ("PUT", re.compile(r"/pet"), self._update_pet),
+            ("GET", re.compile(r"/pet/findByStatus"), self._find_by_status),
+            ("GET", re.compile(r"/pet/findByTags"), self._find_by_tags),
+            ("GET", re.compile(r"/pet/(?P<pet_id>-?\d+)"), self._get_pet),
+            ("POST", re.compile(r"/pet/(?P<pet_id>-?\d+)"), self._update_pet_form),
+            ("DELETE", re.compile(r"/pet/(?P<pet_id>-?\d+)"), self._delete_pet),
+            (
+                "POST",
+                re.compile(r"/pet/(?P<pet_id>-?\d+)/uploadImage"),
+                self._upload_image,
+            ),
+            ("GET", re.compile(r"/store/inventory"), self._inventory),
+            ("POST", re.compile(r"/store/order"), self._place_order),
+            ("GET", re.compile(r"/store/order/(?P<order_id>-?\d+)"), self._get_order),
+            (
+                "DELETE",
+                re.compile(r"/store/order/(?P<order_id>-?\d+)"),
+                self._delete_order,
+            ),
+            ("POST", re.compile(r"/user"), self._create_user),
+            (
+                "POST",
+                re.compile(r"/user/createWith(?:List|Array)"),
+                self._create_users,
+            ),
+            ("GET", re.compile(r"/user/login"), self._login),
+            ("GET", re.compile(r"/user/logout"), self._logout),
+            ("GET", re.compile(r"/user/(?P<username>[^/]+)"), self._get_user),
+            ("PUT", re.compile(r"/user/(?P<username>[^/]+)"), self._update_user),
+            ("DELETE", re.compile(r"/user/(?P<username>[^/]+)"), self._delete_user),
+        ]
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to point PetStoreController at."""
+        host, port = self._httpd.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def start(self) -> "PetStoreStubServer":
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="pet-store-stub", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "PetStoreStubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    # Fault injection
+
+    def _random(self) -> float:
+        with self._rng_lock:
+            return self._rng.random()
+
+    def apply_faults_delay(self) -> None:
+        """Sleep for a sampled latency, or hang for hang_seconds at hang_rate."""
+        if self.config.hang_rate and self._random() < self.config.hang_rate:
+            time.sleep(self.config.hang_seconds)
+            return
+        with self._rng_lock:
+            delay = self.config.latency.sample(self._rng)
+        if delay:
+            time.sleep(delay)
+
+    def draw_fault(self) -> int | None:
+        """Return an error status for this request at error_rate, else None."""
+        if self.config.error_rate and self._random() < self.config.error_rate:
+            return self.config.error_status
+        return None
+
+    # Pet endpoints
+
+    def _store_pet(self, pet: dict) -> dict:
+        if not pet.get("id"):
+            pet["id"] = self.state.next_id()
+        pet.setdefault("photoUrls", [])
+        pet.setdefault("tags", [])
+        pet.setdefault("status", "available")
+        with self.state.lock:
+            self.state.pets[int(pet["id"])] = pet
+        return pet
+
+    def _add_pet(self, body: bytes, **_: Any):
+        return 200, self._store_pet(json.loads(body)), {}
+
+    def _update_pet(self, body: bytes, **_: Any):
+        pet = json.loads(body)
+        with self.state.lock:
+            exists = int(pet.get("id") or 0) in self.state.pets
+        if not exists:
+            return 404, _message(1, "Pet not found", "error"), {}
+        return 200, self._store_pet(pet), {}
+
+    def _find_pets(self, predicate: Callable[[dict], bool]) -> list[dict]:
+        with self.state.lock:
+            return [pet for pet in self.state.pets.values() if predicate(pet)]
+
+    def _find_by_status(self, query: dict, **_: Any):
+        statuses = set(query.get("status", []))
+        return 200, self._find_pets(lambda pet: pet.get("status") in statuses), {}
+
+    def _find_by_tags(self, query: dict, **_: Any):
+        tags = set(query.get("tags", []))
+        return (
+            200,
+            self._find_pets(
+                lambda pet: any(t.get("name") in tags for t in pet.get("tags") or [])
+            ),
+            {},
+        )
+
+    def _get_pet(self, pet_id: str, **_: Any):
+        with self.state.lock:
+            pet = self.state.pets.get(int(pet_id))
+        if pet is None:
+            return 404, _message(1, "Pet not found", "error"), {}
+        return 200, pet, {}
+
+    def _update_pet_form(self, pet_id: str, body: bytes, **_: Any):
+        form = parse_qs(body.decode())
+        with self.state.lock:
+            pet = self.state.pets.get(int(pet_id))
+            if pet is None:
+                return 404, _message(404, "not found"), {}
+            for key in ("name", "status"):
+                if key in form:
+                    pet[key] = form[key][0]
+        return 200, _message(200, pet_id), {}
+
+    def _delete_pet(self, pet_id: str, **_: Any):
+        with self.state.lock:
+            pet = self.state.pets.pop(int(pet_id), None)
+        if pet is None:
+            return 404, None, {}
+        return 200, _message(200, pet_id), {}
+
+    def _upload_image(self, pet_id: str, body: bytes, content_type: str, **_: Any):
+        message = BytesParser().parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + body
+        )
+        metadata = ""
+        file_name, file_size = "", 0
+        for part in message.get_payload():
+            if not isinstance(part, Message):
+                continue
+            name = part.get_param("name", header="content-disposition")
+            payload = part.get_payload(decode=True)
+            if not isinstance(payload, bytes):
+                payload = b""
+            if name == "additionalMetadata":
+                metadata = payload.decode()
+            elif name == "file":
+                file_name = part.get_filename() or "upload"
+                file_size = len(payload)
+        return (
+            200,
+            _message(
+                200,
+                f"additionalMetadata: {metadata}\n"
+                f"File uploaded to ./{file_name}, {file_size} bytes",
+            ),
+            {},
+        )
+
+    # Store endpoints
+
+    def _inventory(self, **_: Any):
+        counts: dict[str, int] = {}
+        with self.state.lock:
+            for pet in self.state.pets.values():
+                status = pet.get("status") or "unknown"
+                counts[status] = counts.get(status, 0) + 1
+        return 200, counts, {}
+
+    def _place_order(self, body: bytes, **_: Any):
+        order = json.loads(body)
+        if not order.get("id"):
+            order["id"] = self.state.next_id()
+        order.setdefault("quantity", 0)
+        order.setdefault("status", "placed")
+        order.setdefault("complete", False)
+        with self.state.lock:
+            self.state.orders[int(order["id"])] = order
+        return 200, order, {}
+
+    def _get_order(self, order_id: str, **_: Any):
+        with self.state.lock:
+            order = self.state.orders.get(int(order_id))
+        if order is None:
+            return 404, _message(1, "Order not found", "error"), {}
+        return 200, order, {}
+
+    def _delete_order(self, order_id: str, **_: Any):
+        with self.state.lock:
+            order = self.state.orders.pop(int(order_id), None)
+        if order is None:
+            return 404, _message(404, "Order Not Found"), {}
+        return 200, _message(200, order_id), {}
+
+    # User endpoints
+
+    def _store_user(self, user: dict) -> dict:
+        if not user.get("id"):
+            user["id"] = self.state.next_id()
+        with self.state.lock:
+            self.state.users[user["username"]] = user
+        return user
+
+    def _create_user(self, body: bytes, **_: Any):
+        user = self._store_user(json.loads(body))
+        return 200, _message(200, str(user["id"])), {}
+
+    def _create_users(self, body: bytes, **_: Any):
+        users = json.loads(body)
+        if not isinstance(users, list):
+            return 500, _message(500, "something bad happened"), {}
+        for user in users:
+            self._store_user(user)
+        return 200, _message(200, "ok"), {}
+
+    def _login(self, query: dict, **_: Any):
+        if "username" not in query or "password" not in query:
+            return 400, _message(400, "Invalid username/password supplied"), {}
+        now = datetime.now(timezone.utc)
+        expires = now + timedelta(hours=1)
+        headers = {
+            "X-Rate-Limit": "5000",
+            "X-Expires-After": expires.strftime("%a %b %d %H:%M:%S UTC %Y"),
+        }
+        session = int(now.timestamp() * 1000)
+        return 200, _message(200, f"logged in user session:{session}"), headers
+
+    def _logout(self, **_: Any):
+        return 200, _message(200, "ok"), {}
+
+    def _get_user(self, username: str, **_: Any):
+        with self.state.lock:
+            user = self.state.users.get(username)
+        if user is None:
+            return 404, _message(1, "User not found", "error"), {}
+        return 200, user, {}
+
+    def _update_user(self, username: str, body: bytes, **_: Any):
+        user = json.loads(body)
+        with self.state.lock:
+            self.state.users.pop(username, None)
+        user = self._store_user(user)
+        return 200, _message(200, str(user["id"])), {}
+
+    def _delete_user(self, username: str, **_: Any):
+        with self.state.lock:
+            user = self.state.users.pop(username, None)
+        if user is None:
+            return 404, None, {}
+        return 200, _message(200, username), {}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the Pet Store stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", default="fixed:0", help="e.g. lognormal:80,0.6")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = StubConfig(
+        latency=Latency.parse(args.latency),
+        error_rate=args.error_rate,
+        hang_rate=args.hang_rate,
+        seed=args.seed,
+    )
+    server = PetStoreStubServer(config, host=args.host, port=args.port)
+    print(f"Pet Store stub listening on {server.base_url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
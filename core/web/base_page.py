@@ -1,9 +1,13 @@
-from playwright.sync_api import Page
+from playwright.sync_api import Locator, Page
+from core.web.instrumentation import InstrumentedMeta
+from core.web.self_healing import SelfHealingLocator, selector_healer
 
 
-class BasePage:
+class BasePage(metaclass=InstrumentedMeta):
     """Base page object providing common functionality for all pages."""
 
+    __untimed__ = ("page",)
+
     def __init__(self, page: Page, base_url: str):
         """Initialize the Base Page."""
         self._page: Page = page
@@ -32,3 +36,15 @@ class BasePage:
     def goto(self) -> None:
         """Navigate to the page's URL (alias for navigate_to_page)."""
         self.navigate_to_page()
+
+    def locate(self, locator: SelfHealingLocator) -> Locator:
+        """
+        Resolve a self-healing locator declared on the page object.
+
+        Args:
+            locator: Locator with ordered fallback strategies
+
+        Returns:
+            Locator: Playwright locator of the first strategy that matched
+        """
+        return selector_healer.resolve(self.page, type(self).__name__, locator)
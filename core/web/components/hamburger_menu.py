@@ -1,12 +1,15 @@
 from playwright.sync_api import Page
+from core.web.instrumentation import InstrumentedMeta
 
 
-class HamburgerMenu:
+class HamburgerMenu(metaclass=InstrumentedMeta):
     """
     Component object for the Hamburger Menu.
     Provides methods to interact with the hamburger menu and its items.
     """
 
+    __untimed__ = ("page",)
+
     OPEN_MENU_BUTTON: str = "OpenMenuButton"
     ALL_ITEMS_LINK: str = "AllItemsLink"
     ABOUT_LINK: str = "AboutLink"
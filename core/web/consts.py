@@ -3,6 +3,9 @@ class Pages:
     Inventory: str = "InventoryPage"
     Cart: str = "CartPage"
     Checkout: str = "CheckoutPage"
+    CheckoutStepOne: str = "CheckoutStepOnePage"
+    CheckoutStepTwo: str = "CheckoutStepTwoPage"
+    CheckoutComplete: str = "CheckoutCompletePage"
 
 
 class ComponentNames:
@@ -18,6 +21,26 @@ class PagesURL:
     CheckoutComplete: str = "/checkout-complete.html"
 
 
+class StorageKeys:
+    """Client-side storage keys SauceDemo uses to keep session and cart state."""
+
+    SESSION_COOKIE: str = "session-username"
+    CART_CONTENTS: str = "cart-contents"
+
+
+class InventoryItemIds:
+    """SauceDemo inventory item IDs (as stored in the cart) keyed by product name."""
+
+    BY_NAME: dict[str, int] = {
+        "Sauce Labs Backpack": 4,
+        "Sauce Labs Bike Light": 0,
+        "Sauce Labs Bolt T-Shirt": 1,
+        "Sauce Labs Fleece Jacket": 5,
+        "Sauce Labs Onesie": 2,
+        "Test.allTheThings() T-Shirt (Red)": 3,
+    }
+
+
 class Timeouts:
     """Timeout constants for various operations."""
 
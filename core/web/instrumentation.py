@@ -0,0 +1,156 @@
+"""
+Opt-in timing instrumentation for page and component objects.
+
+Classes created with InstrumentedMeta have every public method and property
+wrapped so that, while the global timing_recorder is enabled, each call records
+its wall time and the Allure step it ran under. When the recorder is disabled
+the wrappers call straight through.
+"""
+
+import functools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+from allure_commons import plugin_manager
+from allure_commons.model2 import TestStepResult
+from core.metrics import LatencyHistogram
+
+# Distinct Allure step names kept per method
+MAX_ALLURE_STEPS = 20
+
+
+@dataclass
+class MethodTiming:
+    """A single timed page-object call."""
+
+    name: str
+    wall_time: float
+    allure_step: str | None
+
+
+class _MethodStats:
+    """Aggregated timings of one page-object method."""
+
+    def __init__(self) -> None:
+        self.wall_time = LatencyHistogram()
+        self.allure_steps: set[str] = set()
+
+    def add(self, timing: MethodTiming) -> None:
+        self.wall_time.record(timing.wall_time)
+        if timing.allure_step and len(self.allure_steps) < MAX_ALLURE_STEPS:
+            self.allure_steps.add(timing.allure_step)
+
+
+class PageTimingRecorder:
+    """Thread-safe per-method aggregates of MethodTiming samples."""
+
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        self._methods: dict[str, _MethodStats] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        """Start recording page-object calls."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording page-object calls."""
+        self.enabled = False
+
+    def record(self, timing: MethodTiming) -> None:
+        """Add a timing sample to its method's aggregates."""
+        with self._lock:
+            stats = self._methods.get(timing.name)
+            if stats is None:
+                stats = self._methods[timing.name] = _MethodStats()
+            stats.add(timing)
+
+    @property
+    def count(self) -> int:
+        """Number of recorded samples."""
+        with self._lock:
+            return sum(stats.wall_time.count for stats in self._methods.values())
+
+    def histogram(self) -> dict[str, dict[str, Any]]:
+        """
+        Summarize recorded samples per method.
+
+        Returns:
+            Mapping of "Class.method" to count, p50, p95 and max wall time
+            (seconds) plus the Allure steps the method ran under
+        """
+        histogram: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            for name, stats in sorted(self._methods.items()):
+                summary: dict[str, Any] = stats.wall_time.summary()
+                summary["allure_steps"] = sorted(stats.allure_steps)
+                histogram[name] = summary
+        return histogram
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the per-method histogram for a JSON artifact."""
+        return {"histogram": self.histogram()}
+
+
+timing_recorder = PageTimingRecorder()
+
+
+def _current_allure_step() -> str | None:
+    """Return the name of the innermost running Allure step, if any."""
+    for plugin in plugin_manager.get_plugins():
+        allure_logger = getattr(plugin, "allure_logger", None)
+        if allure_logger is None:
+            continue
+        step = allure_logger.get_last_item(TestStepResult)
+        if step is not None:
+            return str(step.name)
+    return None
+
+
+def _timed(name: str, func: Callable) -> Callable:
+    """Wrap func so that each call is recorded under name while enabled."""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not timing_recorder.enabled:
+            return func(self, *args, **kwargs)
+
+        allure_step = _current_allure_step()
+        started = time.perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            timing_recorder.record(
+                MethodTiming(
+                    name=f"{type(self).__name__}.{name}",
+                    wall_time=time.perf_counter() - started,
+                    allure_step=allure_step,
+                )
+            )
+
+    return wrapper
+
+
+class InstrumentedMeta(type):
+    """
+    Metaclass that wraps public methods and properties with timing.
+
+    Attributes listed in a class's __untimed__ tuple are left unwrapped.
+    """
+
+    def __new__(mcs, name: str, bases: tuple, namespace: dict):
+        untimed = set(namespace.get("__untimed__", ()))
+        for base in bases:
+            untimed.update(getattr(base, "__untimed__", ()))
+
+        for attr, value in list(namespace.items()):
+            if attr.startswith("_") or attr in untimed:
+                continue
+            if isinstance(value, property) and value.fget is not None:
+                namespace[attr] = property(
+                    _timed(attr, value.fget), value.fset, value.fdel, value.__doc__
+                )
+            elif callable(value) and not isinstance(value, (type, staticmethod)):
+                namespace[attr] = _timed(attr, value)
+        return super().__new__(mcs, name, bases, namespace)
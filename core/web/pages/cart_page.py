@@ -1,6 +1,12 @@
 from playwright.sync_api import Page
 from core.web.base_page import BasePage
 from core.web.consts import PagesURL
+from core.web.self_healing import (
+    SelfHealingLocator,
+    by_css,
+    by_role,
+    by_test_id,
+)
 
 
 class CartPage(BasePage):
@@ -10,6 +16,29 @@ class CartPage(BasePage):
     adjust quantities, remove items, and proceed to checkout.
     """
 
+    REMOVE_BUTTON = SelfHealingLocator(
+        "remove_button",
+        by_test_id("remove-{slug}"),
+        by_css("#remove-{slug}"),
+    )
+    CONTINUE_SHOPPING_BUTTON = SelfHealingLocator(
+        "continue_shopping_button",
+        by_test_id("continue-shopping"),
+        by_role("button", "Continue Shopping"),
+        by_css("#continue-shopping"),
+    )
+    CHECKOUT_BUTTON = SelfHealingLocator(
+        "checkout_button",
+        by_test_id("checkout"),
+        by_role("button", "Checkout"),
+        by_css("#checkout"),
+    )
+    CART_LINK = SelfHealingLocator(
+        "cart_link",
+        by_test_id("shopping-cart-link"),
+        by_css(".shopping_cart_link"),
+    )
+
     def __init__(self, page: Page, base_url: str):
         """Initialize the Cart Page."""
         super().__init__(page, base_url)
@@ -87,9 +116,8 @@ class CartPage(BasePage):
         Args:
             product_name: Name of the product to remove
         """
-        # Convert product name to button ID format
-        button_id = f"remove-{product_name.lower().replace(' ', '-')}"
-        self.page.locator(f"#{button_id}").click()
+        slug = product_name.lower().replace(" ", "-")
+        self.locate(self.REMOVE_BUTTON.format(slug=slug)).click()
 
     def is_item_in_cart(self, product_name: str) -> bool:
         """Check if a product exists in the cart.
@@ -111,14 +139,14 @@ class CartPage(BasePage):
 
         Navigates back to the inventory page.
         """
-        self.page.get_by_role("button", name="Continue Shopping").click()
+        self.locate(self.CONTINUE_SHOPPING_BUTTON).click()
 
     def click_checkout(self) -> None:
         """Click the 'Checkout' button.
 
         Proceeds to checkout step one.
         """
-        self.page.get_by_role("button", name="Checkout").click()
+        self.locate(self.CHECKOUT_BUTTON).click()
 
     def calculate_total(self) -> float:
         """Calculate the total price of items in the cart.
@@ -168,7 +196,7 @@ class CartPage(BasePage):
 
     def click_cart_icon(self) -> None:
         """Navigate to cart page by clicking the cart icon."""
-        self.page.locator(".shopping_cart_link").click()
+        self.locate(self.CART_LINK).click()
 
     def goto(self) -> None:
         """Navigate to cart page directly."""
@@ -0,0 +1,62 @@
+from playwright.sync_api import Page
+from core.web.base_page import BasePage
+from core.web.consts import PagesURL
+from core.web.self_healing import (
+    SelfHealingLocator,
+    by_css,
+    by_role,
+    by_test_id,
+)
+
+
+class CheckoutCompletePage(BasePage):
+    """Page object for the Checkout: Complete! page.
+
+    Represents the final confirmation page shown after an order is placed.
+    """
+
+    BACK_HOME_BUTTON = SelfHealingLocator(
+        "back_home_button",
+        by_test_id("back-to-products"),
+        by_role("button", "Back Home"),
+        by_css("#back-to-products"),
+    )
+
+    def __init__(self, page: Page, base_url: str):
+        """Initialize the Checkout Complete Page."""
+        super().__init__(page, base_url)
+        self.url = PagesURL.CheckoutComplete
+
+    @property
+    def page_title(self) -> str:
+        """Get the page title text.
+
+        Returns:
+            str: The page title "Checkout: Complete!"
+        """
+        return self.page.locator(".title").text_content() or ""
+
+    @property
+    def complete_header(self) -> str:
+        """Get the confirmation header text.
+
+        Returns:
+            str: The header, e.g. "Thank you for your order!"
+        """
+        return self.page.locator(".complete-header").text_content() or ""
+
+    @property
+    def complete_text(self) -> str:
+        """Get the confirmation message body.
+
+        Returns:
+            str: The dispatch message text
+        """
+        return self.page.locator(".complete-text").text_content() or ""
+
+    def click_back_home(self) -> None:
+        """Click the 'Back Home' button.
+
+        Navigates back to the inventory page.
+        """
+        self.locate(self.BACK_HOME_BUTTON).click()
@@ -0,0 +1,106 @@
+from dataclasses import dataclass
+from playwright.sync_api import Page
+from core.web.base_page import BasePage
+from core.web.consts import PagesURL
+from core.web.self_healing import (
+    SelfHealingLocator,
+    by_css,
+    by_role,
+    by_test_id,
+)
+
+
+@dataclass(frozen=True)
+class CheckoutInformation:
+    """Customer details entered on checkout step one."""
+
+    first_name: str = "Test"
+    last_name: str = "User"
+    postal_code: str = "12345"
+
+
+class CheckoutStepOnePage(BasePage):
+    """Page object for the Checkout: Your Information page.
+
+    Represents the first checkout step where the customer enters
+    their first name, last name and postal code.
+    """
+
+    FIRST_NAME_INPUT = SelfHealingLocator(
+        "first_name_input",
+        by_test_id("firstName"),
+        by_role("textbox", "First Name"),
+        by_css("#first-name"),
+    )
+    LAST_NAME_INPUT = SelfHealingLocator(
+        "last_name_input",
+        by_test_id("lastName"),
+        by_role("textbox", "Last Name"),
+        by_css("#last-name"),
+    )
+    POSTAL_CODE_INPUT = SelfHealingLocator(
+        "postal_code_input",
+        by_test_id("postalCode"),
+        by_role("textbox", "Zip/Postal Code"),
+        by_css("#postal-code"),
+    )
+    CONTINUE_BUTTON = SelfHealingLocator(
+        "continue_button",
+        by_test_id("continue"),
+        by_role("button", "Continue"),
+        by_css("#continue"),
+    )
+    CANCEL_BUTTON = SelfHealingLocator(
+        "cancel_button",
+        by_test_id("cancel"),
+        by_role("button", "Cancel"),
+        by_css("#cancel"),
+    )
+
+    def __init__(self, page: Page, base_url: str):
+        """Initialize the Checkout Step One Page."""
+        super().__init__(page, base_url)
+        self.url = PagesURL.CheckoutStepOne
+
+    @property
+    def page_title(self) -> str:
+        """Get the page title text.
+
+        Returns:
+            str: The page title "Checkout: Your Information"
+        """
+        return self.page.locator(".title").text_content() or ""
+
+    @property
+    def error_message(self) -> str:
+        """Get the validation error message.
+
+        Returns:
+            str: The error message text, or empty string if no error is visible
+        """
+        error_element = self.page.locator("[data-test='error']")
+        return error_element.inner_text() if error_element.is_visible() else ""
+
+    def fill_information(self, information: CheckoutInformation) -> None:
+        """Fill the customer information form.
+
+        Args:
+            information: Customer details to enter
+        """
+        self.locate(self.FIRST_NAME_INPUT).fill(information.first_name)
+        self.locate(self.LAST_NAME_INPUT).fill(information.last_name)
+        self.locate(self.POSTAL_CODE_INPUT).fill(information.postal_code)
+
+    def click_continue(self) -> None:
+        """Click the 'Continue' button.
+
+        Proceeds to checkout step two when all fields are valid.
+        """
+        self.locate(self.CONTINUE_BUTTON).click()
+
+    def click_cancel(self) -> None:
+        """Click the 'Cancel' button.
+
+        Navigates back to the cart page.
+        """
+        self.locate(self.CANCEL_BUTTON).click()
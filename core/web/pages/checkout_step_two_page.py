@@ -0,0 +1,113 @@
+from playwright.sync_api import Page
+from core.web.base_page import BasePage
+from core.web.consts import PagesURL
+from core.web.self_healing import (
+    SelfHealingLocator,
+    by_css,
+    by_role,
+    by_test_id,
+)
+
+
+class CheckoutStepTwoPage(BasePage):
+    """Page object for the Checkout: Overview page.
+
+    Represents the second checkout step that summarizes the order
+    items, item total, tax and total before finishing the purchase.
+    """
+
+    FINISH_BUTTON = SelfHealingLocator(
+        "finish_button",
+        by_test_id("finish"),
+        by_role("button", "Finish"),
+        by_css("#finish"),
+    )
+    CANCEL_BUTTON = SelfHealingLocator(
+        "cancel_button",
+        by_test_id("cancel"),
+        by_role("button", "Cancel"),
+        by_css("#cancel"),
+    )
+
+    def __init__(self, page: Page, base_url: str):
+        """Initialize the Checkout Step Two Page."""
+        super().__init__(page, base_url)
+        self.url = PagesURL.CheckoutStepTwo
+
+    @property
+    def page_title(self) -> str:
+        """Get the page title text.
+
+        Returns:
+            str: The page title "Checkout: Overview"
+        """
+        return self.page.locator(".title").text_content() or ""
+
+    @property
+    def item_total(self) -> float:
+        """Get the item total (sum of item prices before tax).
+
+        Returns:
+            float: Item total amount
+        """
+        return self._read_amount(".summary_subtotal_label")
+
+    @property
+    def tax(self) -> float:
+        """Get the tax amount.
+
+        Returns:
+            float: Tax amount
+        """
+        return self._read_amount(".summary_tax_label")
+
+    @property
+    def total(self) -> float:
+        """Get the order total (item total plus tax).
+
+        Returns:
+            float: Total amount
+        """
+        return self._read_amount(".summary_total_label")
+
+    def get_item_names(self) -> list[str]:
+        """Get list of all product names in the order summary.
+
+        Returns:
+            list[str]: List of product names
+        """
+        return [
+            name.text_content() or ""
+            for name in self.page.locator(".inventory_item_name").all()
+        ]
+
+    def get_item_prices(self) -> list[float]:
+        """Get list of all product prices in the order summary.
+
+        Returns:
+            list[float]: List of prices as floats
+        """
+        price_texts = [
+            price.text_content() or "$0"
+            for price in self.page.locator(".inventory_item_price").all()
+        ]
+        return [float(price.replace("$", "")) for price in price_texts]
+
+    def click_finish(self) -> None:
+        """Click the 'Finish' button.
+
+        Completes the purchase and navigates to the checkout complete page.
+        """
+        self.locate(self.FINISH_BUTTON).click()
+
+    def click_cancel(self) -> None:
+        """Click the 'Cancel' button.
+
+        Navigates back to the inventory page.
+        """
+        self.locate(self.CANCEL_BUTTON).click()
+
+    def _read_amount(self, selector: str) -> float:
+        """Parse the dollar amount from a summary label such as 'Tax: $2.40'."""
+        label = self.page.locator(selector).text_content() or "$0"
+        return float(label.split("$")[-1])
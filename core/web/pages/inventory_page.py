@@ -1,11 +1,37 @@
 from playwright.sync_api import Page
 from core.web.base_page import BasePage
 from core.web.consts import PagesURL
+from core.web.self_healing import (
+    SelfHealingLocator,
+    by_css,
+    by_test_id,
+)
 
 
 class InventoryPage(BasePage):
     """Page object for the Inventory/Products page."""
 
+    ADD_TO_CART_BUTTON = SelfHealingLocator(
+        "add_to_cart_button",
+        by_test_id("add-to-cart-{slug}"),
+        by_css("#add-to-cart-{slug}"),
+    )
+    REMOVE_BUTTON = SelfHealingLocator(
+        "remove_button",
+        by_test_id("remove-{slug}"),
+        by_css("#remove-{slug}"),
+    )
+    SORT_DROPDOWN = SelfHealingLocator(
+        "sort_dropdown",
+        by_test_id("product-sort-container"),
+        by_css(".product_sort_container"),
+    )
+    CART_LINK = SelfHealingLocator(
+        "cart_link",
+        by_test_id("shopping-cart-link"),
+        by_css(".shopping_cart_link"),
+    )
+
     def __init__(self, page: Page, base_url: str):
         super().__init__(page, base_url)
         self.url = PagesURL.Inventory
@@ -33,9 +59,8 @@ class InventoryPage(BasePage):
         Args:
             product_name: Name of the product to add
         """
-        # Convert product name to button ID format
-        button_id = f"add-to-cart-{product_name.lower().replace(' ', '-')}"
-        self.page.locator(f"#{button_id}").click()
+        slug = product_name.lower().replace(" ", "-")
+        self.locate(self.ADD_TO_CART_BUTTON.format(slug=slug)).click()
 
     def remove_item_from_cart(self, product_name: str) -> None:
         """
@@ -44,9 +69,8 @@ class InventoryPage(BasePage):
         Args:
             product_name: Name of the product to remove
         """
-        # Convert product name to button ID format
-        button_id = f"remove-{product_name.lower().replace(' ', '-')}"
-        self.page.locator(f"#{button_id}").click()
+        slug = product_name.lower().replace(" ", "-")
+        self.locate(self.REMOVE_BUTTON.format(slug=slug)).click()
 
     def sort_products(self, sort_option: str) -> None:
         """
@@ -61,9 +85,7 @@ class InventoryPage(BasePage):
             "lohi": "Price (low to high)",
             "hilo": "Price (high to low)",
         }
-        self.page.locator(".product_sort_container").select_option(
-            sort_map[sort_option]
-        )
+        self.locate(self.SORT_DROPDOWN).select_option(sort_map[sort_option])
 
     def get_product_names(self) -> list[str]:
         """Get list of all product names in current order."""
@@ -95,4 +117,4 @@ class InventoryPage(BasePage):
 
     def click_cart_icon(self) -> None:
         """Navigate to cart page by clicking the cart icon."""
-        self.page.locator(".shopping_cart_link").click()
+        self.locate(self.CART_LINK).click()
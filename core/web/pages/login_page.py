@@ -1,6 +1,12 @@
 from playwright.sync_api import Page
 from core.web.base_page import BasePage
 from core.web.consts import PagesURL
+from core.web.self_healing import (
+    SelfHealingLocator,
+    by_css,
+    by_role,
+    by_test_id,
+)
 
 
 class LoginPage(BasePage):
@@ -9,6 +15,25 @@ class LoginPage(BasePage):
     Provides methods to interact with the login form and related elements.
     """
 
+    USERNAME_INPUT = SelfHealingLocator(
+        "username_input",
+        by_test_id("username"),
+        by_role("textbox", "Username"),
+        by_css("#user-name"),
+    )
+    PASSWORD_INPUT = SelfHealingLocator(
+        "password_input",
+        by_test_id("password"),
+        by_role("textbox", "Password"),
+        by_css("#password"),
+    )
+    LOGIN_BUTTON = SelfHealingLocator(
+        "login_button",
+        by_test_id("login-button"),
+        by_role("button", "Login"),
+        by_css("#login-button"),
+    )
+
     def __init__(self, page: Page, base_url: str):
         """Initialize the Login Page."""
         super().__init__(page, base_url)
@@ -33,6 +58,6 @@ class LoginPage(BasePage):
             username (str): The username to enter
             password (str): The password to enter
         """
-        self.page.get_by_role("textbox", name="Username").fill(username)
-        self.page.get_by_role("textbox", name="Password").fill(password)
-        self.page.get_by_role("button", name="Login").click()
+        self.locate(self.USERNAME_INPUT).fill(username)
+        self.locate(self.PASSWORD_INPUT).fill(password)
+        self.locate(self.LOGIN_BUTTON).click()
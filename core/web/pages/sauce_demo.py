@@ -1,9 +1,30 @@
+import json
+import uuid
+from collections.abc import Iterable
 from playwright.sync_api import Page
+from core.web.base_page import BasePage
+from core.web.consts import InventoryItemIds, PagesURL, StorageKeys
 from .login_page import LoginPage
 from .inventory_page import InventoryPage
 from .cart_page import CartPage
+from .checkout_step_one_page import CheckoutInformation, CheckoutStepOnePage
+from .checkout_step_two_page import CheckoutStepTwoPage
+from .checkout_complete_page import CheckoutCompletePage
 from ..components.hamburger_menu import HamburgerMenu
 
+DEFAULT_USERNAME = "standard_user"
+DEFAULT_PASSWORD = "secret_sauce"
+
+# Order in which the pages are reached when walking the flow through the UI
+NAVIGATION_ORDER: list[str] = [
+    PagesURL.Login,
+    PagesURL.Inventory,
+    PagesURL.Cart,
+    PagesURL.CheckoutStepOne,
+    PagesURL.CheckoutStepTwo,
+    PagesURL.CheckoutComplete,
+]
+
 
 class SauceDemo:
     def __init__(self, page: Page, base_url: str = "https://www.saucedemo.com"):
@@ -13,6 +34,9 @@ class SauceDemo:
         self._login_page: LoginPage | None = None
         self._inventory_page: InventoryPage | None = None
         self._cart_page: CartPage | None = None
+        self._checkout_step_one_page: CheckoutStepOnePage | None = None
+        self._checkout_step_two_page: CheckoutStepTwoPage | None = None
+        self._checkout_complete_page: CheckoutCompletePage | None = None
         self._hamburger_menu: HamburgerMenu | None = None
 
     @property
@@ -43,6 +67,35 @@ class SauceDemo:
             self._cart_page = CartPage(self.page, self.base_url)
         return self._cart_page
 
+    @property
+    def checkout_step_one_page(self) -> CheckoutStepOnePage:
+        """
+        Lazy initialization of CheckoutStepOnePage.
+        """
+        if self._checkout_step_one_page is None:
+            self._checkout_step_one_page = CheckoutStepOnePage(self.page, self.base_url)
+        return self._checkout_step_one_page
+
+    @property
+    def checkout_step_two_page(self) -> CheckoutStepTwoPage:
+        """
+        Lazy initialization of CheckoutStepTwoPage.
+        """
+        if self._checkout_step_two_page is None:
+            self._checkout_step_two_page = CheckoutStepTwoPage(self.page, self.base_url)
+        return self._checkout_step_two_page
+
+    @property
+    def checkout_complete_page(self) -> CheckoutCompletePage:
+        """
+        Lazy initialization of CheckoutCompletePage.
+        """
+        if self._checkout_complete_page is None:
+            self._checkout_complete_page = CheckoutCompletePage(
+                self.page, self.base_url
+            )
+        return self._checkout_complete_page
+
     @property
     def hamburger_menu(self) -> HamburgerMenu:
         """
@@ -51,3 +104,151 @@ class SauceDemo:
         if self._hamburger_menu is None:
             self._hamburger_menu = HamburgerMenu(self.page)
         return self._hamburger_menu
+
+    def navigate_to(
+        self,
+        destination: str,
+        cart_items: Iterable[str] = (),
+        checkout_information: CheckoutInformation | None = None,
+        via_ui: bool = False,
+        username: str = DEFAULT_USERNAME,
+        password: str = DEFAULT_PASSWORD,
+    ) -> BasePage:
+        """
+        Bring the browser to any page of the shopping flow.
+
+        By default the session cookie and cart contents are seeded directly
+        into the browser storage and the destination is deep-linked, skipping
+        the login -> inventory -> cart -> checkout prefix. Pass via_ui=True to
+        walk the same path through the UI instead.
+
+        Args:
+            destination: Target page path, one of the PagesURL values
+            cart_items: Product names that should be in the cart on arrival
+            checkout_information: Customer details used on checkout step one
+                (only needed when walking the flow through the UI)
+            via_ui: Reach the destination by clicking through the UI
+            username: User to log in as
+            password: Password for the user (only used when via_ui=True)
+
+        Returns:
+            BasePage: The page object of the destination page
+        """
+        if destination not in self.navigation_map:
+            raise ValueError(
+                f"Unknown destination '{destination}'. "
+                f"Expected one of: {', '.join(self.navigation_map)}"
+            )
+
+        cart_items = list(cart_items)
+        if via_ui:
+            self._navigate_via_ui(
+                destination,
+                cart_items,
+                checkout_information or CheckoutInformation(),
+                username,
+                password,
+            )
+        else:
+            if destination != PagesURL.Login:
+                self._seed_storage_state(username, cart_items)
+            self.navigation_map[destination].navigate_to_page()
+
+        return self.navigation_map[destination]
+
+    @property
+    def navigation_map(self) -> dict[str, BasePage]:
+        """
+        Map of deep-linkable page paths to their page objects.
+
+        Returns:
+            dict[str, BasePage]: Page objects keyed by PagesURL value
+        """
+        return {
+            PagesURL.Login: self.login_page,
+            PagesURL.Inventory: self.inventory_page,
+            PagesURL.Cart: self.cart_page,
+            PagesURL.CheckoutStepOne: self.checkout_step_one_page,
+            PagesURL.CheckoutStepTwo: self.checkout_step_two_page,
+            PagesURL.CheckoutComplete: self.checkout_complete_page,
+        }
+
+    def _seed_storage_state(self, username: str, cart_items: list[str]) -> None:
+        """
+        Seed the session cookie and cart contents the app reads on page load.
+
+        The cart lives in localStorage, which can only be written from a
+        document of the app's origin, so it is written by a one-shot init
+        script that runs before the app scripts of the next navigation.
+
+        Args:
+            username: User the session cookie is issued for
+            cart_items: Product names to place in the cart
+        """
+        unknown_items = [
+            name for name in cart_items if name not in InventoryItemIds.BY_NAME
+        ]
+        if unknown_items:
+            raise ValueError(f"Unknown inventory items: {', '.join(unknown_items)}")
+
+        self.page.context.add_cookies(
+            [
+                {
+                    "name": StorageKeys.SESSION_COOKIE,
+                    "value": username,
+                    "url": self.base_url,
+                }
+            ]
+        )
+
+        cart_contents = json.dumps([InventoryItemIds.BY_NAME[n] for n in cart_items])
+        origin = self.base_url.rstrip("/")
+        seed_flag = f"__seeded_{uuid.uuid4().hex}"
+        self.page.context.add_init_script(script=f"""
+            (() => {{
+                if (window.location.origin !== {json.dumps(origin)}) return;
+                if (window.sessionStorage.getItem({json.dumps(seed_flag)})) return;
+                window.localStorage.setItem(
+                    {json.dumps(StorageKeys.CART_CONTENTS)}, {json.dumps(cart_contents)}
+                );
+                window.sessionStorage.setItem({json.dumps(seed_flag)}, "1");
+            }})();
+            """)
+
+    def _navigate_via_ui(
+        self,
+        destination: str,
+        cart_items: list[str],
+        checkout_information: CheckoutInformation,
+        username: str,
+        password: str,
+    ) -> None:
+        """
+        Walk the shopping flow through the UI until the destination is reached.
+
+        Args:
+            destination: Target page path, one of the PagesURL values
+            cart_items: Product names to add to the cart on the inventory page
+            checkout_information: Customer details used on checkout step one
+            username: User to log in as
+            password: Password for the user
+        """
+        stop = NAVIGATION_ORDER.index(destination)
+
+        self.login_page.navigate_to_page()
+        if stop == NAVIGATION_ORDER.index(PagesURL.Login):
+            return
+
+        self.login_page.login(username, password)
+        for item in cart_items:
+            self.inventory_page.add_item_to_cart(item)
+
+        if stop >= NAVIGATION_ORDER.index(PagesURL.Cart):
+            self.inventory_page.click_cart_icon()
+        if stop >= NAVIGATION_ORDER.index(PagesURL.CheckoutStepOne):
+            self.cart_page.click_checkout()
+        if stop >= NAVIGATION_ORDER.index(PagesURL.CheckoutStepTwo):
+            self.checkout_step_one_page.fill_information(checkout_information)
+            self.checkout_step_one_page.click_continue()
+        if stop >= NAVIGATION_ORDER.index(PagesURL.CheckoutComplete):
+            self.checkout_step_two_page.click_finish()
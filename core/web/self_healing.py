@@ -0,0 +1,301 @@
+"""
+Self-healing locators for page objects.
+
+A SelfHealingLocator declares an ordered chain of fallback strategies
+(test id, role, css). The strategy that last worked for each (page, locator)
+pair is persisted to disk and merged across parallel workers. SelectorHealer
+tries a cached fallback first with a short timeout, so a healed selector stops
+costing a wait. Otherwise it waits, bounded by the healing timeout, for any
+strategy to match: a missing element fails in seconds instead of the page's
+30s default. A fallback is only used once the page has loaded and the primary
+is still absent; the primary wins again as soon as it resolves. Every heal is
+recorded for reporting.
+"""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+from playwright.sync_api import Error as PlaywrightError, Locator, Page
+from core.file_lock import file_lock
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_FILE = "playwright/.cache/last_good_selectors.json"
+DEFAULT_HEALING_TIMEOUT = 10_000
+DEFAULT_FAST_TIMEOUT = 2_000
+
+
+class StrategyKind:
+    """Supported locator strategies, in the default fallback order."""
+
+    TEST_ID: str = "test_id"
+    ROLE: str = "role"
+    CSS: str = "css"
+
+
+@dataclass(frozen=True)
+class LocatorStrategy:
+    """A single way of locating an element."""
+
+    kind: str
+    value: str
+    name: str | None = None
+
+    def format(self, **kwargs: str) -> "LocatorStrategy":
+        """Return a copy with {placeholders} in value and name filled in."""
+        return replace(
+            self,
+            value=self.value.format(**kwargs),
+            name=self.name.format(**kwargs) if self.name else None,
+        )
+
+    def resolve(self, page: Page) -> Locator:
+        """Build the Playwright locator for this strategy."""
+        if self.kind == StrategyKind.TEST_ID:
+            return page.locator(f"[data-test='{self.value}']")
+        if self.kind == StrategyKind.ROLE:
+            return page.get_by_role(self.value, name=self.name, exact=True)  # type: ignore[arg-type]
+        if self.kind == StrategyKind.CSS:
+            return page.locator(self.value)
+        raise ValueError(f"Unknown locator strategy: {self.kind}")
+
+    def __str__(self) -> str:
+        if self.name:
+            return f"{self.kind}={self.value}[name={self.name}]"
+        return f"{self.kind}={self.value}"
+
+
+def by_test_id(value: str) -> LocatorStrategy:
+    """Locate by the data-test attribute."""
+    return LocatorStrategy(StrategyKind.TEST_ID, value)
+
+
+def by_role(role: str, name: str) -> LocatorStrategy:
+    """Locate by ARIA role and accessible name."""
+    return LocatorStrategy(StrategyKind.ROLE, role, name)
+
+
+def by_css(selector: str) -> LocatorStrategy:
+    """Locate by CSS selector."""
+    return LocatorStrategy(StrategyKind.CSS, selector)
+
+
+@dataclass(frozen=True)
+class SelfHealingLocator:
+    """An element declared as an ordered chain of fallback strategies."""
+
+    name: str
+    strategies: tuple[LocatorStrategy, ...]
+
+    def __init__(self, name: str, *strategies: LocatorStrategy):
+        if not strategies:
+            raise ValueError(f"Locator '{name}' needs at least one strategy")
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "strategies", tuple(strategies))
+
+    def format(self, **kwargs: str) -> "SelfHealingLocator":
+        """
+        Fill {placeholders} in every strategy, e.g. a product slug.
+
+        The locator name is kept for reporting; each formatted variant has its
+        own last-good cache entry (see cache_key).
+        """
+        return SelfHealingLocator(
+            self.name, *(strategy.format(**kwargs) for strategy in self.strategies)
+        )
+
+    @property
+    def cache_key(self) -> str:
+        """Name plus the formatted strategies, e.g. one entry per product slug."""
+        return " | ".join([self.name, *(str(s) for s in self.strategies)])
+
+
+@dataclass
+class HealingEvent:
+    """A locator that resolved through a fallback strategy."""
+
+    page: str
+    locator: str
+    primary: str
+    healed_with: str
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+
+
+class SelectorHealingError(AssertionError):
+    """Raised when none of a locator's strategies match."""
+
+
+class LastGoodCache:
+    """Persistent map of (page, locator key) to the last strategy index that worked."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self._lock = threading.Lock()
+        self._entries: dict[str, int] = self._load()
+
+    @staticmethod
+    def _key(page_name: str, locator_key: str) -> str:
+        return f"{page_name}::{locator_key}"
+
+    def _load(self) -> dict[str, int]:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return {k: v for k, v in data.items() if isinstance(v, int)}
+
+    def get(self, page_name: str, locator_key: str) -> int | None:
+        """Return the last-good strategy index, if known."""
+        return self._entries.get(self._key(page_name, locator_key))
+
+    def set(self, page_name: str, locator_key: str, index: int) -> None:
+        """Remember the strategy index that worked and persist the cache."""
+        key = self._key(page_name, locator_key)
+        with self._lock:
+            if self._entries.get(key) == index:
+                return
+            self._entries[key] = index
+            self._save(key, index)
+
+    def _save(self, key: str, index: int) -> None:
+        """
+        Merge one entry into the file under a cross-process lock
+
+        The file is re-read inside the lock, so parallel workers keep each
+        other's entries, and written atomically, so readers never see a
+        partial file.
+        """
+        with file_lock(self.lock_path):
+            entries = self._load()
+            entries[key] = index
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(entries, indent=2, sort_keys=True))
+            tmp_path.replace(self.path)
+        self._entries = entries
+
+
+class SelectorHealer:
+    """Resolves SelfHealingLocators against a page, healing broken selectors."""
+
+    def __init__(
+        self,
+        cache: LastGoodCache,
+        timeout: float = DEFAULT_HEALING_TIMEOUT,
+        fast_timeout: float = DEFAULT_FAST_TIMEOUT,
+    ):
+        """
+        Initialize the healer
+
+        Args:
+            cache: Last-good strategy per (page, locator)
+            timeout: Milliseconds to wait for any strategy to match, and for
+                the page to load before healing
+            fast_timeout: Milliseconds to wait for a cached fallback before
+                falling back to the full search
+        """
+        self.cache = cache
+        self.timeout = timeout
+        self.fast_timeout = fast_timeout
+        self.events: list[HealingEvent] = []
+
+    def resolve(
+        self, page: Page, page_name: str, locator: SelfHealingLocator
+    ) -> Locator:
+        """
+        Find the strategy that matches an element on the page.
+
+        A cached fallback is tried first with fast_timeout and used unless
+        the primary is back. Otherwise waits up to timeout for any strategy
+        to match. The primary is used whenever it matches; otherwise the page
+        is given time to finish loading and, if the primary is still absent,
+        the first matching fallback heals it.
+
+        Args:
+            page: Playwright page to search
+            page_name: Owning page object name (cache key)
+            locator: The self-healing locator to resolve
+
+        Returns:
+            Locator: The matching Playwright locator
+
+        Raises:
+            SelectorHealingError: If no strategy matches within the timeout
+        """
+        candidates = [strategy.resolve(page) for strategy in locator.strategies]
+        primary = candidates[0]
+        key = locator.cache_key
+        cached_index = self.cache.get(page_name, key)
+        if cached_index and cached_index < len(candidates):
+            cached = candidates[cached_index]
+            if self._attached(cached, self.fast_timeout):
+                if primary.count() > 0:
+                    self.cache.set(page_name, key, 0)
+                    return primary
+                return cached
+
+        any_candidate = candidates[0]
+        for candidate in candidates[1:]:
+            any_candidate = any_candidate.or_(candidate)
+        if not self._attached(any_candidate, self.timeout):
+            tried = ", ".join(str(s) for s in locator.strategies)
+            raise SelectorHealingError(
+                f"{page_name}.{locator.name}: no strategy matched (tried {tried})"
+            )
+
+        if primary.count() == 0:
+            page.wait_for_load_state(timeout=self.timeout)
+        if primary.count() > 0:
+            if cached_index:
+                self.cache.set(page_name, key, 0)
+            return primary
+
+        matching = [
+            index for index in range(1, len(candidates)) if candidates[index].count()
+        ]
+        if not matching:
+            # The match detached again; let the caller's action wait on the primary
+            return primary
+        index = cached_index if cached_index in matching else matching[0]
+        if index != cached_index:
+            self._report_heal(page_name, locator, locator.strategies[index])
+        self.cache.set(page_name, key, index)
+        return candidates[index]
+
+    @staticmethod
+    def _attached(candidate: Locator, timeout: float) -> bool:
+        """Wait up to timeout milliseconds for the candidate to be in the DOM."""
+        try:
+            candidate.first.wait_for(state="attached", timeout=timeout)
+        except PlaywrightError:
+            return False
+        return True
+
+    def _report_heal(
+        self, page_name: str, locator: SelfHealingLocator, strategy: LocatorStrategy
+    ) -> None:
+        event = HealingEvent(
+            page=page_name,
+            locator=locator.name,
+            primary=str(locator.strategies[0]),
+            healed_with=str(strategy),
+        )
+        self.events.append(event)
+        logger.warning(
+            "Healed selector %s.%s: %s -> %s",
+            event.page,
+            event.locator,
+            event.primary,
+            event.healed_with,
+        )
+
+
+selector_healer = SelectorHealer(
+    LastGoodCache(os.getenv("SELF_HEALING_CACHE_FILE", DEFAULT_CACHE_FILE)),
+    timeout=float(os.getenv("SELF_HEALING_TIMEOUT", DEFAULT_HEALING_TIMEOUT)),
+    fast_timeout=float(os.getenv("SELF_HEALING_FAST_TIMEOUT", DEFAULT_FAST_TIMEOUT)),
+)
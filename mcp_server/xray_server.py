@@ -15,7 +15,7 @@ import os
 BASE_DIR = Path(__file__).parent.resolve()
 sys.path.insert(0, str(BASE_DIR.parent))
 
-from plugins.xray import XrayClient
+from plugins.xray import shared_client
 
 mcp = FastMCP("XrayTestManagement")
 
@@ -35,11 +35,28 @@ def xray_get_test(test_key: str) -> str:
     Returns:
         JSON string with test details including test type, steps, and metadata
     """
-    xray = XrayClient(client_id=client_id, client_secret=client_secret)
+    xray = shared_client(client_id, client_secret)
     result = xray.get_test_by_key(test_key)
     return json.dumps(result, indent=2)
 
 
+@mcp.tool()
+def xray_get_tests(test_keys: str) -> str:
+    """
+    Get details of many tests by Jira issue key in as few queries as possible.
+
+    Args:
+        test_keys: Comma-separated list of test keys (e.g., "DEV-13,DEV-14,DEV-15")
+
+    Returns:
+        JSON string mapping each found test key to its details
+    """
+    xray = shared_client(client_id, client_secret)
+    keys = [key.strip() for key in test_keys.split(",") if key.strip()]
+    result = xray.get_tests_by_keys(keys)
+    return json.dumps(result, indent=2)
+
+
 @mcp.tool()
 def xray_get_tests_by_label(label: str, limit: int = 100) -> str:
     """
@@ -52,7 +69,7 @@ def xray_get_tests_by_label(label: str, limit: int = 100) -> str:
     Returns:
         JSON string with list of tests matching the label
     """
-    xray = XrayClient(client_id=client_id, client_secret=client_secret)
+    xray = shared_client(client_id, client_secret)
     result = xray.get_tests_by_label(label, limit)
     return json.dumps(result, indent=2)
 
@@ -68,7 +85,7 @@ def xray_get_test_plan(plan_key: str) -> str:
     Returns:
         JSON string with test plan details including associated tests
     """
-    xray = XrayClient(client_id=client_id, client_secret=client_secret)
+    xray = shared_client(client_id, client_secret)
     result = xray.get_test_plan_by_key(plan_key)
     return json.dumps(result, indent=2)
 
@@ -85,7 +102,7 @@ def xray_add_tests_to_plan(test_plan_id: str, test_issue_ids: str) -> str:
     Returns:
         JSON string with result of the operation
     """
-    xray = XrayClient(client_id=client_id, client_secret=client_secret)
+    xray = shared_client(client_id, client_secret)
     test_ids = [tid.strip() for tid in test_issue_ids.split(",")]
     result = xray.add_tests_to_test_plan(test_plan_id, test_ids)
     return json.dumps(result, indent=2)
@@ -103,7 +120,7 @@ def xray_remove_tests_from_plan(test_plan_id: str, test_issue_ids: str) -> str:
     Returns:
         JSON string with result of the operation
     """
-    xray = XrayClient(client_id=client_id, client_secret=client_secret)
+    xray = shared_client(client_id, client_secret)
     test_ids = [tid.strip() for tid in test_issue_ids.split(",")]
     result = xray.remove_tests_from_test_plan(test_plan_id, test_ids)
     return json.dumps(result, indent=2)
@@ -121,7 +138,7 @@ def xray_update_test_type(issue_id: str, test_type: str) -> str:
     Returns:
         JSON string with updated test details
     """
-    xray = XrayClient(client_id=client_id, client_secret=client_secret)
+    xray = shared_client(client_id, client_secret)
     result = xray.update_test_type(issue_id, test_type)
     return json.dumps(result, indent=2)
 
@@ -138,7 +155,7 @@ def xray_update_unstructured_test_definition(issue_id: str, unstructured: str) -
     Returns:
         JSON string with updated test definition details
     """
-    xray = XrayClient(client_id=client_id, client_secret=client_secret)
+    xray = shared_client(client_id, client_secret)
     result = xray.update_unstructured_test_definition(issue_id, unstructured)
     return json.dumps(result, indent=2)
 
@@ -154,7 +171,7 @@ def xray_get_test_execution(execution_id: str) -> str:
     Returns:
         JSON string with test execution details including test runs
     """
-    xray = XrayClient(client_id=client_id, client_secret=client_secret)
+    xray = shared_client(client_id, client_secret)
     result = xray.get_test_execution(execution_id)
     return json.dumps(result, indent=2)
 
@@ -178,7 +195,7 @@ def xray_create_test_execution(
     Returns:
         JSON string with created test execution details
     """
-    xray = XrayClient(client_id=client_id, client_secret=client_secret)
+    xray = shared_client(client_id, client_secret)
     envs = (
         [e.strip() for e in test_environments.split(",")] if test_environments else None
     )
@@ -201,7 +218,7 @@ def xray_update_test_run_status(
     Returns:
         JSON string with updated test run details
     """
-    xray = XrayClient(client_id=client_id, client_secret=client_secret)
+    xray = shared_client(client_id, client_secret)
     result = xray.update_test_run_status(test_run_id, status, comment)
     return json.dumps(result, indent=2)
 
@@ -218,7 +235,7 @@ def xray_search_tests(jql: str, limit: int = 100) -> str:
     Returns:
         JSON string with list of tests matching the query
     """
-    xray = XrayClient(client_id=client_id, client_secret=client_secret)
+    xray = shared_client(client_id, client_secret)
     result = xray.search_tests(jql, limit)
     return json.dumps(result, indent=2)
 
@@ -235,11 +252,24 @@ def xray_search_test_plans(jql: str, limit: int = 100) -> str:
     Returns:
         JSON string with list of test plans matching the query
     """
-    xray = XrayClient(client_id=client_id, client_secret=client_secret)
+    xray = shared_client(client_id, client_secret)
     result = xray.search_test_plans(jql, limit)
     return json.dumps(result, indent=2)
 
 
+@mcp.tool()
+def xray_client_metrics() -> str:
+    """
+    Get latency of recent Xray API calls made by this server.
+
+    Returns:
+        JSON string with p50/p95/p99 latency (seconds) per GraphQL operation and
+        connection reuse of the shared client
+    """
+    xray = shared_client(client_id, client_secret)
+    return json.dumps(xray.metrics(), indent=2)
+
+
 @mcp.resource(
     uri="xray://test/{test_key}",
     name="XrayTestDetails",
@@ -255,7 +285,7 @@ def get_test_resource(test_key: str) -> str:
     Returns:
         Formatted test details
     """
-    xray = XrayClient(client_id=client_id, client_secret=client_secret)
+    xray = shared_client(client_id, client_secret)
     result = xray.get_test_by_key(test_key)
 
     if not result:
@@ -295,7 +325,7 @@ def get_test_plan_resource(plan_key: str) -> str:
     Returns:
         Formatted test plan details
     """
-    xray = XrayClient(client_id=client_id, client_secret=client_secret)
+    xray = shared_client(client_id, client_secret)
     result = xray.get_test_plan_by_key(plan_key)
 
     if not result:
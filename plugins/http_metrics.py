@@ -0,0 +1,81 @@
+"""
+Pytest plugin that reports HTTP-level metrics of the API controllers.
+
+Calls made by a test (including its fixtures and the bulk and hedged calls
+it starts) are summarized per endpoint and attached to that test's Allure
+report. At session end the per-endpoint p50/p95/p99 latencies, bytes and
+retries of the whole session are written as a JSON artifact and attached to
+the Allure report, together with p50/p95/p99 durations of the tests that
+called an API. Only aggregates are kept, never individual calls. Disable with
+--no-http-metrics (or HTTP_METRICS=false in .env).
+"""
+
+import os
+import pytest
+from core.controllers.http_metrics import LATENCY_PERCENTILES, http_metrics
+from core.metrics import LatencyHistogram
+from plugins.reporter import reporter, write_json_artifact
+
+HTTP_METRICS_ARTIFACT = "http_metrics"
+
+# Durations of test calls, to see how API tail latency affects test time
+_test_durations = LatencyHistogram()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-http-metrics",
+        action="store_true",
+        default=os.getenv("HTTP_METRICS", "true") != "true",
+        help="Do not record latency and payload size of API calls",
+    )
+
+
+def pytest_configure(config):
+    """Disable the HTTP metrics recorder when requested."""
+    http_metrics.enabled = not config.getoption("--no-http-metrics")
+
+
+@pytest.fixture(autouse=True)
+def http_metrics_per_test(request):
+    """Attribute API calls to the running test and attach their summary."""
+    token = http_metrics.start_test(request.node.nodeid)
+
+    yield
+
+    summary = http_metrics.finish_test(request.node.nodeid, token)
+    if summary:
+        reporter.attach_json(summary, name="http_metrics")
+
+
+def pytest_runtest_logreport(report):
+    """Collect durations of tests that called an API."""
+    if report.when == "call" and http_metrics.test_count(report.nodeid):
+        _test_durations.record(report.duration)
+
+
+def _session_summary() -> dict:
+    return {
+        **http_metrics.to_dict(),
+        "test_duration": _test_durations.summary(LATENCY_PERCENTILES),
+    }
+
+
+@pytest.fixture(scope="session", autouse=True)
+def http_metrics_report():
+    """Attach the per-endpoint latency summary to Allure at session end."""
+    yield
+
+    if http_metrics.count:
+        reporter.attach_json(_session_summary(), name="http_metrics_summary")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Write the per-endpoint HTTP metrics as a JSON artifact."""
+    if not http_metrics.count:
+        return
+
+    artifact = write_json_artifact(
+        session.config, HTTP_METRICS_ARTIFACT, _session_summary()
+    )
+    print(f"\n📡 HTTP metrics of {http_metrics.count} call(s) saved to: {artifact}")
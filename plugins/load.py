@@ -0,0 +1,78 @@
+"""
+Pytest plugin for load tests of the Pet Store API.
+
+Tests marked with @pytest.mark.load(...) request the load_report fixture,
+which runs the weighted scenarios against the Pet Store (the local stub when
+PET_STORE_OFFLINE=true) and returns the LoadReport to assert on. The report is
+attached to Allure and written as a JSON artifact. Load tests are skipped
+unless --load (or LOAD_TESTS=true in .env) is given.
+
+    @pytest.mark.load(scenarios={"login": 1, "add_get_delete_pet": 3}, rps=20, duration=30)
+    def test_pet_store_under_load(load_report): ...
+"""
+
+import os
+import pytest
+from core.load_runner import LoadProfile, LoadReport, LoadRunner, build_load_controller
+from plugins.reporter import reporter, write_json_artifact
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--load",
+        action="store_true",
+        default=os.getenv("LOAD_TESTS") == "true",
+        help="Run tests marked with @pytest.mark.load",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip load tests unless they were requested."""
+    if config.getoption("--load"):
+        return
+
+    skip = pytest.mark.skip(reason="load test, run with --load")
+    for item in items:
+        if item.get_closest_marker("load") is not None:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="function")
+def load_report(request, pet_store_base_url: str) -> LoadReport:
+    """
+    Run the load described by the test's load marker.
+
+    Args:
+        pet_store_base_url: Pet Store API root
+
+    Returns:
+        LoadReport: Latency percentiles, throughput and errors of the run
+    """
+    marker = request.node.get_closest_marker("load")
+    if marker is None:
+        pytest.fail("load_report requires @pytest.mark.load(scenarios=..., ...)")
+
+    options = dict(marker.kwargs)
+    scenarios = options.pop("scenarios")
+    seed = options.pop("seed", None)
+    profile = LoadProfile(**options)
+
+    controller = build_load_controller(
+        pet_store_base_url, max(profile.max_in_flight, profile.concurrency or 0)
+    )
+    try:
+        report = LoadRunner(controller, scenarios, profile, seed).run()
+    finally:
+        controller.session.close()
+
+    data = report.to_dict()
+    reporter.attach_json(data, name="load_report")
+    artifact = write_json_artifact(
+        request.config, f"load_report_{request.node.name}", data
+    )
+    print(
+        f"\n🏋 Load: {data['completed']} scenarios at {data['throughput']}/s, "
+        f"p95 {data['latency'].get('p95', 0):.3f}s, "
+        f"{report.error_count} error(s), {data['dropped']} dropped; saved to: {artifact}"
+    )
+    return report
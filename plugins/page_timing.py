@@ -0,0 +1,50 @@
+"""
+Pytest plugin for opt-in page-object timing.
+
+Enable with --page-timing (or PAGE_TIMING=true in .env). While enabled, every
+public method and property of BasePage subclasses and HamburgerMenu is timed
+and, at session end, a per-method latency histogram is written as a JSON
+artifact next to the Allure results and attached to the Allure report.
+"""
+
+import os
+import pytest
+from core.web.instrumentation import timing_recorder
+from plugins.reporter import reporter, write_json_artifact
+
+PAGE_TIMING_ARTIFACT = "page_timing"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--page-timing",
+        action="store_true",
+        default=os.getenv("PAGE_TIMING") == "true",
+        help="Record per-method timing of page objects and report a histogram",
+    )
+
+
+def pytest_configure(config):
+    """Enable the page timing recorder when requested."""
+    if config.getoption("--page-timing"):
+        timing_recorder.enable()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def page_timing_report():
+    """Attach the page-object latency histogram to Allure at session end."""
+    yield
+
+    if timing_recorder.enabled and timing_recorder.count:
+        reporter.attach_json(timing_recorder.histogram(), name="page_timing_histogram")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Write the page-object timing histogram as a JSON artifact."""
+    if not timing_recorder.enabled or not timing_recorder.count:
+        return
+
+    artifact = write_json_artifact(
+        session.config, PAGE_TIMING_ARTIFACT, timing_recorder.to_dict()
+    )
+    print(f"\n⏱ Page timing histogram saved to: {artifact}")
@@ -1,6 +1,9 @@
 from collections.abc import Generator
 from pathlib import Path
+import json
+import logging
 import os
+import time
 import pytest
 import allure
 import re
@@ -9,6 +12,13 @@ from contextlib import contextmanager
 from assertpy import assert_that as assertpy_assert_that
 from typing import Any, Callable
 from dataclasses import dataclass
+from playwright.sync_api import Locator
+
+logger = logging.getLogger(__name__)
+
+EXPECT_TIMEOUT = 5.0  # seconds
+EXPECT_INITIAL_INTERVAL = 0.1  # seconds
+EXPECT_MAX_INTERVAL = 1.0  # seconds
 
 
 class TagNames:
@@ -108,6 +118,15 @@ class AllureReporter:
             file, name="attachment", attachment_type=AttachmentType.WEBM, **kwargs
         )
 
+    def attach_json(self, data: Any, name: str) -> None:
+        """Attach a JSON-serializable object (e.g. collected metrics) to the report."""
+        allure.attach(
+            json.dumps(data, indent=2, default=str),
+            name=name,
+            attachment_type=AttachmentType.JSON,
+            extension="json",
+        )
+
     def assert_that(self, actual: Any):
         """
         Create an assertion with automatic Allure step.
@@ -117,10 +136,32 @@ class AllureReporter:
         """
         return AllureAssertionBuilder(actual)
 
+    def expect_that(
+        self,
+        actual: Callable[[], Any] | Locator,
+        timeout: float = EXPECT_TIMEOUT,
+        description: str | None = None,
+    ):
+        """
+        Create a polling assertion with automatic Allure step.
+
+        The value is re-read and the assertion retried with exponential backoff
+        until it passes or the timeout (seconds) expires. Locators are read via
+        all_text_contents(): a single match yields its text, no match yields an
+        empty string and several matches yield the list of texts.
+
+        Usage:
+            reporter.expect_that(lambda: inventory_page.cart_badge_count).is_equal_to("1")
+            reporter.expect_that(page.locator(".title")).is_equal_to("Products")
+        """
+        return AllurePollingAssertionBuilder(actual, timeout, description)
+
 
 class AllureAssertionBuilder:
     """Wrapper around assertpy that creates Allure steps for assertions."""
 
+    STEP_PREFIX = "Assert that"
+
     def __init__(self, actual: Any):
         self._actual = actual
         self._assertpy = assertpy_assert_that(actual)
@@ -142,15 +183,19 @@ class AllureAssertionBuilder:
     def _make_step_name(self, method_name: str, *args) -> str:
         """Generate readable step name from assertion."""
 
-        actual_str = self._format_value(self._actual)
+        actual_str = self._describe_actual()
 
         readable_method = method_name.replace("_", " ")
 
         if args:
             expected_str = self._format_value(args[0])
-            return f"Assert that {actual_str} {readable_method} {expected_str}"
+            return f"{self.STEP_PREFIX} {actual_str} {readable_method} {expected_str}"
         else:
-            return f"Assert that {actual_str} {readable_method}"
+            return f"{self.STEP_PREFIX} {actual_str} {readable_method}"
+
+    def _describe_actual(self) -> str:
+        """Describe the asserted value for the step name."""
+        return self._format_value(self._actual)
 
     def _format_value(self, value: Any) -> str:
         """Format a value for display."""
@@ -161,6 +206,122 @@ class AllureAssertionBuilder:
         return str(value)
 
 
+class AllurePollingAssertionBuilder(AllureAssertionBuilder):
+    """Assertion builder that polls the actual value until the assertion passes."""
+
+    STEP_PREFIX = "Expect that"
+
+    def __init__(
+        self,
+        actual: Callable[[], Any] | Locator,
+        timeout: float = EXPECT_TIMEOUT,
+        description: str | None = None,
+    ):
+        self._actual = actual
+        self._timeout = timeout
+        self._description = description
+
+    def __getattr__(self, name: str):
+        """Intercept assertion calls to poll them inside an Allure step."""
+
+        def wrapper(*args, **kwargs):
+            """Retry the assertion method with backoff until the deadline."""
+            step_name = self._make_step_name(name, *args)
+
+            with allure.step(step_name):
+                polls, elapsed = self._poll(name, *args, **kwargs)
+                with allure.step(f"Passed after {polls} poll(s) in {elapsed:.2f}s"):
+                    pass
+                logger.info("%s: passed after %d poll(s)", step_name, polls)
+                return self  # Return self for chaining
+
+        return wrapper
+
+    def _poll(self, method_name: str, *args, **kwargs) -> tuple[int, float]:
+        """
+        Re-read the value and run the assertion until it passes.
+
+        Returns:
+            Number of polls and elapsed seconds until the assertion passed
+
+        Raises:
+            AssertionError: The last assertion failure once the timeout expires
+        """
+        started = time.monotonic()
+        deadline = started + self._timeout
+        interval = EXPECT_INITIAL_INTERVAL
+        polls = 0
+
+        while True:
+            polls += 1
+            try:
+                method = getattr(assertpy_assert_that(self._read()), method_name)
+                method(*args, **kwargs)
+                return polls, time.monotonic() - started
+            except AssertionError as error:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.info("%s: failed after %d poll(s)", method_name, polls)
+                    raise AssertionError(
+                        f"{error} (after {polls} poll(s) in {self._timeout}s)"
+                    ) from error
+                time.sleep(min(interval, remaining))
+                interval = min(interval * 2, EXPECT_MAX_INTERVAL)
+
+    def _read(self) -> Any:
+        """Read the current value from the callable or locator."""
+        if isinstance(self._actual, Locator):
+            texts = self._actual.all_text_contents()
+            if not texts:
+                return ""
+            return texts[0] if len(texts) == 1 else texts
+        return self._actual()
+
+    def _describe_actual(self) -> str:
+        """Describe the polled value for the step name."""
+        if self._description:
+            return self._description
+        if isinstance(self._actual, Locator):
+            return str(self._actual)
+        return getattr(self._actual, "__qualname__", repr(self._actual))
+
+
+def artifact_path(config, name: str) -> Path:
+    """
+    Build a per-worker artifact path inside the Allure results directory.
+
+    Args:
+        config: Pytest config object
+        name: Artifact base name (without extension)
+
+    Returns:
+        Path to the JSON artifact, suffixed with the xdist worker id if any
+    """
+    allure_dir = getattr(config.option, "allure_report_dir", None)
+    target_dir = Path(allure_dir) if allure_dir else Path(config.rootpath)
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    suffix = f"_{worker}" if worker else ""
+    return target_dir / f"{name}{suffix}.json"
+
+
+def write_json_artifact(config, name: str, data: Any) -> Path:
+    """
+    Write a JSON artifact (e.g. session metrics) next to the Allure results.
+
+    Args:
+        config: Pytest config object
+        name: Artifact base name (without extension)
+        data: JSON-serializable data
+
+    Returns:
+        Path of the written artifact
+    """
+    path = artifact_path(config, name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2, default=str))
+    return path
+
+
 def _resolve_test_directory(test_path_str: str) -> Path:
     """
     Resolve test path to its containing directory.
@@ -397,8 +558,6 @@ def pytest_runtest_makereport(item, call):
                 )
 
             if hasattr(item, "_network_errors") and item._network_errors:
-                import json
-
                 errors_json = json.dumps(item._network_errors, indent=2)
                 allure.attach(
                     errors_json,
@@ -3,10 +3,12 @@ Type stub file for reporter module.
 Provides IDE autocomplete for assertpy methods via types-assertpy.
 """
 
-from typing import Any
+from typing import Any, Callable
+from pathlib import Path
 from collections.abc import Generator
 from contextlib import AbstractContextManager
 from assertpy.assertpy import AssertionBuilder
+from playwright.sync_api import Locator
 
 class AllureReporter:
     """Allure reporting utilities with step management and assertions."""
@@ -25,6 +27,10 @@ class AllureReporter:
         """Attach a file to the Allure report."""
         ...
 
+    def attach_json(self, data: Any, name: str) -> None:
+        """Attach a JSON-serializable object (e.g. collected metrics) to the report."""
+        ...
+
     def assert_that(self, actual: Any) -> AllureAssertionBuilder:
         """
         Create an assertion with automatic Allure step.
@@ -35,6 +41,21 @@ class AllureReporter:
         """
         ...
 
+    def expect_that(
+        self,
+        actual: Callable[[], Any] | Locator,
+        timeout: float = ...,
+        description: str | None = None,
+    ) -> AllurePollingAssertionBuilder:
+        """
+        Create a polling assertion with automatic Allure step.
+
+        Usage:
+            reporter.expect_that(lambda: inventory_page.cart_badge_count).is_equal_to("1")
+            reporter.expect_that(page.locator(".title")).is_equal_to("Products")
+        """
+        ...
+
 class AllureAssertionBuilder(AssertionBuilder):
     """
     Assertion builder with Allure step reporting.
@@ -45,5 +66,26 @@ class AllureAssertionBuilder(AssertionBuilder):
 
     def __init__(self, actual: Any) -> None: ...
 
+class AllurePollingAssertionBuilder(AllureAssertionBuilder):
+    """
+    Assertion builder that re-reads the value and retries with backoff
+    until the assertion passes or the timeout expires.
+    """
+
+    def __init__(
+        self,
+        actual: Callable[[], Any] | Locator,
+        timeout: float = ...,
+        description: str | None = None,
+    ) -> None: ...
+
+def artifact_path(config: Any, name: str) -> Path:
+    """Build a per-worker artifact path inside the Allure results directory."""
+    ...
+
+def write_json_artifact(config: Any, name: str, data: Any) -> Path:
+    """Write a JSON artifact (e.g. session metrics) next to the Allure results."""
+    ...
+
 # Global reporter instance
 reporter: AllureReporter
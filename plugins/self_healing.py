@@ -0,0 +1,44 @@
+"""
+Pytest plugin that reports healed selectors.
+
+Every locator that had to fall back from its primary strategy during a test is
+attached to that test's Allure report, and all heals of the session are written
+as a JSON artifact so broken primary selectors can be fixed at the source.
+"""
+
+from dataclasses import asdict
+import pytest
+from core.web.self_healing import selector_healer
+from plugins.reporter import reporter, write_json_artifact
+
+HEALED_SELECTORS_ARTIFACT = "healed_selectors"
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Attach selectors healed while the test body ran."""
+    first_event = len(selector_healer.events)
+
+    yield
+
+    healed = selector_healer.events[first_event:]
+    if healed:
+        reporter.attach_json(
+            [asdict(event) for event in healed], name="healed_selectors"
+        )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Write all selectors healed during the session as a JSON artifact."""
+    if not selector_healer.events:
+        return
+
+    artifact = write_json_artifact(
+        session.config,
+        HEALED_SELECTORS_ARTIFACT,
+        [asdict(event) for event in selector_healer.events],
+    )
+    print(
+        f"\n🩹 {len(selector_healer.events)} selector(s) healed, "
+        f"details saved to: {artifact}"
+    )
@@ -3,25 +3,199 @@ Xray GraphQL API Client
 Documentation: https://us.xray.cloud.getxray.app/doc/graphql/
 """
 
+import base64
+import hashlib
 import os
+import re
+import threading
+import time
 import requests
 import json
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+from core.controllers.bulk import chunked
+from core.controllers.connection_pool import PooledHTTPAdapter
+from core.controllers.resilience import build_retry
+from core.file_lock import file_lock
+from core.metrics import summarize
+
+DEFAULT_XRAY_POOL_SIZE = 4
+DEFAULT_XRAY_CONNECT_TIMEOUT = 5.0
+DEFAULT_XRAY_READ_TIMEOUT = 60.0
+LATENCY_WINDOW = 1000
+MAX_GET_TESTS_LIMIT = 100
+ISSUE_KEY_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
+DEFAULT_TOKEN_CACHE_FILE = Path.home() / ".cache" / "xray" / "token.json"
+DEFAULT_TOKEN_TTL = 3600.0
+DEFAULT_TOKEN_REFRESH_MARGIN = 300.0
+
+
+def token_expiry(token: str) -> Optional[float]:
+    """
+    Read the expiry of a JWT bearer token without verifying it
+
+    Args:
+        token: Bearer token as returned by /authenticate
+
+    Returns:
+        The "exp" claim as a Unix timestamp, or None if it cannot be decoded
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class XrayTokenCache:
+    """Bearer tokens cached on disk and shared by every process of the user"""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        refresh_margin: float = DEFAULT_TOKEN_REFRESH_MARGIN,
+    ):
+        """
+        Initialize the token cache
+
+        Args:
+            path: Cache file (defaults to XRAY_TOKEN_CACHE_FILE env var or
+                ~/.cache/xray/token.json); a .lock file is kept next to it
+            refresh_margin: Seconds before expiry at which a token is replaced
+        """
+        self.path = Path(
+            path or os.getenv("XRAY_TOKEN_CACHE_FILE") or DEFAULT_TOKEN_CACHE_FILE
+        )
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.refresh_margin = refresh_margin
+
+    def get_token(
+        self,
+        client_id: str,
+        authenticate: Callable[[], str],
+        rejected: Optional[str] = None,
+    ) -> tuple[str, float]:
+        """
+        Return a cached token for the client, authenticating when there is
+        none, it expires within refresh_margin, or it was rejected
+
+        The file lock is held while authenticating, so concurrent processes
+        wait for one authentication instead of each sending their own.
+
+        Args:
+            client_id: Xray API client ID the token belongs to
+            authenticate: Requests a new token from Xray
+            rejected: Token the API answered 401 to; it is only replaced if no
+                other process replaced it already
+
+        Returns:
+            Tuple of the token and its expiry as a Unix timestamp
+        """
+        key = hashlib.sha256(client_id.encode()).hexdigest()[:16]
+        with file_lock(self.lock_path):
+            entries = self._read()
+            entry = entries.get(key)
+            if (
+                entry
+                and entry["token"] != rejected
+                and entry["expires_at"] - time.time() > self.refresh_margin
+            ):
+                return entry["token"], entry["expires_at"]
+
+            token = authenticate()
+            expires_at = token_expiry(token) or time.time() + DEFAULT_TOKEN_TTL
+            entries[key] = {"token": token, "expires_at": expires_at}
+            self._write(entries)
+            return token, expires_at
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            entries: Dict[str, Dict[str, Any]] = json.loads(self.path.read_text())
+            return entries
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Replace the cache file atomically, readable by the owner only"""
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as handle:
+            json.dump(entries, handle)
+        os.replace(tmp, self.path)
+
+
+def _operation_name(query: str) -> str:
+    """Name of a GraphQL operation, e.g. "GetTests" for "query GetTests(...)"."""
+    match = re.search(r"\b(?:query|mutation)\s+(\w+)", query)
+    return match.group(1) if match else "anonymous"
+
+
+def _jql_key(key: str) -> str:
+    """Quoted Jira issue key for JQL; anything but a plain key is rejected."""
+    if not ISSUE_KEY_PATTERN.fullmatch(key):
+        raise ValueError(f"Invalid Jira issue key: {key!r}")
+    return f'"{key}"'
 
 
 class XrayClient:
     """Client for interacting with Xray Test Management via GraphQL API"""
 
+    _GET_TESTS_WITH_STEPS = """
+    query GetTests($jql: String!, $limit: Int!) {
+        getTests(jql: $jql, limit: $limit) {
+            total
+            results {
+                issueId
+                jira(fields: ["key", "summary", "description", "labels"])
+                testType {
+                    name
+                    kind
+                }
+                steps {
+                    id
+                    data
+                    action
+                    result
+                }
+            }
+        }
+    }
+    """
+
     def __init__(
-        self, client_id: Optional[str] = None, client_secret: Optional[str] = None
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        token_cache: Optional[XrayTokenCache] = None,
+        pool_size: Optional[int] = None,
+        timeout: Optional[tuple[float, float]] = None,
+        compression: Optional[bool] = None,
     ):
         """
         Initialize Xray client with authentication credentials
 
+        Authentication is deferred to the first query. Tokens are shared
+        across processes through an on-disk XrayTokenCache unless
+        XRAY_TOKEN_CACHE=false. All requests go through the client's own
+        keep-alive session, so create one long-lived client (see
+        shared_client()) instead of one per call.
+
         Args:
             client_id: Xray API client ID (defaults to XRAY_CLIENT_ID env var)
             client_secret: Xray API client secret (defaults to XRAY_CLIENT_SECRET env var)
+            token_cache: Token cache to use (defaults to one at
+                XRAY_TOKEN_CACHE_FILE)
+            pool_size: Connections kept open (defaults to XRAY_POOL_SIZE env var)
+            timeout: (connect, read) timeout in seconds (defaults to
+                XRAY_CONNECT_TIMEOUT / XRAY_READ_TIMEOUT env vars)
+            compression: Ask for gzip/deflate responses (defaults to
+                XRAY_COMPRESSION env var, on)
         """
         self.client_id = client_id or os.getenv("XRAY_CLIENT_ID")
         self.client_secret = client_secret or os.getenv("XRAY_CLIENT_SECRET")
@@ -34,19 +208,68 @@ class XrayClient:
         self.graphql_url = "https://xray.cloud.getxray.app/api/v2/graphql"
         self.auth_url = "https://xray.cloud.getxray.app/api/v2/authenticate"
         self.token: Optional[str] = None
-        self._authenticate()
+        self.token_expires_at = 0.0
+        self.token_cache = token_cache
+        self.adapter = PooledHTTPAdapter(
+            pool_size=pool_size
+            or int(os.getenv("XRAY_POOL_SIZE", DEFAULT_XRAY_POOL_SIZE)),
+            timeout=timeout
+            or (
+                float(os.getenv("XRAY_CONNECT_TIMEOUT", DEFAULT_XRAY_CONNECT_TIMEOUT)),
+                float(os.getenv("XRAY_READ_TIMEOUT", DEFAULT_XRAY_READ_TIMEOUT)),
+            ),
+            max_retries=build_retry(),
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+        if compression is None:
+            compression = os.getenv("XRAY_COMPRESSION", "true") == "true"
+        self.session.headers.update(
+            {
+                "Content-Type": "application/json",
+                "Accept-Encoding": "gzip, deflate" if compression else "identity",
+            }
+        )
+        self._latencies: Dict[str, deque[float]] = {}
+        self._latency_lock = threading.Lock()
+        if token_cache is None and os.getenv("XRAY_TOKEN_CACHE", "true") == "true":
+            self.token_cache = XrayTokenCache(
+                refresh_margin=float(
+                    os.getenv("XRAY_TOKEN_REFRESH_MARGIN", DEFAULT_TOKEN_REFRESH_MARGIN)
+                )
+            )
+
+    def _authenticate(self, rejected: Optional[str] = None) -> None:
+        """
+        Obtain a bearer token, from the shared token cache when enabled
 
-    def _authenticate(self) -> None:
-        """Authenticate with Xray API and obtain bearer token"""
+        Args:
+            rejected: Token the API answered 401 to
+        """
+        if self.token_cache is None:
+            self.token = self._request_token()
+            self.token_expires_at = (
+                token_expiry(self.token) or time.time() + DEFAULT_TOKEN_TTL
+            )
+            return
+
+        assert self.client_id is not None
+        self.token, self.token_expires_at = self.token_cache.get_token(
+            self.client_id, self._request_token, rejected
+        )
+
+    def _request_token(self) -> str:
+        """Authenticate with Xray API and return a new bearer token"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.auth_url,
                 json={"client_id": self.client_id, "client_secret": self.client_secret},
-                headers={"Content-Type": "application/json"},
             )
+            self._record_latency("authenticate", response)
             response.raise_for_status()
             json_response = response.json()
-            self.token = (
+            return (
                 json_response
                 if isinstance(json_response, str)
                 else response.text.strip('"')
@@ -54,6 +277,14 @@ class XrayClient:
         except requests.exceptions.RequestException as e:
             raise Exception(f"Failed to authenticate with Xray: {str(e)}")
 
+    def _token_is_fresh(self) -> bool:
+        margin = (
+            self.token_cache.refresh_margin
+            if self.token_cache is not None
+            else DEFAULT_TOKEN_REFRESH_MARGIN
+        )
+        return bool(self.token) and self.token_expires_at - time.time() > margin
+
     def _execute_query(self, query: str, variables: Optional[Dict] = None) -> Dict:
         """
         Execute a GraphQL query against Xray API
@@ -65,20 +296,19 @@ class XrayClient:
         Returns:
             Response data from the API
         """
-        if not self.token:
+        if not self._token_is_fresh():
             self._authenticate()
 
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-        }
-
         payload: Dict[str, Any] = {"query": query}
         if variables:
             payload["variables"] = variables
 
         try:
-            response = requests.post(self.graphql_url, json=payload, headers=headers)
+            response = self._post_query(payload)
+            if response.status_code == 401:
+                # Revoked or expired early: re-authenticate once and retry
+                self._authenticate(rejected=self.token)
+                response = self._post_query(payload)
             response.raise_for_status()
             result = response.json()
 
@@ -92,6 +322,48 @@ class XrayClient:
         except requests.exceptions.RequestException as e:
             raise Exception(f"Failed to execute query: {str(e)}")
 
+    def _post_query(self, payload: Dict[str, Any]) -> requests.Response:
+        headers = {"Authorization": f"Bearer {self.token}"}
+        response = self.session.post(self.graphql_url, json=payload, headers=headers)
+        self._record_latency(_operation_name(payload["query"]), response)
+        return response
+
+    def _record_latency(self, operation: str, response: requests.Response) -> None:
+        with self._latency_lock:
+            self._latencies.setdefault(operation, deque(maxlen=LATENCY_WINDOW)).append(
+                response.elapsed.total_seconds()
+            )
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Latency of recent calls per GraphQL operation and connection reuse
+
+        Returns:
+            {"operations": {name: count/p50/p95/p99/max seconds},
+            "connections": requests/connections/reused}
+        """
+        with self._latency_lock:
+            latencies = {
+                name: list(samples) for name, samples in self._latencies.items()
+            }
+        return {
+            "operations": {
+                name: summarize(samples, (50, 95, 99))
+                for name, samples in sorted(latencies.items())
+            },
+            "connections": self.adapter.stats().to_dict(),
+        }
+
+    def close(self) -> None:
+        """Close the client's pooled connections"""
+        self.session.close()
+
+    def __enter__(self) -> "XrayClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     # Test Operations
 
     def get_test(self, issue_id: str) -> Dict:
@@ -137,36 +409,53 @@ class XrayClient:
 
         Returns:
             Test details
+
+        Raises:
+            ValueError: If test_key is not a Jira issue key
         """
-        query = """
-        query GetTests($jql: String!, $limit: Int!) {
-            getTests(jql: $jql, limit: $limit) {
-                total
-                results {
-                    issueId
-                    jira(fields: ["key", "summary", "description", "labels"])
-                    testType {
-                        name
-                        kind
-                    }
-                    steps {
-                        id
-                        data
-                        action
-                        result
-                    }
-                }
-            }
-        }
-        """
-        jql = f'key = "{test_key}"'
-        result = self._execute_query(query, {"jql": jql, "limit": 1})
+        jql = f"key = {_jql_key(test_key)}"
+        result = self._execute_query(
+            self._GET_TESTS_WITH_STEPS, {"jql": jql, "limit": 1}
+        )
 
         if result.get("getTests", {}).get("results"):
             test_result: Dict[Any, Any] = result["getTests"]["results"][0]
             return test_result
         return {}
 
+    def get_tests_by_keys(
+        self, test_keys: List[str], chunk_size: int = MAX_GET_TESTS_LIMIT
+    ) -> Dict[str, Dict]:
+        """
+        Get test details of many Jira issue keys with one query per chunk
+
+        Each chunk is a single getTests query with a `key in (...)` JQL, so
+        resolving a 100-test plan costs one round trip instead of 100.
+
+        Args:
+            test_keys: Jira issue keys (e.g., ["DEV-13", "DEV-14"])
+            chunk_size: Keys per query (Xray returns at most 100 results)
+
+        Returns:
+            Test details (same fields as get_test_by_key) keyed by test key;
+            keys that were not found are left out
+
+        Raises:
+            ValueError: If any of test_keys is not a Jira issue key
+        """
+        unique_keys = list(dict.fromkeys(test_keys))
+        quoted = {key: _jql_key(key) for key in unique_keys}
+        tests: Dict[str, Dict] = {}
+        for chunk in chunked(unique_keys, min(chunk_size, MAX_GET_TESTS_LIMIT)):
+            keys = ", ".join(quoted[key] for key in chunk)
+            result = self._execute_query(
+                self._GET_TESTS_WITH_STEPS,
+                {"jql": f"key in ({keys})", "limit": len(chunk)},
+            )
+            for test in result.get("getTests", {}).get("results", []):
+                tests[test["jira"]["key"]] = test
+        return tests
+
     def get_tests_by_label(self, label: str, limit: int = 100) -> List[Dict]:
         """
         Get tests by label
@@ -537,3 +826,35 @@ class XrayClient:
         result = self._execute_query(query, {"jql": jql, "limit": limit})
         plans: List[Dict[Any, Any]] = result.get("getTestPlans", {}).get("results", [])
         return plans
+
+
+_shared_clients: Dict[tuple[Optional[str], Optional[str]], XrayClient] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_client(
+    client_id: Optional[str] = None, client_secret: Optional[str] = None
+) -> XrayClient:
+    """
+    Long-lived XrayClient of this process, one per set of credentials
+
+    Reusing it keeps the token and the keep-alive connections to Xray warm
+    across calls. The Xray MCP server is its only consumer today; a pytest
+    plugin that starts talking to Xray should get its client here too.
+
+    Args:
+        client_id: Xray API client ID (defaults to XRAY_CLIENT_ID env var)
+        client_secret: Xray API client secret (defaults to XRAY_CLIENT_SECRET env var)
+
+    Returns:
+        The shared XrayClient
+    """
+    key = (
+        client_id or os.getenv("XRAY_CLIENT_ID"),
+        client_secret or os.getenv("XRAY_CLIENT_SECRET"),
+    )
+    with _shared_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = _shared_clients[key] = XrayClient(*key)
+        return client
@@ -2,15 +2,41 @@
 Pytest configuration file with fixtures for UI automation testing.
 """
 
-pytest_plugins = ["plugins.reporter"]
-
+pytest_plugins = [
+    "plugins.reporter",
+    "plugins.page_timing",
+    "plugins.self_healing",
+    "plugins.http_metrics",
+    "plugins.load",
+]
+
+import os
+import zlib
 import pytest
 from typing import Generator
 from pathlib import Path
 from playwright.sync_api import sync_playwright, Page, Browser
 from dotenv import load_dotenv
+from core.controllers.bulk import DEFAULT_BULK_WORKERS
+from core.controllers.cleanup_queue import CleanupQueue
+from core.controllers.connection_pool import DEFAULT_POOL_SIZE, PooledHTTPAdapter
 from core.controllers.pet_store_controller import PetStoreController
+from core.controllers.resilience import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_RETRIES,
+    DEFAULT_RETRY_BACKOFF,
+    HedgePolicy,
+    build_retry,
+)
+from core.controllers.response_cache import DEFAULT_CACHE_SIZE, ResponseCache
+from core.controllers.session_cache import DEFAULT_REFRESH_MARGIN, SessionCache
+from core.controllers.store_controller import StoreController
+from core.factories import PetFactory, UserFactory
+from core.id_allocator import IdAllocator, id_allocator as worker_id_allocator
+from core.stubs.pet_store_stub_server import PetStoreStubServer, StubConfig
 from core.web.pages.sauce_demo import SauceDemo
+from plugins.reporter import reporter, write_json_artifact
 import allure
 
 load_dotenv()
@@ -189,17 +215,259 @@ def sauce_ui(page: Page, base_url: str) -> SauceDemo:
     return SauceDemo(page, base_url)
 
 
+@allure.title("pet_store_base_url: Returns the Pet Store API root")
+@pytest.fixture(scope="session")
+def pet_store_base_url() -> Generator[str, None, None]:
+    """
+    Session-scoped (per xdist worker) Pet Store API root.
+    With PET_STORE_OFFLINE=true a local stub server is started and its URL is
+    returned; latency and fault injection are read from PET_STORE_STUB_*.
+    Otherwise PET_STORE_BASE_URL (or the public Pet Store) is used.
+
+    Yields:
+        str: Base URL the Pet Store controllers send requests to
+    """
+    if os.getenv("PET_STORE_OFFLINE", "false") != "true":
+        yield PetStoreController.BASE_URL
+        return
+
+    with PetStoreStubServer(StubConfig.from_env()) as stub:
+        yield stub.base_url
+
+
+@allure.title("pet_store_pool: Returns a worker-wide pooled PetStoreController")
+@pytest.fixture(scope="session")
+def pet_store_pool(
+    request, pet_store_base_url: str
+) -> Generator[PetStoreController, None, None]:
+    """
+    Session-scoped (per xdist worker) controller owning the shared connection pool.
+    Pool size and keep-alive are read from PET_STORE_POOL_SIZE and
+    PET_STORE_KEEP_ALIVE, timeouts from PET_STORE_CONNECT_TIMEOUT and
+    PET_STORE_READ_TIMEOUT, and jittered retries of idempotent requests from
+    PET_STORE_RETRIES and PET_STORE_RETRY_BACKOFF. Setting PET_STORE_CACHE_TTL
+    (seconds) enables the GET response cache, bounded by PET_STORE_CACHE_SIZE
+    entries, and PET_STORE_HEDGING=true hedges GETs slower than the
+    PET_STORE_HEDGE_PERCENTILE latency. Login sessions are reused across tests
+    unless PET_STORE_SESSION_CACHE=false, and refreshed
+    PET_STORE_SESSION_REFRESH_MARGIN seconds before they expire. Connection
+    reuse, cache, hedging and session stats are reported at session end.
+
+    Args:
+        pet_store_base_url: Pet Store API root
+
+    Yields:
+        PetStoreController: Controller whose pooled adapter is shared by all tests
+    """
+    adapter = PooledHTTPAdapter(
+        pool_size=int(os.getenv("PET_STORE_POOL_SIZE", DEFAULT_POOL_SIZE)),
+        keep_alive=os.getenv("PET_STORE_KEEP_ALIVE", "true") == "true",
+        timeout=(
+            float(os.getenv("PET_STORE_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT)),
+            float(os.getenv("PET_STORE_READ_TIMEOUT", DEFAULT_READ_TIMEOUT)),
+        ),
+        max_retries=build_retry(
+            retries=int(os.getenv("PET_STORE_RETRIES", DEFAULT_RETRIES)),
+            backoff=float(os.getenv("PET_STORE_RETRY_BACKOFF", DEFAULT_RETRY_BACKOFF)),
+        ),
+    )
+    cache_ttl = float(os.getenv("PET_STORE_CACHE_TTL", 0))
+    cache = (
+        ResponseCache(
+            ttl=cache_ttl,
+            max_entries=int(os.getenv("PET_STORE_CACHE_SIZE", DEFAULT_CACHE_SIZE)),
+        )
+        if cache_ttl > 0
+        else None
+    )
+    hedge = (
+        HedgePolicy(percentile=float(os.getenv("PET_STORE_HEDGE_PERCENTILE", 95)))
+        if os.getenv("PET_STORE_HEDGING", "false") == "true"
+        else None
+    )
+    session_cache = (
+        SessionCache(
+            refresh_margin=float(
+                os.getenv("PET_STORE_SESSION_REFRESH_MARGIN", DEFAULT_REFRESH_MARGIN)
+            )
+        )
+        if os.getenv("PET_STORE_SESSION_CACHE", "true") == "true"
+        else None
+    )
+    controller = PetStoreController(
+        adapter=adapter,
+        base_url=pet_store_base_url,
+        cache=cache,
+        hedge=hedge,
+        session_cache=session_cache,
+    )
+
+    yield controller
+
+    stats = adapter.stats().to_dict()
+    if stats["requests"]:
+        reporter.attach_json(stats, name="pet_store_connection_stats")
+        write_json_artifact(request.config, "pet_store_connection_stats", stats)
+        print(
+            f"\n🔌 Pet Store connections: {stats['requests']} requests over "
+            f"{stats['connections']} connection(s), {stats['reused']} reused"
+        )
+
+    if cache is not None:
+        cache_stats = cache.stats.to_dict()
+        reporter.attach_json(cache_stats, name="pet_store_cache_stats")
+        write_json_artifact(request.config, "pet_store_cache_stats", cache_stats)
+        print(
+            f"\n🗃 Pet Store GET cache: {cache_stats['hits']} hits, "
+            f"{cache_stats['misses']} misses ({cache_stats['hit_rate']:.0%} hit rate)"
+        )
+
+    if hedge is not None:
+        hedge_stats = hedge.stats.to_dict()
+        reporter.attach_json(hedge_stats, name="pet_store_hedge_stats")
+        write_json_artifact(request.config, "pet_store_hedge_stats", hedge_stats)
+        print(
+            f"\n🪃 Pet Store hedging: {hedge_stats['hedged']} of "
+            f"{hedge_stats['requests']} GETs hedged, {hedge_stats['hedge_wins']} won"
+        )
+        hedge.close()
+
+    if session_cache is not None:
+        session_stats = session_cache.stats.to_dict()
+        if session_stats["hits"] or session_stats["misses"]:
+            reporter.attach_json(session_stats, name="pet_store_session_stats")
+            write_json_artifact(
+                request.config, "pet_store_session_stats", session_stats
+            )
+            print(
+                f"\n🔑 Pet Store login sessions: {session_stats['hits']} reused, "
+                f"{session_stats['misses']} logins, "
+                f"{session_stats['rejected']} rejected"
+            )
+    adapter.close()
+
+
+@allure.title("id_allocator: Returns the worker's unique test data ID allocator")
+@pytest.fixture(scope="session")
+def id_allocator() -> IdAllocator:
+    """
+    Session-scoped (per xdist worker) allocator of collision-free IDs and
+    usernames. IDs are partitioned by run (TEST_RUN_ID or the xdist run UID),
+    worker and sequence, so parallel workers and concurrent CI builds never
+    collide on the shared Pet Store. Request schemas already use it for their
+    default IDs and usernames.
+
+    Returns:
+        IdAllocator: The allocator backing the request schema defaults
+    """
+    return worker_id_allocator
+
+
+@allure.title("data_seed: Returns the test's deterministic data seed")
+@pytest.fixture(scope="function")
+def data_seed(request) -> int:
+    """
+    Seed of the test's generated data, derived from the test node ID and
+    TEST_DATA_SEED, so a test generates the same content on every run and
+    worker while different tests get different content.
+
+    Returns:
+        int: Seed for the data factories
+    """
+    base = int(os.getenv("TEST_DATA_SEED", 0))
+    return base + zlib.crc32(request.node.nodeid.encode())
+
+
+@allure.title("pet_factory: Returns a seeded PetStoreAddPetRequest factory")
+@pytest.fixture(scope="function")
+def pet_factory(data_seed: int) -> PetFactory:
+    """
+    Factory of valid pets seeded per test; IDs still come from id_allocator.
+
+    Usage:
+        pets = pet_factory.build_batch(100, status="pending")
+
+    Returns:
+        PetFactory: Seeded pet factory
+    """
+    return PetFactory(seed=data_seed)
+
+
+@allure.title("user_factory: Returns a seeded PetStoreUserCreateRequest factory")
+@pytest.fixture(scope="function")
+def user_factory(data_seed: int) -> UserFactory:
+    """
+    Factory of valid users seeded per test; IDs and usernames still come from
+    id_allocator.
+
+    Returns:
+        UserFactory: Seeded user factory
+    """
+    return UserFactory(seed=data_seed)
+
+
+@allure.title("cleanup_queue: Returns the worker-wide test data cleanup queue")
+@pytest.fixture(scope="session")
+def cleanup_queue(
+    request, pet_store_pool: PetStoreController
+) -> Generator[CleanupQueue, None, None]:
+    """
+    Session-scoped (per xdist worker) queue of API resources to delete.
+    Facades such as pet_cleanup register resources and flush them at test
+    teardown; deletions run in the background with up to
+    PET_STORE_CLEANUP_WORKERS in flight. Everything left is drained at session
+    end and resources that could not be deleted are reported as leaked.
+
+    Args:
+        pet_store_pool: Worker controller, drained before its pool closes
+
+    Yields:
+        CleanupQueue: Queue to register created resources into
+    """
+    queue = CleanupQueue(
+        max_workers=int(os.getenv("PET_STORE_CLEANUP_WORKERS", DEFAULT_BULK_WORKERS))
+    )
+
+    yield queue
+
+    report = queue.drain().to_dict()
+    if report["registered"]:
+        reporter.attach_json(report, name="cleanup_report")
+        write_json_artifact(request.config, "cleanup_report", report)
+        print(
+            f"\n🧹 Cleanup: {report['deleted']} deleted, "
+            f"{report['already_gone']} already gone, {len(report['leaked'])} leaked"
+        )
+        for leaked in report["leaked"]:
+            print(f"  ⚠ Leaked {leaked['kind']} {leaked['id']}: {leaked['error']}")
+
+
 @allure.title("pet_store_controller: Returns a PetStoreController instance")
 @pytest.fixture(scope="function")
-def pet_store_controller() -> PetStoreController:
+def pet_store_controller(pet_store_pool: PetStoreController) -> PetStoreController:
     """
-    Fixture that provides a PetStoreController instance.
+    Fixture that provides a per-test PetStoreController view.
+    The view has isolated headers and api_key but reuses the worker's connection pool.
 
     Returns:
         PetStoreController: PetStoreController instance
     """
 
-    return PetStoreController()
+    return pet_store_pool.view()
+
+
+@allure.title("store_controller: Returns a StoreController instance")
+@pytest.fixture(scope="function")
+def store_controller(pet_store_controller: PetStoreController) -> StoreController:
+    """
+    Fixture that provides a StoreController for the /store endpoints.
+    It sends requests through the test's PetStoreController view, so it shares
+    the view's api_key and the worker's connection pool.
+
+    Returns:
+        StoreController: StoreController instance
+    """
+    return StoreController(pet_store_controller)
 
 
 @allure.title("logged_in_user: Returns a logged-in SauceDemo instance")
@@ -1,18 +1,22 @@
 import pytest
+from functools import partial
 from typing import Generator
+from core.controllers.cleanup_queue import CleanupQueue
 from core.controllers.pet_store_controller import PetStoreController
+from core.controllers.store_controller import StoreController
 
 
 @pytest.fixture(scope="function")
 def pet_cleanup(
-    pet_store_controller: PetStoreController,
+    pet_store_pool: PetStoreController, cleanup_queue: CleanupQueue
 ) -> Generator[list[int], None, None]:
     """
-    Fixture that tracks and cleans up created pets after tests.
+    Fixture that tracks created pets and hands them to the cleanup queue.
+    Deletion runs in the background after the test, off the critical path.
 
     Usage:
         def test_example(pet_store_controller, pet_cleanup):
-            pet_data = PetStoreAddPetRequest(id=12345, ...)
+            pet_data = PetStoreAddPetRequest(name="Buddy", ...)
             response = pet_store_controller.add_pet(pet_data)
             pet_cleanup.append(response.id)  # Track for cleanup
 
@@ -23,11 +27,59 @@ def pet_cleanup(
 
     yield pet_ids
 
-    # Cleanup: Delete all tracked pets
     for pet_id in pet_ids:
-        try:
-            pet_store_controller.delete_pet(pet_id)
-            print(f"\n✓ Cleaned up pet with ID: {pet_id}")
-        except Exception as e:
-            # Pet might not exist or already deleted (404), ignore
-            print(f"\n⚠ Could not delete pet {pet_id}: {str(e)}")
+        cleanup_queue.register(
+            "pet", pet_id, partial(pet_store_pool.delete_pet, pet_id)
+        )
+    cleanup_queue.flush()
+
+
+@pytest.fixture(scope="function")
+def user_cleanup(
+    pet_store_pool: PetStoreController, cleanup_queue: CleanupQueue
+) -> Generator[list[str], None, None]:
+    """
+    Fixture that tracks created users and hands them to the cleanup queue.
+
+    Usage:
+        def test_example(pet_store_controller, user_cleanup):
+            pet_store_controller.create_user(user_data)
+            user_cleanup.append(user_data.username)  # Track for cleanup
+
+    Yields:
+        List to track usernames for cleanup
+    """
+    usernames: list[str] = []
+
+    yield usernames
+
+    for username in usernames:
+        cleanup_queue.register(
+            "user", username, partial(pet_store_pool.delete_user, username)
+        )
+    cleanup_queue.flush()
+
+
+@pytest.fixture(scope="function")
+def order_cleanup(
+    pet_store_pool: PetStoreController, cleanup_queue: CleanupQueue
+) -> Generator[list[int], None, None]:
+    """
+    Fixture that tracks placed orders and hands them to the cleanup queue.
+
+    Usage:
+        def test_example(store_controller, order_cleanup):
+            response = store_controller.place_order(order)
+            order_cleanup.append(response.id)  # Track for cleanup
+
+    Yields:
+        List to track order IDs for cleanup
+    """
+    order_ids: list[int] = []
+
+    yield order_ids
+
+    store = StoreController(pet_store_pool)
+    for order_id in order_ids:
+        cleanup_queue.register("order", order_id, partial(store.delete_order, order_id))
+    cleanup_queue.flush()
@@ -0,0 +1,66 @@
+import asyncio
+from core.controllers.async_pet_store_controller import AsyncPetStoreController
+from core.factories import PetFactory, UserFactory
+from plugins.reporter import reporter
+
+
+def test_async_add_get_delete_pets(
+    pet_store_base_url: str, pet_factory: PetFactory
+) -> None:
+    """
+    Test adding, reading back and deleting pets concurrently with the async controller
+    Args: pet_store_base_url – fixture providing the API root (a stub when offline)
+    Steps: 1) build pets 2) add them concurrently 3) get them by ID 4) delete them
+    """
+    pets = pet_factory.build_batch(5)
+
+    async def add_get_delete():
+        async with AsyncPetStoreController(base_url=pet_store_base_url) as controller:
+            added = await asyncio.gather(*(controller.add_pet(pet) for pet in pets))
+            fetched = await asyncio.gather(
+                *(controller.get_pet_by_id(pet.id) for pet in added)
+            )
+            deleted = await asyncio.gather(
+                *(controller.delete_pet(pet.id) for pet in added)
+            )
+        return added, fetched, deleted
+
+    added, fetched, deleted = asyncio.run(add_get_delete())
+
+    reporter.assert_that([pet.id for pet in added]).is_equal_to([p.id for p in pets])
+    reporter.assert_that([pet.name for pet in fetched]).is_equal_to(
+        [p.name for p in pets]
+    )
+    for pet, response in zip(pets, deleted):
+        reporter.assert_that(response.message).is_equal_to(str(pet.id))
+
+
+def test_async_create_users_in_batches(
+    pet_store_base_url: str, user_factory: UserFactory, user_cleanup: list
+) -> None:
+    """
+    Test creating users through createWithList and createWithArray with the async controller
+    Args: pet_store_base_url – fixture providing the API root (a stub when offline)
+    Steps: 1) create one user with a list 2) create users in chunks through both endpoints 3) assert counts
+    """
+    single = user_factory.build()
+    listed = user_factory.build_batch(5)
+    arrayed = user_factory.build_batch(5)
+    user_cleanup.extend(user.username for user in [single, *listed, *arrayed])
+
+    async def create_users():
+        async with AsyncPetStoreController(base_url=pet_store_base_url) as controller:
+            return await asyncio.gather(
+                controller.create_user_with_list(single),
+                controller.create_users_with_list(listed, chunk_size=2),
+                controller.create_users_with_array(arrayed, chunk_size=2),
+            )
+
+    single_response, list_response, array_response = asyncio.run(create_users())
+
+    reporter.assert_that(single_response.code).is_equal_to(200)
+    for response in (list_response, array_response):
+        reporter.assert_that(response.total_users).is_equal_to(5)
+        reporter.assert_that(response.created_users).is_equal_to(5)
+        reporter.assert_that(response.chunks).is_equal_to(3)
+        reporter.assert_that(response.errors).is_empty()
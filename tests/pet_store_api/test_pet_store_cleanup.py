@@ -0,0 +1,49 @@
+import threading
+from functools import partial
+import pytest
+import requests
+from core.controllers.cleanup_queue import CleanupQueue
+from core.controllers.pet_store_controller import PetStoreController
+from core.factories import PetFactory
+from plugins.reporter import reporter
+
+
+def test_cleanup_queue_drained_at_session_end(
+    pet_store_base_url: str, pet_factory: PetFactory
+) -> None:
+    """
+    Test that drain() waits for background deletions and reports what leaked
+    Args: pet_store_base_url – fixture providing the API root (a stub when offline)
+    Steps: 1) add pets 2) register them, one twice and one failing 3) flush while deletions are held 4) drain 5) assert the report and that the pets are gone
+    """
+    controller = PetStoreController(base_url=pet_store_base_url)
+    pets = [controller.add_pet(pet) for pet in pet_factory.build_batch(3)]
+    release = threading.Event()
+
+    def held_delete(pet_id: int) -> None:
+        release.wait(timeout=5)
+        controller.delete_pet(pet_id)
+
+    def failing_delete() -> None:
+        raise RuntimeError("delete refused")
+
+    queue = CleanupQueue(max_workers=2)
+    for pet in pets:
+        queue.register("pet", pet.id, partial(held_delete, pet.id))
+    queue.flush()
+    queue.register("pet", pets[0].id, partial(held_delete, pets[0].id))
+    queue.register("user", "ghost", failing_delete)
+
+    reporter.assert_that(queue.report.deleted).is_equal_to(0)
+    threading.Timer(0.1, release.set).start()
+    report = queue.drain(timeout=10)
+
+    reporter.assert_that(report.registered).is_equal_to(5)
+    reporter.assert_that(report.deleted).is_equal_to(3)
+    reporter.assert_that(report.already_gone).is_equal_to(1)
+    reporter.assert_that([r.to_dict() for r in report.leaked]).is_equal_to(
+        [{"kind": "user", "id": "ghost", "error": "delete refused"}]
+    )
+    for pet in pets:
+        with pytest.raises(requests.HTTPError):
+            controller.get_pet_by_id(pet.id)
@@ -0,0 +1,49 @@
+from core.controllers.connection_pool import PooledHTTPAdapter
+from core.controllers.pet_store_controller import PetStoreController
+from core.factories import PetFactory
+from plugins.reporter import reporter
+
+REQUESTS = 10
+
+
+def test_sequential_requests_reuse_connections(
+    pet_store_base_url: str, pet_factory: PetFactory, pet_cleanup: list
+) -> None:
+    """
+    Test that sequential requests through one controller reuse pooled connections
+    Args: pet_store_base_url – fixture providing the API root (a stub when offline)
+    Steps: 1) add a pet 2) read it back REQUESTS times 3) assert fewer connections than requests
+    """
+    adapter = PooledHTTPAdapter(pool_size=2)
+    controller = PetStoreController(adapter=adapter, base_url=pet_store_base_url)
+    pet = controller.add_pet(pet_factory.build())
+    pet_cleanup.append(pet.id)
+
+    for _ in range(REQUESTS):
+        controller.get_pet_by_id(pet.id)
+
+    stats = adapter.stats()
+    reporter.assert_that(stats.requests).is_equal_to(REQUESTS + 1)
+    reporter.assert_that(stats.connections).is_less_than(REQUESTS)
+    reporter.assert_that(stats.reused).is_greater_than(0)
+
+
+def test_requests_without_keep_alive_open_a_connection_each(
+    pet_store_base_url: str, pet_factory: PetFactory, pet_cleanup: list
+) -> None:
+    """
+    Test that the connection counter sees one new connection per request without keep-alive
+    Args: pet_store_base_url – fixture providing the API root (a stub when offline)
+    Steps: 1) add a pet without keep-alive 2) read it back REQUESTS times 3) assert no reuse
+    """
+    adapter = PooledHTTPAdapter(keep_alive=False)
+    controller = PetStoreController(adapter=adapter, base_url=pet_store_base_url)
+    pet = controller.add_pet(pet_factory.build())
+    pet_cleanup.append(pet.id)
+
+    for _ in range(REQUESTS):
+        controller.get_pet_by_id(pet.id)
+
+    stats = adapter.stats()
+    reporter.assert_that(stats.connections).is_equal_to(REQUESTS + 1)
+    reporter.assert_that(stats.reused).is_equal_to(0)
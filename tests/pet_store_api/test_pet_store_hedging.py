@@ -0,0 +1,45 @@
+import threading
+import time
+from datetime import timedelta
+import requests
+from core.controllers.resilience import HedgePolicy
+from plugins.reporter import reporter
+
+ENDPOINT = "GET /pet/{petId}"
+
+
+def _response(elapsed: float) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.elapsed = timedelta(seconds=elapsed)
+    return response
+
+
+def test_hedge_samples_the_primary_that_lost() -> None:
+    """
+    Test that the hedge delay learns from the slow primary, not from the hedge that beat it
+    Args: none – the policy is driven with canned responses
+    Steps: 1) hold the primary past the hedge delay 2) let the hedge win 3) release the primary 4) assert the sampled latency
+    """
+    policy = HedgePolicy(default_delay=0.01, min_delay=0.0, min_samples=1)
+    release = threading.Event()
+    attempts = iter([0.5, 0.001])
+
+    def send() -> requests.Response:
+        elapsed = next(attempts)
+        if elapsed > 0.1:
+            release.wait(timeout=5)
+        return _response(elapsed)
+
+    try:
+        winner = policy.call(send, ENDPOINT)
+        release.set()
+        deadline = time.monotonic() + 5
+        while policy.delay_for(ENDPOINT) == 0.01 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        policy.close()
+
+    reporter.assert_that(winner.elapsed.total_seconds()).is_equal_to(0.001)
+    reporter.assert_that(policy.stats.hedge_wins).is_equal_to(1)
+    reporter.assert_that(policy.delay_for(ENDPOINT)).is_equal_to(0.5)
@@ -0,0 +1,36 @@
+import threading
+from core.controllers.http_metrics import http_metrics
+from core.controllers.pet_store_controller import PetStoreController
+from core.factories import PetFactory
+from plugins.reporter import reporter
+
+
+def test_http_metrics_attribute_calls_to_the_test(
+    request, pet_store_base_url: str, pet_factory: PetFactory, pet_cleanup: list
+) -> None:
+    """
+    Test that bulk calls count towards the running test and background calls only towards the session
+    Args: pet_store_base_url – fixture providing the API root (a stub when offline)
+    Steps: 1) add pets in bulk 2) read one from a plain background thread 3) assert per-test and session counts and the artifact shape
+    """
+    controller = PetStoreController(base_url=pet_store_base_url)
+    test_before = http_metrics.test_count(request.node.nodeid)
+    session_before = http_metrics.count
+
+    pets = pet_factory.build_batch(3)
+    results = list(controller.add_pets(pets))
+    pet_cleanup.extend(pet.id for pet in pets)
+    background = threading.Thread(target=controller.get_pet_by_id, args=(pets[0].id,))
+    background.start()
+    background.join()
+
+    reporter.assert_that([result.ok for result in results]).is_equal_to([True] * 3)
+    reporter.assert_that(http_metrics.test_count(request.node.nodeid)).is_equal_to(
+        test_before + 3
+    )
+    reporter.assert_that(http_metrics.count).is_equal_to(session_before + 4)
+    metrics = http_metrics.to_dict()
+    reporter.assert_that(metrics).does_not_contain_key("calls")
+    reporter.assert_that(metrics["endpoints"]["POST /pet"]).contains_key(
+        "count", "p50", "p95", "p99", "max", "errors", "bytes_in"
+    )
@@ -0,0 +1,27 @@
+from core.load_runner import LoadReport
+from plugins.reporter import reporter
+import pytest
+
+
+@pytest.mark.load(
+    scenarios={
+        "login": 2,
+        "add_get_delete_pet": 3,
+        "find_pets_by_status": 1,
+        "place_order": 2,
+        "create_and_delete_user": 1,
+    },
+    rps=10,
+    duration=10,
+    seed=1,
+)
+def test_pet_store_under_load(load_report: LoadReport) -> None:
+    """
+    Test that the Pet Store keeps up with a mixed open-model load.
+
+    Args:
+        load_report: Result of the load described by the marker.
+    """
+    reporter.assert_that(load_report.completed).is_greater_than(0)
+    reporter.assert_that(load_report.dropped).is_equal_to(0)
+    reporter.assert_that(load_report.error_rate).is_less_than(0.05)
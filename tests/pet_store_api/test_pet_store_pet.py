@@ -1,4 +1,8 @@
+import io
 from core.controllers.pet_store_controller import PetStoreController
+from core.controllers.response_cache import ResponseCache
+from core.factories import PetFactory
+from core.id_allocator import IdAllocator
 from core.schemas.pet_store_pet import (
     PetStoreAddPetRequest,
     Category,
@@ -16,7 +20,6 @@ def test_add_new_pet(
     Steps: 1) create pet data 2) add pet via controller 3) assert response
     """
     pet_data = PetStoreAddPetRequest(
-        id=12345,
         category=Category(id=1, name="Dogs"),
         name="Buddy",
         photoUrls=["https://example.com/photo.jpg"],
@@ -27,7 +30,7 @@ def test_add_new_pet(
     response = pet_store_controller.add_pet(pet_data)
     pet_cleanup.append(response.id)
 
-    reporter.assert_that(response.id).is_equal_to(12345)
+    reporter.assert_that(response.id).is_equal_to(pet_data.id)
     reporter.assert_that(response.name).is_equal_to("Buddy")
     reporter.assert_that(response.status).is_equal_to("available")
     assert response.category is not None
@@ -43,7 +46,6 @@ def test_get_pet_by_id(
     Steps: 1) add a pet 2) retrieve it by ID 3) assert response matches
     """
     pet_data = PetStoreAddPetRequest(
-        id=67890,
         category=Category(id=2, name="Cats"),
         name="Whiskers",
         photoUrls=["https://example.com/cat.jpg"],
@@ -54,11 +56,158 @@ def test_get_pet_by_id(
     add_response = pet_store_controller.add_pet(pet_data)
     pet_cleanup.append(add_response.id)
 
-    reporter.assert_that(add_response.id).is_equal_to(67890)
+    reporter.assert_that(add_response.id).is_equal_to(pet_data.id)
 
-    get_response = pet_store_controller.get_pet_by_id(67890)
-    reporter.assert_that(get_response.id).is_equal_to(67890)
+    get_response = pet_store_controller.get_pet_by_id(add_response.id)
+    reporter.assert_that(get_response.id).is_equal_to(pet_data.id)
     reporter.assert_that(get_response.name).is_equal_to("Whiskers")
     reporter.assert_that(get_response.status).is_equal_to("available")
     assert get_response.category is not None
     reporter.assert_that(get_response.category.name).is_equal_to("Cats")
+
+
+def test_stream_pets_by_status(
+    pet_store_controller: PetStoreController,
+    pet_factory: PetFactory,
+    id_allocator: IdAllocator,
+    pet_cleanup: list,
+) -> None:
+    """
+    Test that streaming findByStatus yields the same pets as the full fetch
+    Args: pet_store_controller – fixture providing controller instance
+    Steps: 1) add pets with a run-unique status 2) stream them in small chunks 3) fetch them in one pass 4) compare
+    """
+    status = id_allocator.username("status")
+    pets = pet_factory.build_batch(10, status=status)
+    for result in pet_store_controller.add_pets(pets):
+        pet_cleanup.append(result.item.id)
+
+    stream = pet_store_controller.iter_pets_by_status(status, chunk_size=64)
+    streamed = list(stream)
+    fetched = pet_store_controller.find_pets_by_status(status)
+
+    reporter.assert_that([pet.model_dump() for pet in streamed]).is_equal_to(
+        [pet.model_dump() for pet in fetched]
+    )
+    reporter.assert_that({pet.id for pet in streamed}).is_equal_to(
+        {pet.id for pet in pets}
+    )
+    reporter.assert_that(stream.parsed).is_equal_to(len(pets))
+    reporter.assert_that(stream.skipped).is_equal_to(0)
+
+
+def test_upload_pet_image(
+    pet_store_controller: PetStoreController,
+    pet_factory: PetFactory,
+    pet_cleanup: list,
+) -> None:
+    """
+    Test that a streamed image upload arrives whole, with a quoted file name intact
+    Args: pet_store_controller – fixture providing controller instance
+    Steps: 1) add a pet 2) upload an image named with quotes and a backslash 3) assert the reported name and size
+    """
+    pet = pet_store_controller.add_pet(pet_factory.build())
+    pet_cleanup.append(pet.id)
+
+    image = io.BytesIO(bytes(range(256)) * 1024)
+    image.name = 'pet "front"; back\\\\side.png'
+    size = len(image.getvalue())
+
+    response = pet_store_controller.upload_pet_image(
+        pet.id, image, additional_metadata="front"
+    )
+
+    reporter.assert_that(response.code).is_equal_to(200)
+    reporter.assert_that(response.message).contains("additionalMetadata: front")
+    reporter.assert_that(response.message).ends_with(
+        f"File uploaded to ./{image.name}, {size} bytes"
+    )
+    reporter.assert_that(pet_store_controller.upload_stats.bytes_sent).is_greater_than(
+        size
+    )
+
+
+def test_pet_responses_build_nested_models(
+    pet_store_controller: PetStoreController,
+    pet_factory: PetFactory,
+    id_allocator: IdAllocator,
+    pet_cleanup: list,
+) -> None:
+    """
+    Test that single and list pet responses parse category and tags into models
+    Args: pet_store_controller – fixture providing controller instance
+    Steps: 1) add pets with a run-unique status 2) get one by ID and find all by status 3) assert nested types
+    """
+    status = id_allocator.username("status")
+    pets = pet_factory.build_batch(
+        3,
+        status=status,
+        category=Category(id=3, name="Birds"),
+        tags=[Tag(id=3, name="loud"), Tag(id=4, name="green")],
+    )
+    added = [result.response for result in pet_store_controller.add_pets(pets)]
+    pet_cleanup.extend(pet.id for pet in pets)
+
+    assert added[0] is not None
+    fetched = [pet_store_controller.get_pet_by_id(added[0].id)]
+    fetched += pet_store_controller.find_pets_by_status(status)
+
+    reporter.assert_that(fetched).is_length(len(pets) + 1)
+    for pet in fetched:
+        reporter.assert_that(pet.category).is_instance_of(Category)
+        assert pet.tags
+        for tag in pet.tags:
+            reporter.assert_that(tag).is_instance_of(Tag)
+
+
+def test_get_pet_cache_invalidated_by_update(
+    pet_store_base_url: str, pet_factory: PetFactory, pet_cleanup: list
+) -> None:
+    """
+    Test that a cached pet read is served again until update_pet invalidates it
+    Args: pet_store_base_url – fixture providing the API root (a stub when offline)
+    Steps: 1) add a pet 2) read it twice 3) update it 4) read it again 5) assert hits, misses and the new name
+    """
+    cache = ResponseCache()
+    controller = PetStoreController(base_url=pet_store_base_url, cache=cache)
+    pet = controller.add_pet(pet_factory.build())
+    pet_cleanup.append(pet.id)
+
+    first = controller.get_pet_by_id(pet.id)
+    second = controller.get_pet_by_id(pet.id)
+    reporter.assert_that(cache.stats.misses).is_equal_to(1)
+    reporter.assert_that(cache.stats.hits).is_equal_to(1)
+    reporter.assert_that(second).is_equal_to(first)
+
+    controller.update_pet(
+        PetStoreAddPetRequest(**{**pet.model_dump(), "name": f"{pet.name}-renamed"})
+    )
+    updated = controller.get_pet_by_id(pet.id)
+
+    reporter.assert_that(cache.stats.invalidations).is_equal_to(1)
+    reporter.assert_that(cache.stats.misses).is_equal_to(2)
+    reporter.assert_that(updated.name).is_equal_to(f"{pet.name}-renamed")
+
+
+def test_get_pet_cache_not_shared_across_api_keys(
+    pet_store_base_url: str, pet_factory: PetFactory, pet_cleanup: list
+) -> None:
+    """
+    Test that views sharing a GET cache with different api_keys never read each other's entries
+    Args: pet_store_base_url – fixture providing the API root (a stub when offline)
+    Steps: 1) add a pet 2) read it through two views with different api_keys 3) read it again 4) assert hits and misses
+    """
+    cache = ResponseCache()
+    controller = PetStoreController(base_url=pet_store_base_url, cache=cache)
+    other = controller.view(api_key="other-key")
+    pet = controller.add_pet(pet_factory.build())
+    pet_cleanup.append(pet.id)
+
+    controller.get_pet_by_id(pet.id)
+    other.get_pet_by_id(pet.id)
+    reporter.assert_that(cache.stats.misses).is_equal_to(2)
+    reporter.assert_that(cache.stats.hits).is_equal_to(0)
+
+    other.get_pet_by_id(pet.id)
+    reporter.assert_that(cache.stats.hits).is_equal_to(1)
+    reporter.assert_that(len(cache)).is_equal_to(2)
@@ -0,0 +1,61 @@
+from core.controllers.pet_store_controller import PetStoreController
+from core.controllers.store_controller import StoreController
+from core.factories import PetFactory
+from core.id_allocator import IdAllocator
+from core.schemas.pet_store_pet import PetStoreAddPetRequest
+from core.schemas.pet_store_store import PetStoreOrderRequest
+from plugins.reporter import reporter
+
+
+def test_place_orders_concurrently(
+    pet_store_controller: PetStoreController,
+    store_controller: StoreController,
+    pet_cleanup: list,
+    order_cleanup: list,
+) -> None:
+    """
+    Test placing several orders concurrently and reading one back
+    Args: store_controller – fixture providing the store controller
+    Steps: 1) add a pet 2) place orders for it in parallel 3) assert every order 4) get one by ID
+    """
+    pet = pet_store_controller.add_pet(
+        PetStoreAddPetRequest(name="Rex", photoUrls=[], status="available")
+    )
+    pet_cleanup.append(pet.id)
+
+    orders = [PetStoreOrderRequest(petId=pet.id, quantity=n) for n in range(1, 6)]
+    results = list(store_controller.place_orders(orders))
+    order_cleanup.extend(result.item.id for result in results)
+
+    reporter.assert_that([result.ok for result in results]).does_not_contain(False)
+    for result in results:
+        assert result.response is not None
+        reporter.assert_that(result.response.id).is_equal_to(result.item.id)
+        reporter.assert_that(result.response.quantity).is_equal_to(result.item.quantity)
+        reporter.assert_that(result.response.status).is_equal_to("placed")
+
+    fetched = store_controller.get_order_by_id(orders[0].id)
+    reporter.assert_that(fetched.petId).is_equal_to(pet.id)
+
+
+def test_inventory_delta(
+    pet_store_controller: PetStoreController,
+    store_controller: StoreController,
+    id_allocator: IdAllocator,
+    pet_factory: PetFactory,
+    pet_cleanup: list,
+) -> None:
+    """
+    Test that inventory snapshots reflect newly added pets
+    Args: store_controller – fixture providing the store controller
+    Steps: 1) snapshot inventory 2) add pets with a run-unique status 3) snapshot again 4) assert delta
+    """
+    status = id_allocator.username("status")
+    before = store_controller.get_inventory()
+
+    pets = pet_factory.build_batch(3, status=status)
+    for result in pet_store_controller.add_pets(pets):
+        pet_cleanup.append(result.item.id)
+
+    after = store_controller.get_inventory()
+    reporter.assert_that(after.delta(before).get(status)).is_equal_to(len(pets))
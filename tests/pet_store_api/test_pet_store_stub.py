@@ -0,0 +1,42 @@
+import time
+import pytest
+import requests
+from core.controllers.pet_store_controller import PetStoreController
+from core.factories import PetFactory
+from core.stubs.pet_store_stub_server import Latency, PetStoreStubServer, StubConfig
+from plugins.reporter import reporter
+
+
+def test_stub_injects_latency(pet_factory: PetFactory) -> None:
+    """
+    Test that the stub server delays responses by its configured latency
+    Args: pet_factory – fixture providing seeded pets
+    Steps: 1) start a stub with fixed latency 2) add a pet and read it back 3) assert elapsed time
+    """
+    with PetStoreStubServer(StubConfig(latency=Latency.fixed(50))) as stub:
+        controller = PetStoreController(base_url=stub.base_url)
+        pet = pet_factory.build()
+
+        started = time.perf_counter()
+        added = controller.add_pet(pet)
+        fetched = controller.get_pet_by_id(added.id)
+        elapsed = time.perf_counter() - started
+
+    reporter.assert_that(fetched.name).is_equal_to(pet.name)
+    reporter.assert_that(elapsed).is_greater_than_or_equal_to(0.1)
+
+
+def test_stub_injects_errors(pet_factory: PetFactory) -> None:
+    """
+    Test that the stub server fails requests at its configured error rate
+    Args: pet_factory – fixture providing seeded pets
+    Steps: 1) start a stub failing every request 2) add a pet 3) assert the injected status
+    """
+    with PetStoreStubServer(StubConfig(error_rate=1.0, error_status=503)) as stub:
+        controller = PetStoreController(base_url=stub.base_url)
+
+        with pytest.raises(requests.HTTPError) as error:
+            controller.add_pet(pet_factory.build())
+
+    assert error.value.response is not None
+    reporter.assert_that(error.value.response.status_code).is_equal_to(503)
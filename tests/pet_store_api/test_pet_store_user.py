@@ -1,47 +1,46 @@
 from core.controllers.pet_store_controller import PetStoreController
+from core.factories import UserFactory
+from core.id_allocator import IdAllocator
 from core.schemas.pet_store_login import PetStoreLoginRequest
-from core.schemas.pet_store_user_creation import PetStoreUserCreateRequest
+from core.stubs.pet_store_stub_server import PetStoreStubServer, StubConfig
 from plugins.reporter import reporter
 import pytest
 
 
 def test_user_creation(
     pet_store_controller: PetStoreController,
+    user_factory: UserFactory,
+    user_cleanup: list,
 ) -> None:
     """
     Test the user creation functionality of the PetStoreController.
 
     Args:
         pet_store_controller: The PetStoreController instance to use for the test.
+        user_factory: Seeded factory of valid users.
     """
-    user_data = PetStoreUserCreateRequest(
-        id=12345,
-        username="testuser",
-        firstName="Test",
-        lastName="User",
-        email="testuser@example.com",
-        password="password123",
-        phone="123-456-7890",
-        userStatus=1,
-    )
+    user_data = user_factory.build()
 
     response = pet_store_controller.create_user(user_data)
+    user_cleanup.append(user_data.username)
+
     reporter.assert_that(response.code).is_equal_to(200)
     reporter.assert_that(response.type).is_equal_to("unknown")
-    reporter.assert_that(response.message).is_equal_to("12345")
+    reporter.assert_that(response.message).is_equal_to(str(user_data.id))
 
 
 def test_user_login(
-    pet_store_controller: PetStoreController,
+    pet_store_controller: PetStoreController, id_allocator: IdAllocator
 ) -> None:
     """
     Test the user login functionality of the PetStoreController.
 
     Args:
         pet_store_controller: The PetStoreController instance to use for the test.
+        id_allocator: Allocator of unique usernames.
     """
     login_data = PetStoreLoginRequest(
-        username="testuser",
+        username=id_allocator.username(),
         password="password123",
     )
 
@@ -49,3 +48,87 @@ def test_user_login(
     reporter.assert_that(response.code).is_equal_to(200)
     reporter.assert_that(response.type).is_equal_to("unknown")
     reporter.assert_that(response.message).contains("logged in user session:")
+
+
+def test_login_session_is_reused(
+    pet_store_controller: PetStoreController, id_allocator: IdAllocator
+) -> None:
+    """
+    Test that a user's login session is cached and refreshed after rejection.
+
+    Args:
+        pet_store_controller: The PetStoreController instance to use for the test.
+        id_allocator: Allocator of unique usernames.
+    """
+    if pet_store_controller.session_cache is None:
+        pytest.skip("Login session cache disabled (PET_STORE_SESSION_CACHE=false)")
+
+    login_data = PetStoreLoginRequest(
+        username=id_allocator.username(),
+        password="password123",
+    )
+    stats = pet_store_controller.session_cache.stats
+    hits_before = stats.hits
+
+    first = pet_store_controller.login_session(login_data)
+    second = pet_store_controller.login_session(login_data)
+    reporter.assert_that(first.token).is_not_empty()
+    reporter.assert_that(second).is_same_as(first)
+    reporter.assert_that(stats.hits).is_equal_to(hits_before + 1)
+
+    refreshed = pet_store_controller.refresh_login_session(login_data)
+    reporter.assert_that(refreshed).is_not_same_as(first)
+    reporter.assert_that(refreshed.expires_in()).is_greater_than(0)
+
+
+def test_create_users_in_chunks(
+    pet_store_controller: PetStoreController,
+    user_factory: UserFactory,
+    user_cleanup: list,
+) -> None:
+    """
+    Test creating users in chunks through createWithList and createWithArray.
+
+    Args:
+        pet_store_controller: The PetStoreController instance to use for the test.
+        user_factory: Seeded factory of valid users.
+    """
+    listed = user_factory.build_batch(5)
+    arrayed = user_factory.build_batch(5)
+    user_cleanup.extend(user.username for user in [*listed, *arrayed])
+
+    list_response = pet_store_controller.create_users_with_list(listed, chunk_size=2)
+    array_response = pet_store_controller.create_users_with_array(arrayed, chunk_size=2)
+
+    for response in (list_response, array_response):
+        reporter.assert_that(response.total_users).is_equal_to(5)
+        reporter.assert_that(response.created_users).is_equal_to(5)
+        reporter.assert_that(response.chunks).is_equal_to(3)
+        reporter.assert_that(response.failed_chunks).is_equal_to(0)
+        reporter.assert_that(response.errors).is_empty()
+
+
+def test_create_users_with_failing_chunk(user_factory: UserFactory) -> None:
+    """
+    Test that a failed chunk is reported without losing the chunks that succeeded.
+
+    Args:
+        user_factory: Seeded factory of valid users.
+    """
+    # Seed 10 fails exactly the second of three sequential requests at this rate
+    config = StubConfig(error_rate=0.5, error_status=503, seed=10)
+    users = user_factory.build_batch(5)
+
+    with PetStoreStubServer(config) as stub:
+        controller = PetStoreController(base_url=stub.base_url)
+        response = controller.create_users_with_list(users, chunk_size=2, max_workers=1)
+
+    reporter.assert_that(response.total_users).is_equal_to(5)
+    reporter.assert_that(response.chunks).is_equal_to(3)
+    reporter.assert_that(response.created_users).is_equal_to(3)
+    reporter.assert_that(response.failed_chunks).is_equal_to(1)
+    reporter.assert_that(response.errors).is_length(1)
+    reporter.assert_that(response.errors[0]).contains("503")
+    reporter.assert_that(set(stub.state.users)).is_equal_to(
+        {users[0].username, users[1].username, users[4].username}
+    )
@@ -0,0 +1,104 @@
+import pytest
+from core.web.consts import PagesURL
+from core.web.pages.checkout_step_one_page import CheckoutInformation
+from plugins.reporter import reporter
+
+TEST_SUITE_NAME = "SauceDemo Checkout Page Tests"
+
+
+def test_checkout_step_one_deep_link_with_seeded_cart(logged_in_user):
+    """Test that checkout step one can be entered directly with a seeded cart.
+
+    Verifies that the navigation planner deep-links to the first checkout step
+    without walking the inventory and cart pages.
+
+    Args:
+        logged_in_user: Fixture providing logged-in SauceDemo instance
+
+    Steps:
+        1) Seed cart with an item and deep-link to checkout step one
+        2) Verify the page URL and title
+    """
+    logged_in_user.navigate_to(
+        PagesURL.CheckoutStepOne, cart_items=["Sauce Labs Backpack"]
+    )
+
+    reporter.assert_that(logged_in_user.page.url).ends_with(PagesURL.CheckoutStepOne)
+    reporter.assert_that(logged_in_user.checkout_step_one_page.page_title).is_equal_to(
+        "Checkout: Your Information"
+    )
+
+
+def test_checkout_step_one_requires_first_name(logged_in_user):
+    """Test that checkout step one validates the first name field.
+
+    Args:
+        logged_in_user: Fixture providing logged-in SauceDemo instance
+
+    Steps:
+        1) Deep-link to checkout step one with an item in the cart
+        2) Click continue without filling the form
+        3) Verify the first name validation error is displayed
+    """
+    logged_in_user.navigate_to(
+        PagesURL.CheckoutStepOne, cart_items=["Sauce Labs Backpack"]
+    )
+
+    logged_in_user.checkout_step_one_page.click_continue()
+
+    reporter.assert_that(
+        logged_in_user.checkout_step_one_page.error_message
+    ).is_equal_to("Error: First Name is required")
+
+
+def test_checkout_overview_totals(logged_in_user):
+    """Test that checkout overview lists seeded items and sums the totals.
+
+    Args:
+        logged_in_user: Fixture providing logged-in SauceDemo instance
+
+    Steps:
+        1) Seed cart with two items and deep-link to checkout step two
+        2) Verify both items are listed
+        3) Verify item total equals the sum of item prices
+        4) Verify total equals item total plus tax
+    """
+    logged_in_user.navigate_to(
+        PagesURL.CheckoutStepTwo,
+        cart_items=["Sauce Labs Backpack", "Sauce Labs Bike Light"],
+    )
+    overview = logged_in_user.checkout_step_two_page
+
+    reporter.assert_that(overview.get_item_names()).contains_only(
+        "Sauce Labs Backpack", "Sauce Labs Bike Light"
+    )
+    reporter.assert_that(overview.item_total).is_close_to(
+        sum(overview.get_item_prices()), 0.01
+    )
+    reporter.assert_that(overview.total).is_close_to(
+        overview.item_total + overview.tax, 0.01
+    )
+
+
+@pytest.mark.sanity
+def test_complete_checkout_through_ui(logged_in_user):
+    """Test that a purchase can be completed through the full UI flow.
+
+    Args:
+        logged_in_user: Fixture providing logged-in SauceDemo instance
+
+    Steps:
+        1) Walk login, inventory, cart and checkout pages through the UI
+        2) Verify the order confirmation header is displayed
+    """
+    logged_in_user.navigate_to(
+        PagesURL.CheckoutComplete,
+        cart_items=["Sauce Labs Backpack"],
+        checkout_information=CheckoutInformation("Jane", "Doe", "10001"),
+        via_ui=True,
+    )
+
+    reporter.assert_that(logged_in_user.page.url).ends_with(PagesURL.CheckoutComplete)
+    reporter.assert_that(
+        logged_in_user.checkout_complete_page.complete_header
+    ).is_equal_to("Thank you for your order!")
@@ -47,9 +47,10 @@ def test_add_item_to_cart_updates_badge(logged_in_user):
 
     logged_in_user.inventory_page.add_item_to_cart("Sauce Labs Backpack")
 
-    reporter.assert_that(logged_in_user.inventory_page.cart_badge_count).is_equal_to(
-        "1"
-    )
+    reporter.expect_that(
+        lambda: logged_in_user.inventory_page.cart_badge_count,
+        description="cart badge count",
+    ).is_equal_to("1")
 
 
 @pytest.mark.test_case_key("DEV-66")
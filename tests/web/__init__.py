@@ -0,0 +1 @@
+"""Page object framework unit tests package"""
@@ -0,0 +1,99 @@
+import time
+import pytest
+import plugins.page_timing
+from core.web import instrumentation
+from core.web.instrumentation import InstrumentedMeta, PageTimingRecorder
+from plugins.reporter import reporter
+
+
+class StubPage(metaclass=InstrumentedMeta):
+    """Page object stand-in that needs no browser."""
+
+    __untimed__ = ("untimed",)
+
+    def open(self) -> None:
+        time.sleep(0.01)
+
+    @property
+    def title(self) -> str:
+        return "Products"
+
+    def untimed(self) -> None:
+        pass
+
+    def _helper(self) -> None:
+        pass
+
+
+@pytest.fixture
+def recorder(monkeypatch) -> PageTimingRecorder:
+    """Fresh enabled recorder in place of the session-wide timing_recorder."""
+    recorder = PageTimingRecorder()
+    recorder.enable()
+    monkeypatch.setattr(instrumentation, "timing_recorder", recorder)
+    monkeypatch.setattr(plugins.page_timing, "timing_recorder", recorder)
+    return recorder
+
+
+def test_page_methods_are_timed_per_method(recorder: PageTimingRecorder) -> None:
+    """
+    Test that public methods and properties are timed per method, private and untimed ones are not
+    Args: recorder – fixture providing an enabled recorder
+    Steps: 1) call methods of a stub page 2) assert the per-method histogram
+    """
+    page = StubPage()
+    page.open()
+    page.open()
+    reporter.assert_that(page.title).is_equal_to("Products")
+    page.untimed()
+    page._helper()
+
+    histogram = recorder.histogram()
+
+    reporter.assert_that(sorted(histogram)).is_equal_to(
+        ["StubPage.open", "StubPage.title"]
+    )
+    reporter.assert_that(histogram["StubPage.open"]["count"]).is_equal_to(2)
+    reporter.assert_that(histogram["StubPage.open"]["p50"]).is_greater_than_or_equal_to(
+        0.01
+    )
+    reporter.assert_that(histogram["StubPage.title"]["count"]).is_equal_to(1)
+
+
+def test_disabled_recorder_records_nothing(recorder: PageTimingRecorder) -> None:
+    """
+    Test that wrapped methods call straight through while the recorder is disabled
+    Args: recorder – fixture providing an enabled recorder
+    Steps: 1) disable the recorder 2) call a stub page method 3) assert nothing was recorded
+    """
+    recorder.disable()
+
+    StubPage().open()
+
+    reporter.assert_that(recorder.count).is_equal_to(0)
+
+
+def test_histogram_attached_at_teardown(
+    recorder: PageTimingRecorder, monkeypatch
+) -> None:
+    """
+    Test that the page timing fixture attaches the histogram when the session ends
+    Args: recorder – fixture providing an enabled recorder
+    Steps: 1) start the report fixture 2) call a stub page method 3) finish the fixture 4) assert the attachment
+    """
+    attached: list[tuple[dict, str]] = []
+    monkeypatch.setattr(
+        reporter, "attach_json", lambda data, name: attached.append((data, name))
+    )
+    fixture = plugins.page_timing.page_timing_report
+    report = fixture.__wrapped__()  # type: ignore[attr-defined]
+
+    next(report)
+    StubPage().open()
+    reporter.assert_that(attached).is_empty()
+    next(report, None)
+
+    reporter.assert_that(attached).is_length(1)
+    data, name = attached[0]
+    reporter.assert_that(name).is_equal_to("page_timing_histogram")
+    reporter.assert_that(data["StubPage.open"]["count"]).is_equal_to(1)
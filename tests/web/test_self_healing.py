@@ -0,0 +1,169 @@
+from pathlib import Path
+from typing import cast
+import pytest
+from playwright.sync_api import Error as PlaywrightError, Page
+from core.web.self_healing import (
+    LastGoodCache,
+    SelectorHealer,
+    SelectorHealingError,
+    SelfHealingLocator,
+    by_css,
+    by_role,
+    by_test_id,
+)
+from plugins.reporter import reporter
+
+BUTTON = SelfHealingLocator(
+    "add_button",
+    by_test_id("add-{slug}"),
+    by_role("button", "Add {slug}"),
+    by_css("#add-{slug}"),
+)
+
+
+class FakeLocator:
+    """Locator over the selectors of a FakePage; matches if any selector exists."""
+
+    def __init__(self, page: "FakePage", selectors: tuple[str, ...]):
+        self.page = page
+        self.selectors = selectors
+
+    @property
+    def first(self) -> "FakeLocator":
+        return self
+
+    def or_(self, other: "FakeLocator") -> "FakeLocator":
+        return FakeLocator(self.page, self.selectors + other.selectors)
+
+    def count(self) -> int:
+        return sum(selector in self.page.present for selector in self.selectors)
+
+    def wait_for(self, state: str, timeout: float) -> None:
+        self.page.waits.append((self.selectors, timeout))
+        if not self.count():
+            raise PlaywrightError(f"Timeout {timeout}ms exceeded")
+
+
+class FakePage:
+    """Page stand-in whose DOM is the set of selectors in present."""
+
+    def __init__(self, *present: str):
+        self.present = set(present)
+        self.waits: list[tuple[tuple[str, ...], float]] = []
+        self.load_waits = 0
+
+    def locator(self, selector: str) -> FakeLocator:
+        return FakeLocator(self, (selector,))
+
+    def get_by_role(self, role: str, name: str, exact: bool) -> FakeLocator:
+        return FakeLocator(self, (f"role={role}[name={name}]",))
+
+    def wait_for_load_state(self, timeout: float) -> None:
+        self.load_waits += 1
+
+
+@pytest.fixture
+def healer(tmp_path: Path) -> SelectorHealer:
+    """Healer with short timeouts and a last-good cache in a temporary file."""
+    return SelectorHealer(
+        LastGoodCache(tmp_path / "last_good.json"), timeout=500, fast_timeout=50
+    )
+
+
+def _resolve(
+    healer: SelectorHealer, page: FakePage, slug: str = "backpack"
+) -> tuple[str, ...]:
+    locator = healer.resolve(
+        cast(Page, page), "InventoryPage", BUTTON.format(slug=slug)
+    )
+    return cast(FakeLocator, locator).selectors
+
+
+def test_primary_match_is_used(healer: SelectorHealer) -> None:
+    """
+    Test that a matching primary strategy is used without healing or waiting for load
+    Args: healer – fixture providing a healer with a temporary cache
+    Steps: 1) resolve on a page where primary and fallback match 2) assert primary and no heal
+    """
+    page = FakePage("[data-test='add-backpack']", "#add-backpack")
+
+    reporter.assert_that(_resolve(healer, page)).is_equal_to(
+        ("[data-test='add-backpack']",)
+    )
+    reporter.assert_that(healer.events).is_empty()
+    reporter.assert_that(page.load_waits).is_equal_to(0)
+
+
+def test_only_fallback_matches_heals(healer: SelectorHealer) -> None:
+    """
+    Test that the first matching fallback heals a missing primary and is cached
+    Args: healer – fixture providing a healer with a temporary cache
+    Steps: 1) resolve on a page with only the css fallback 2) assert the fallback, a heal event and the cache
+    """
+    page = FakePage("#add-backpack")
+
+    reporter.assert_that(_resolve(healer, page)).is_equal_to(("#add-backpack",))
+    reporter.assert_that(page.load_waits).is_equal_to(1)
+    reporter.assert_that(healer.events).is_length(1)
+    reporter.assert_that(healer.events[0].healed_with).is_equal_to("css=#add-backpack")
+    key = BUTTON.format(slug="backpack").cache_key
+    reporter.assert_that(healer.cache.get("InventoryPage", key)).is_equal_to(2)
+
+
+def test_cached_fallback_wins_with_short_timeout(healer: SelectorHealer) -> None:
+    """
+    Test that a cached fallback is tried first with the short timeout and does not heal again
+    Args: healer – fixture providing a healer with a temporary cache
+    Steps: 1) heal once 2) resolve again on a page where both fallbacks match 3) assert the cached one, one wait, no new event
+    """
+    _resolve(healer, FakePage("#add-backpack"))
+    page = FakePage("role=button[name=Add backpack]", "#add-backpack")
+
+    reporter.assert_that(_resolve(healer, page)).is_equal_to(("#add-backpack",))
+    reporter.assert_that(page.waits).is_equal_to([(("#add-backpack",), 50)])
+    reporter.assert_that(page.load_waits).is_equal_to(0)
+    reporter.assert_that(healer.events).is_length(1)
+
+
+def test_formatted_variants_are_cached_separately(healer: SelectorHealer) -> None:
+    """
+    Test that a heal of one product slug does not change the strategy of another
+    Args: healer – fixture providing a healer with a temporary cache
+    Steps: 1) heal the backpack button 2) resolve the bike light button 3) assert its primary is used
+    """
+    _resolve(healer, FakePage("#add-backpack"))
+    page = FakePage("[data-test='add-bike-light']", "#add-bike-light")
+
+    reporter.assert_that(_resolve(healer, page, slug="bike-light")).is_equal_to(
+        ("[data-test='add-bike-light']",)
+    )
+
+
+def test_primary_back_resets_cached_fallback(healer: SelectorHealer) -> None:
+    """
+    Test that the primary wins again once it resolves, and the cache returns to it
+    Args: healer – fixture providing a healer with a temporary cache
+    Steps: 1) heal once 2) resolve on a page where the primary is back 3) assert the primary and the cache
+    """
+    _resolve(healer, FakePage("#add-backpack"))
+    page = FakePage("[data-test='add-backpack']", "#add-backpack")
+
+    reporter.assert_that(_resolve(healer, page)).is_equal_to(
+        ("[data-test='add-backpack']",)
+    )
+    key = BUTTON.format(slug="backpack").cache_key
+    reporter.assert_that(healer.cache.get("InventoryPage", key)).is_equal_to(0)
+
+
+def test_nothing_matches_raises(healer: SelectorHealer) -> None:
+    """
+    Test that a missing element fails after the healing timeout, not the page default
+    Args: healer – fixture providing a healer with a temporary cache
+    Steps: 1) resolve on an empty page 2) assert SelectorHealingError and the bounded wait
+    """
+    page = FakePage()
+
+    with pytest.raises(SelectorHealingError, match="no strategy matched"):
+        _resolve(healer, page)
+    reporter.assert_that([timeout for _, timeout in page.waits]).is_equal_to([500])
+    reporter.assert_that(healer.events).is_empty()
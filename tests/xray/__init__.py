@@ -0,0 +1 @@
+"""Xray client unit tests package"""
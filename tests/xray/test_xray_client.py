@@ -0,0 +1,125 @@
+import json
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+import plugins.xray
+from plugins.reporter import reporter
+from plugins.xray import XrayClient, shared_client
+
+
+class FakeTransport:
+    """HTTPAdapter.send stand-in answering Xray auth and GraphQL requests."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[HTTPAdapter, requests.PreparedRequest, dict]] = []
+
+    def __call__(
+        self, adapter: HTTPAdapter, request: requests.PreparedRequest, **kwargs
+    ) -> requests.Response:
+        self.calls.append((adapter, request, kwargs))
+        response = requests.Response()
+        response.status_code = 200
+        response.request = request
+        if request.url and request.url.endswith("/authenticate"):
+            response._content = json.dumps("token").encode()
+        else:
+            response._content = json.dumps({"data": {"getTest": {}}}).encode()
+        return response
+
+
+@pytest.fixture
+def transport(monkeypatch) -> FakeTransport:
+    """Replaces the network below the client's pooled adapter."""
+    transport = FakeTransport()
+    monkeypatch.setattr(
+        HTTPAdapter,
+        "send",
+        lambda adapter, request, **kwargs: transport(adapter, request, **kwargs),
+    )
+    monkeypatch.setenv("XRAY_TOKEN_CACHE", "false")
+    monkeypatch.setattr(plugins.xray, "_shared_clients", {})
+    return transport
+
+
+def test_client_reuses_one_pooled_session(transport: FakeTransport) -> None:
+    """
+    Test that queries go through the client's own pooled adapter with its timeout and compression
+    Args: transport – fixture answering requests below the adapter
+    Steps: 1) build a client with explicit pool settings 2) run three queries 3) assert one adapter, the settings and one authentication
+    """
+    client = XrayClient(
+        "client-id", "client-secret", pool_size=3, timeout=(1.0, 2.0), compression=True
+    )
+
+    for issue_id in ("1", "2", "3"):
+        client.get_test(issue_id)
+
+    reporter.assert_that(transport.calls).is_length(4)
+    reporter.assert_that(
+        {id(adapter) for adapter, _, _ in transport.calls}
+    ).is_equal_to({id(client.adapter)})
+    reporter.assert_that(
+        client.adapter.poolmanager.connection_pool_kw["maxsize"]
+    ).is_equal_to(3)
+    for _, request, kwargs in transport.calls:
+        reporter.assert_that(kwargs["timeout"]).is_equal_to((1.0, 2.0))
+        reporter.assert_that(request.headers["Accept-Encoding"]).is_equal_to(
+            "gzip, deflate"
+        )
+    reporter.assert_that(client.adapter.stats().requests).is_equal_to(4)
+
+
+def test_client_without_compression_asks_for_identity(
+    transport: FakeTransport,
+) -> None:
+    """
+    Test that compression can be turned off
+    Args: transport – fixture answering requests below the adapter
+    Steps: 1) build a client without compression 2) run a query 3) assert the Accept-Encoding header
+    """
+    client = XrayClient("client-id", "client-secret", compression=False)
+
+    client.get_test("1")
+
+    _, request, _ = transport.calls[-1]
+    reporter.assert_that(request.headers["Accept-Encoding"]).is_equal_to("identity")
+
+
+def test_metrics_record_latency_per_operation(transport: FakeTransport) -> None:
+    """
+    Test that metrics() reports per-operation latency of every call and connection stats
+    Args: transport – fixture answering requests below the adapter
+    Steps: 1) run two GetTest queries 2) read metrics 3) assert counts and latencies per operation
+    """
+    client = XrayClient("client-id", "client-secret")
+
+    client.get_test("1")
+    client.get_test("2")
+    metrics = client.metrics()
+
+    operations = metrics["operations"]
+    reporter.assert_that(sorted(operations)).is_equal_to(["GetTest", "authenticate"])
+    reporter.assert_that(operations["authenticate"]["count"]).is_equal_to(1)
+    reporter.assert_that(operations["GetTest"]["count"]).is_equal_to(2)
+    reporter.assert_that(operations["GetTest"]).contains_key("p50", "p95", "p99", "max")
+    reporter.assert_that(metrics["connections"]["requests"]).is_equal_to(3)
+
+
+def test_shared_client_is_reused_per_credentials(transport: FakeTransport) -> None:
+    """
+    Test that shared_client() returns one long-lived client per set of credentials
+    Args: transport – fixture answering requests below the adapter
+    Steps: 1) get the shared client twice and for other credentials 2) query through both 3) assert reuse and one authentication
+    """
+    first = shared_client("client-id", "client-secret")
+    second = shared_client("client-id", "client-secret")
+    other = shared_client("other-id", "other-secret")
+
+    first.get_test("1")
+    second.get_test("2")
+
+    reporter.assert_that(second).is_same_as(first)
+    reporter.assert_that(other).is_not_same_as(first)
+    reporter.assert_that(
+        first.metrics()["operations"]["authenticate"]["count"]
+    ).is_equal_to(1)
@@ -0,0 +1,128 @@
+import json
+import re
+from typing import Any, Dict
+import pytest
+from plugins.reporter import reporter
+from plugins.xray import MAX_GET_TESTS_LIMIT, XrayClient
+
+
+class FakeGetTests:
+    """_execute_query stand-in answering `key in (...)` JQL from a set of known keys."""
+
+    def __init__(self, known: set[str]) -> None:
+        self.known = known
+        self.queries: list[Dict[str, Any]] = []
+
+    def __call__(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        self.queries.append(variables)
+        keys = re.findall(r'"([^"]+)"', variables["jql"])
+        results = [
+            {"issueId": key.split("-")[1], "jira": {"key": key}}
+            for key in keys
+            if key in self.known
+        ]
+        return {"getTests": {"total": len(results), "results": results}}
+
+    def chunks(self) -> list[list[str]]:
+        return [re.findall(r'"([^"]+)"', query["jql"]) for query in self.queries]
+
+
+@pytest.fixture
+def client(monkeypatch) -> XrayClient:
+    """XrayClient that never touches the token cache."""
+    monkeypatch.setenv("XRAY_TOKEN_CACHE", "false")
+    return XrayClient("client-id", "client-secret")
+
+
+def test_get_tests_by_keys_chunks_to_the_query_limit(
+    monkeypatch, client: XrayClient
+) -> None:
+    """
+    Test that keys are sent in chunks of at most MAX_GET_TESTS_LIMIT, whatever chunk_size asks for
+    Args: client – fixture providing an XrayClient without token cache
+    Steps: 1) stub the query 2) resolve 250 keys with an oversized chunk_size 3) assert chunk sizes and limits
+    """
+    keys = [f"DEV-{number}" for number in range(1, 251)]
+    fake = FakeGetTests(set(keys))
+    monkeypatch.setattr(client, "_execute_query", fake)
+
+    tests = client.get_tests_by_keys(keys, chunk_size=500)
+
+    reporter.assert_that([len(chunk) for chunk in fake.chunks()]).is_equal_to(
+        [MAX_GET_TESTS_LIMIT, MAX_GET_TESTS_LIMIT, 50]
+    )
+    reporter.assert_that([query["limit"] for query in fake.queries]).is_equal_to(
+        [MAX_GET_TESTS_LIMIT, MAX_GET_TESTS_LIMIT, 50]
+    )
+    reporter.assert_that(list(tests)).is_equal_to(keys)
+
+
+def test_get_tests_by_keys_dedupes_and_omits_missing(
+    monkeypatch, client: XrayClient
+) -> None:
+    """
+    Test that duplicate keys are queried once in order and unknown keys are left out
+    Args: client – fixture providing an XrayClient without token cache
+    Steps: 1) stub the query knowing two keys 2) resolve keys with duplicates and an unknown one 3) assert the JQL and the result mapping
+    """
+    fake = FakeGetTests({"DEV-13", "DEV-14"})
+    monkeypatch.setattr(client, "_execute_query", fake)
+
+    tests = client.get_tests_by_keys(
+        ["DEV-14", "DEV-13", "DEV-14", "DEV-99", "DEV-13"], chunk_size=2
+    )
+
+    reporter.assert_that(fake.chunks()).is_equal_to([["DEV-14", "DEV-13"], ["DEV-99"]])
+    reporter.assert_that(fake.queries[0]["jql"]).is_equal_to(
+        'key in ("DEV-14", "DEV-13")'
+    )
+    reporter.assert_that(tests).is_equal_to(
+        {
+            "DEV-14": {"issueId": "14", "jira": {"key": "DEV-14"}},
+            "DEV-13": {"issueId": "13", "jira": {"key": "DEV-13"}},
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "bad_key",
+    ['DEV-1" OR key = "PROD-1', 'DEV-1\\"', "dev-1", "DEV-", "DEV-1 ", "DEV-1\n", ""],
+)
+def test_get_tests_by_keys_rejects_non_issue_keys(
+    monkeypatch, client: XrayClient, bad_key: str
+) -> None:
+    """
+    Test that anything but a plain Jira issue key is rejected before any JQL is sent
+    Args: bad_key – key that would break out of or corrupt the JQL string
+    Steps: 1) stub the query 2) resolve a valid and an invalid key 3) assert ValueError and no query sent
+    """
+    fake = FakeGetTests({"DEV-13"})
+    monkeypatch.setattr(client, "_execute_query", fake)
+
+    with pytest.raises(ValueError, match="Invalid Jira issue key"):
+        client.get_tests_by_keys(["DEV-13", bad_key])
+    with pytest.raises(ValueError, match="Invalid Jira issue key"):
+        client.get_test_by_key(bad_key)
+
+    reporter.assert_that(fake.queries).is_empty()
+
+
+def test_xray_get_tests_tool(monkeypatch, client: XrayClient) -> None:
+    """
+    Test that the xray_get_tests MCP tool splits the comma-separated keys and returns the mapping as JSON
+    Args: client – fixture providing an XrayClient without token cache
+    Steps: 1) route the tool to a stubbed shared client 2) call it with padded and empty entries 3) assert the queried keys and the JSON
+    """
+    pytest.importorskip("fastmcp")
+    from mcp_server import xray_server
+
+    fake = FakeGetTests({"DEV-13"})
+    monkeypatch.setattr(client, "_execute_query", fake)
+    monkeypatch.setattr(xray_server, "shared_client", lambda *credentials: client)
+
+    output = xray_server.xray_get_tests.fn(" DEV-13, DEV-14,,DEV-13 ")
+
+    reporter.assert_that(fake.chunks()).is_equal_to([["DEV-13", "DEV-14"]])
+    reporter.assert_that(json.loads(output)).is_equal_to(
+        {"DEV-13": {"issueId": "13", "jira": {"key": "DEV-13"}}}
+    )
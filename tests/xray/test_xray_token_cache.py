@@ -0,0 +1,202 @@
+import base64
+import json
+import time
+from datetime import timedelta
+from pathlib import Path
+import pytest
+import requests
+from plugins.reporter import reporter
+from plugins.xray import DEFAULT_TOKEN_TTL, XrayClient, XrayTokenCache, token_expiry
+
+
+def _jwt(claims: dict) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=")
+    return f"header.{payload.decode()}.signature"
+
+
+def _response(status: int, payload: object) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(payload).encode()
+    response.elapsed = timedelta(milliseconds=5)
+    return response
+
+
+class FakeSession:
+    """Session stand-in answering GraphQL posts with queued responses."""
+
+    def __init__(self, *responses: requests.Response):
+        self.responses = list(responses)
+        self.tokens: list[str] = []
+
+    def post(self, url: str, json: dict, headers: dict) -> requests.Response:
+        self.tokens.append(headers["Authorization"])
+        return self.responses.pop(0)
+
+
+class TokenIssuer:
+    """_request_token stand-in issuing numbered tokens that expire in ttl seconds."""
+
+    def __init__(self, ttl: float | None = 3600):
+        self.ttl = ttl
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        if self.ttl is None:
+            return f"opaque-{self.calls}"
+        return _jwt({"n": self.calls, "exp": time.time() + self.ttl})
+
+
+@pytest.fixture
+def issuer(monkeypatch) -> TokenIssuer:
+    """Counts authentications instead of calling Xray."""
+    issuer = TokenIssuer()
+    monkeypatch.setattr(XrayClient, "_request_token", lambda client: issuer())
+    return issuer
+
+
+@pytest.fixture
+def token_cache(tmp_path: Path) -> XrayTokenCache:
+    """Token cache in a temporary file."""
+    return XrayTokenCache(tmp_path / "token.json", refresh_margin=300)
+
+
+def _client(token_cache: XrayTokenCache) -> XrayClient:
+    return XrayClient("client-id", "client-secret", token_cache=token_cache)
+
+
+def test_cached_token_is_reused_across_clients(
+    issuer: TokenIssuer, token_cache: XrayTokenCache
+) -> None:
+    """
+    Test that a second client (e.g. another xdist worker) reuses the cached token
+    Args: issuer – fixture counting authentications; token_cache – fixture with a tmp cache file
+    Steps: 1) authenticate two clients on one cache file 2) assert one authentication and the same token
+    """
+    first, second = _client(token_cache), _client(token_cache)
+
+    first._authenticate()
+    second._authenticate()
+
+    reporter.assert_that(issuer.calls).is_equal_to(1)
+    reporter.assert_that(second.token).is_equal_to(first.token)
+    reporter.assert_that(second._token_is_fresh()).is_true()
+
+
+@pytest.mark.parametrize("ttl", [-60, 60], ids=["expired", "near_expiry"])
+def test_expiring_token_is_refreshed(
+    issuer: TokenIssuer, token_cache: XrayTokenCache, ttl: float
+) -> None:
+    """
+    Test that a cached token that expired, or expires within the refresh margin, is replaced
+    Args: ttl – seconds until the cached token expires
+    Steps: 1) cache a token expiring in ttl 2) authenticate a new client 3) assert a new token was requested
+    """
+    issuer.ttl = ttl
+    stale = _client(token_cache)
+    stale._authenticate()
+    issuer.ttl = 3600
+
+    fresh = _client(token_cache)
+    fresh._authenticate()
+
+    reporter.assert_that(issuer.calls).is_equal_to(2)
+    reporter.assert_that(fresh.token).is_not_equal_to(stale.token)
+    reporter.assert_that(fresh.token_expires_at).is_greater_than(time.time() + 3000)
+
+
+@pytest.mark.parametrize(
+    "token",
+    ["opaque-token", "a.!!!.c", _jwt({"sub": "no-exp"}), _jwt({"exp": "soon"})],
+    ids=["not_a_jwt", "bad_base64", "no_exp", "non_numeric_exp"],
+)
+def test_token_without_readable_expiry(token: str) -> None:
+    """
+    Test that tokens whose expiry cannot be read are treated as unknown, not as expired
+    Args: token – bearer token without a usable exp claim
+    Steps: 1) read the expiry 2) assert None
+    """
+    reporter.assert_that(token_expiry(token)).is_none()
+
+
+def test_token_without_expiry_falls_back_to_default_ttl(
+    issuer: TokenIssuer, token_cache: XrayTokenCache
+) -> None:
+    """
+    Test that an opaque token is cached for the default TTL and reused, not re-requested in a loop
+    Args: issuer – fixture counting authentications; token_cache – fixture with a tmp cache file
+    Steps: 1) issue an opaque token 2) authenticate two clients 3) assert one authentication and the default expiry
+    """
+    issuer.ttl = None
+    first, second = _client(token_cache), _client(token_cache)
+
+    first._authenticate()
+    second._authenticate()
+
+    reporter.assert_that(issuer.calls).is_equal_to(1)
+    reporter.assert_that(first.token_expires_at - time.time()).is_close_to(
+        DEFAULT_TOKEN_TTL, 60
+    )
+
+
+def test_corrupt_cache_file_is_replaced(
+    issuer: TokenIssuer, token_cache: XrayTokenCache
+) -> None:
+    """
+    Test that an unreadable cache file leads to a fresh authentication instead of an error
+    Args: issuer – fixture counting authentications; token_cache – fixture with a tmp cache file
+    Steps: 1) write garbage to the cache file 2) authenticate 3) assert a token and a valid cache file
+    """
+    token_cache.path.write_text("{not json")
+
+    client = _client(token_cache)
+    client._authenticate()
+
+    reporter.assert_that(issuer.calls).is_equal_to(1)
+    reporter.assert_that(json.loads(token_cache.path.read_text())).is_length(1)
+
+
+def test_unauthorized_query_reauthenticates_once(
+    issuer: TokenIssuer, token_cache: XrayTokenCache
+) -> None:
+    """
+    Test that a 401 triggers exactly one re-authentication and one retry with the new token
+    Args: issuer – fixture counting authentications; token_cache – fixture with a tmp cache file
+    Steps: 1) answer the first query with 401 and the retry with data 2) run a query 3) assert two tokens and two posts
+    """
+    client = _client(token_cache)
+    session = FakeSession(
+        _response(401, {"error": "expired"}),
+        _response(200, {"data": {"getTest": {"issueId": "1"}}}),
+    )
+    client.session = session  # type: ignore[assignment]
+
+    result = client._execute_query("query GetTest { getTest { issueId } }")
+
+    reporter.assert_that(result).is_equal_to({"getTest": {"issueId": "1"}})
+    reporter.assert_that(issuer.calls).is_equal_to(2)
+    tokens = session.tokens
+    reporter.assert_that(tokens).is_length(2)
+    reporter.assert_that(tokens[1]).is_not_equal_to(tokens[0])
+
+
+def test_repeated_unauthorized_query_does_not_loop(
+    issuer: TokenIssuer, token_cache: XrayTokenCache
+) -> None:
+    """
+    Test that a query still rejected after re-authenticating fails instead of retrying again
+    Args: issuer – fixture counting authentications; token_cache – fixture with a tmp cache file
+    Steps: 1) answer every query with 401 2) run a query 3) assert it raises after one re-authentication
+    """
+    client = _client(token_cache)
+    session = FakeSession(
+        _response(401, {"error": "revoked"}), _response(401, {"error": "revoked"})
+    )
+    client.session = session  # type: ignore[assignment]
+
+    with pytest.raises(Exception, match="401"):
+        client._execute_query("query GetTest { getTest { issueId } }")
+
+    reporter.assert_that(issuer.calls).is_equal_to(2)
+    reporter.assert_that(session.tokens).is_length(2)